@@ -0,0 +1,104 @@
+"""
+모델 감사 CLI
+
+여러 입력 분포에서 로드된 모델을 수학 판정과 비교해 정확도, 혼동 행렬, 보정,
+is_consistent 비율, 가장 크게 틀린 예시를 분포별로 출력합니다.
+--min-accuracy를 지정하면 기준에 못 미치는 분포가 있을 때 종료 코드 2를 반환하므로
+새 model.h5 배포 전 검사 단계로 사용할 수 있습니다.
+
+사용 예:
+    python audit.py --framework numpy --samples 2000000
+    python audit.py --model /tmp/retrain/model.h5 --scaler /tmp/retrain/scaler.pkl --min-accuracy 0.97 --report audit.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from core import audit
+from core.parallel import ShardedEvaluator
+from core.triangle_validator_core import TriangleValidatorCore
+
+logger = logging.getLogger(__name__) # audit 모듈용 로거
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 검증 모델 감사 (수학 판정 대비)")
+    parser.add_argument("--framework", default="tensorflow", help="ML 프레임워크 (tensorflow, numpy)")
+    parser.add_argument("--model", help="모델 파일 경로 (기본값: notebooks/model.h5)")
+    parser.add_argument("--scaler", help="스케일러 파일 경로 (기본값: notebooks/scaler.pkl)")
+    parser.add_argument("--distributions", nargs="+", choices=list(audit.DISTRIBUTIONS),
+                        help="감사할 분포 (기본값: 전체)")
+    parser.add_argument("--samples", type=int, default=audit.DEFAULT_SAMPLES, help="분포별 샘플 수")
+    parser.add_argument("--chunk-size", type=int, default=audit.DEFAULT_CHUNK_SIZE, help="청크당 샘플 수")
+    parser.add_argument("--seed", type=int, default=audit.DEFAULT_SEED, help="난수 시드")
+    parser.add_argument("--worst-cases", type=int, default=audit.DEFAULT_WORST_CASES,
+                        help="분포별로 출력할 가장 크게 틀린 예시 수")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수 (0이면 현재 프로세스에서 처리)")
+    parser.add_argument("--min-accuracy", type=float, help="분포별 최소 정확도 (미달 시 종료 코드 2)")
+    parser.add_argument("--report", help="전체 결과를 저장할 JSON 경로")
+    parser.add_argument("--log-level", default="WARNING", help="로그 레벨")
+    return parser
+
+
+def format_summary(name, summary):
+    """분포 하나의 결과를 사람이 읽기 쉬운 여러 줄 문자열로 만듭니다."""
+    confusion = summary["confusion"]
+    accuracy = summary["accuracy"]
+    lines = [
+        f"[{name}] samples={summary['samples']} missing_ai={summary['missing_ai']} "
+        f"accuracy={'N/A' if accuracy is None else f'{accuracy:.4f}'} "
+        f"consistent_rate={summary['consistent_rate']:.4f} samples/sec={summary['samples_per_second']:.0f}",
+        f"  confusion: TP={confusion['true_positive']} FP={confusion['false_positive']} "
+        f"TN={confusion['true_negative']} FN={confusion['false_negative']}",
+    ]
+    if summary["brier_score"] is not None:
+        lines.append(f"  calibration: brier={summary['brier_score']:.4f} ece={summary['expected_calibration_error']:.4f}")
+    for case in summary["worst_cases"]:
+        sides = ", ".join(f"{side:.6g}" for side in case["sides"])
+        lines.append(f"  worst: ({sides}) ai={case['ai_prediction_value']:.4f} math={case['math_result']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+    if args.workers > 0:
+        validator = ShardedEvaluator(workers=args.workers, framework=args.framework,
+                                     model_path=args.model, scaler_path=args.scaler)
+    else:
+        validator = TriangleValidatorCore(model_path=args.model, scaler_path=args.scaler, framework=args.framework)
+    try:
+        report = audit.run_audit(validator.validate_batch, distributions=args.distributions, samples=args.samples,
+                                 chunk_size=args.chunk_size, seed=args.seed, worst_cases=args.worst_cases)
+    except Exception as e:
+        logger.exception(f"감사 실패: {e}")
+        return 1
+    finally:
+        if args.workers > 0:
+            validator.close()
+
+    for name, summary in report.items():
+        print(format_summary(name, summary))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.min_accuracy is not None:
+        failed = audit.failed_distributions(report, args.min_accuracy)
+        if failed:
+            print(f"FAILED: accuracy below {args.min_accuracy} for {', '.join(failed)}", file=sys.stderr)
+            return 2
+        print(f"PASSED: all distributions have accuracy >= {args.min_accuracy}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+성능 벤치마크
+
+CPU 전용 헤드리스 환경에서 다음을 측정해 JSON으로 저장하고,
+커밋된 기준선(baseline)과 비교해 임계값 이상 느려지면 실패(종료 코드 1)합니다.
+
+- 콜드 스타트: 임포트, TriangleValidatorCore.__init__, 첫 수학 검증까지의 시간,
+  모델/스케일러 로드 (새 프로세스에서 측정)
+- 단일 호출 지연 시간: validate_by_math, validate_by_ai, validate
+- 배치 크기별 validate_batch 처리량
+- 최대 메모리 (RSS)
+
+사용 예:
+    python -m benchmarks.run_benchmarks -o benchmark_results.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run_benchmarks --framework numpy --update-baseline
+    python -m benchmarks.run_benchmarks --latency-mode --compare
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_ROOT not in sys.path:
+    sys.path.insert(0, APP_ROOT)
+
+from core.metrics import peak_rss_mb
+
+DEFAULT_BASELINE_PATH = os.path.join(APP_ROOT, "benchmarks", "baseline.json")
+DEFAULT_BATCH_SIZES = (1, 16, 256, 4096, 65536)
+# 이 접미사로 끝나는 지표는 클수록 좋음. 나머지는 작을수록 좋음
+HIGHER_IS_BETTER_SUFFIXES = ("_per_sec",)
+# 단위별 잡음 하한: 절대 변화량이 이보다 작으면 상대 변화율과 관계없이 회귀로 보지 않음
+# (수 µs 단위 지표는 측정 잡음만으로도 수십 % 흔들림)
+NOISE_FLOORS = {"_ms": 0.05, "_seconds": 0.05, "_mb": 16.0}
+# 결과에는 기록하지만 회귀 판정에는 쓰지 않는 지표. 수백 개 표본의 p99는 GC, 스케줄링 한 번으로
+# 몇 배씩 흔들려 코드가 같아도 실패하므로 단일 호출 지연 시간은 p50/mean으로만 판정
+UNGATED_SUFFIXES = (".p99_ms",)
+
+# 새 인터프리터에서 실행하는 콜드 스타트 측정 코드
+COLD_START_SCRIPT = r"""
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from core.triangle_validator_core import TriangleValidatorCore
+imported = time.perf_counter()
+core = TriangleValidatorCore(framework=sys.argv[2], adapter_options=json.loads(sys.argv[3]), load_on_init=False)
+constructed = time.perf_counter()
+core.validate_by_math(3, 4, 5)
+first_math = time.perf_counter()
+core.load_models()
+models_loaded = time.perf_counter()
+core.validate(3, 4, 5)
+first_validate = time.perf_counter()
+from core.metrics import peak_rss_mb
+print(json.dumps({
+    "import_seconds": imported - started,
+    "core_init_seconds": constructed - imported,
+    "time_to_first_math_seconds": first_math - started,
+    "model_load_seconds": models_loaded - first_math,
+    "first_validate_seconds": first_validate - models_loaded,
+    "total_seconds": first_validate - started,
+    "model_loaded": core.model is not None,
+    "peak_rss_mb": peak_rss_mb(),
+}))
+"""
+
+
+def measure_cold_start(framework, adapter_options=None):
+    """새 프로세스에서 임포트부터 첫 validate까지의 시간을 측정합니다."""
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL="3")
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", COLD_START_SCRIPT, APP_ROOT, framework,
+         json.dumps(adapter_options or {})],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    wall_seconds = time.perf_counter() - started
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_wall_seconds"] = wall_seconds
+    return result
+
+
+def _percentiles(samples):
+    samples = np.asarray(samples, dtype=np.float64) * 1000.0
+    p50, p99 = np.percentile(samples, [50, 99])
+    return {"p50_ms": float(p50), "p99_ms": float(p99), "mean_ms": float(samples.mean())}
+
+
+def measure_latency(core, iterations, warmup=5):
+    """validate_by_math, validate_by_ai, validate의 단일 호출 지연 시간을 측정합니다."""
+    rng = np.random.default_rng(0)
+    inputs = rng.uniform(1.0, 99.0, size=(iterations + warmup, 3)).tolist()
+    results = {}
+    for name in ("validate_by_math", "validate_by_ai", "validate"):
+        method = getattr(core, name)
+        samples = []
+        for i, (a, b, c) in enumerate(inputs):
+            started = time.perf_counter()
+            method(a, b, c)
+            if i >= warmup:
+                samples.append(time.perf_counter() - started)
+        results[name] = _percentiles(samples)
+    return results
+
+
+def measure_throughput(core, batch_sizes, min_seconds):
+    """배치 크기별 validate_batch 처리량(rows/sec)을 측정합니다."""
+    rng = np.random.default_rng(1)
+    results = {}
+    for batch_size in batch_sizes:
+        batch = rng.uniform(1.0, 99.0, size=(batch_size, 3))
+        core.validate_batch(batch) # 워밍업
+        rows = 0
+        started = time.perf_counter()
+        while True:
+            core.validate_batch(batch)
+            rows += batch_size
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_seconds:
+                break
+        results[f"batch_{batch_size}"] = {"rows_per_sec": rows / elapsed}
+    return results
+
+
+def baseline_key(framework, adapter_options=None):
+    """기준선 파일 안에서 결과를 구분하는 키 (예: "tensorflow", "tensorflow-latency_mode")."""
+    enabled = sorted(name for name, value in (adapter_options or {}).items() if value)
+    return "-".join([framework] + enabled)
+
+
+def run_benchmarks(framework="tensorflow", iterations=200, batch_sizes=DEFAULT_BATCH_SIZES, min_seconds=0.5,
+                   adapter_options=None):
+    """전체 벤치마크를 실행하고 결과 dict를 반환합니다."""
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+    from core.triangle_validator_core import TriangleValidatorCore
+
+    cold_start = measure_cold_start(framework, adapter_options)
+    core = TriangleValidatorCore(framework=framework, adapter_options=adapter_options)
+    if core.model is None or core.scaler is None:
+        raise RuntimeError("AI 모델 또는 스케일러를 로드할 수 없어 벤치마크를 실행할 수 없습니다.")
+
+    return {
+        "meta": {
+            "framework": framework,
+            "adapter_options": adapter_options or {},
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "metrics": {
+            "cold_start": cold_start,
+            "latency": measure_latency(core, iterations),
+            "throughput": measure_throughput(core, batch_sizes, min_seconds),
+            "memory": {"peak_rss_mb": peak_rss_mb()},
+        },
+    }
+
+
+def flatten(metrics, prefix=""):
+    """중첩 dict를 "cold_start.import_seconds" 같은 점 표기 키의 숫자 dict로 펼칩니다."""
+    flat = {}
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(results, baseline, threshold):
+    """
+    기준선 대비 회귀를 찾습니다. UNGATED_SUFFIXES로 끝나는 지표(p99)는 비교하지 않습니다.
+
+    Returns:
+        list: (지표 이름, 기준값, 현재값, 변화율) 튜플의 회귀 목록
+    """
+    current = flatten(results["metrics"])
+    reference = flatten(baseline["metrics"])
+    regressions = []
+    for name, base_value in sorted(reference.items()):
+        if name not in current or base_value <= 0 or name.endswith(UNGATED_SUFFIXES):
+            continue
+        value = current[name]
+        noise_floor = next((floor for suffix, floor in NOISE_FLOORS.items() if name.endswith(suffix)), 0.0)
+        if abs(value - base_value) < noise_floor:
+            continue
+        if name.endswith(HIGHER_IS_BETTER_SUFFIXES):
+            change = (base_value - value) / base_value
+        else:
+            change = (value - base_value) / base_value
+        if change > threshold:
+            regressions.append((name, base_value, value, change))
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 검증기 성능 벤치마크")
+    parser.add_argument("-o", "--output", default="benchmark_results.json", help="결과 JSON 경로")
+    parser.add_argument("--framework", default="tensorflow", help="ML 프레임워크 (tensorflow, numpy)")
+    parser.add_argument("--latency-mode", action="store_true",
+                        help="TensorFlow 어댑터의 지연 시간 최적화 모드 사용 (GUI 설정과 동일)")
+    parser.add_argument("--iterations", type=int, default=200, help="지연 시간 측정 반복 횟수")
+    parser.add_argument("--batch-sizes", type=lambda v: [int(x) for x in v.split(",")],
+                        default=list(DEFAULT_BATCH_SIZES), help="쉼표로 구분한 배치 크기 목록")
+    parser.add_argument("--min-seconds", type=float, default=0.5, help="배치 크기별 최소 측정 시간")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE_PATH,
+                        help="비교할 기준선 JSON (값 생략 시 benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="회귀로 판단하는 상대 변화율 (기본값: 0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="결과로 기준선 파일을 갱신")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    adapter_options = {"latency_mode": True} if args.latency_mode else {}
+    key = baseline_key(args.framework, adapter_options)
+    results = run_benchmarks(args.framework, args.iterations, args.batch_sizes, args.min_seconds, adapter_options)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"벤치마크 결과 저장: {args.output}")
+    for name, value in sorted(flatten(results["metrics"]).items()):
+        print(f"  {name}: {value:.6g}")
+
+    if args.update_baseline:
+        baselines = {}
+        if os.path.exists(DEFAULT_BASELINE_PATH):
+            with open(DEFAULT_BASELINE_PATH, "r", encoding="utf-8") as f:
+                baselines = json.load(f)
+        baselines[key] = results
+        with open(DEFAULT_BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2)
+        print(f"기준선 갱신: {DEFAULT_BASELINE_PATH} ({key})")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baselines = json.load(f)
+        baseline = baselines.get(key)
+        if baseline is None:
+            print(f"기준선에 '{key}' 결과가 없습니다: {args.compare}")
+            return 1
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"성능 회귀 감지 (임계값 {args.threshold:.0%}):")
+            for name, base_value, value, change in regressions:
+                print(f"  {name}: {base_value:.6g} -> {value:.6g} ({change:+.1%})")
+            return 1
+        print(f"기준선 대비 회귀 없음 (임계값 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
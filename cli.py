@@ -0,0 +1,111 @@
+"""
+헤드리스 대량 검증 CLI
+
+PySide6 없이 TriangleValidatorCore로 CSV, JSONL, .npy 파일의 삼각형을
+고정 크기 청크 단위로 검증하고 결과를 stdout 또는 파일로 스트리밍합니다.
+
+사용 예:
+    python cli.py triangles.npy -o results.csv
+    python cli.py triangles.csv --framework numpy --chunk-size 100000 > results.csv
+    python cli.py triangles.npy --workers 8 --intra-op-threads 1 -o results.csv
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from core.bulk_io import DEFAULT_CHUNK_SIZE, INPUT_FORMATS, OUTPUT_FORMATS, ResultWriter, iter_chunks
+from core.metrics import peak_rss_mb
+from core.parallel import ShardedEvaluator
+from core.triangle_validator_core import TriangleValidatorCore
+
+logger = logging.getLogger(__name__) # cli 모듈용 로거
+
+
+def setup_logging(level="INFO"):
+    """결과가 stdout으로 나가므로 로그는 stderr로 보냅니다."""
+    logging.basicConfig(
+        level=getattr(logging, level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 대량 검증 (헤드리스)")
+    parser.add_argument("input", help="입력 파일 (CSV, JSONL, float32/float64 .npy)")
+    parser.add_argument("-o", "--output", default="-", help="결과 파일 경로 (기본값: stdout)")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv", help="출력 형식")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    parser.add_argument("--framework", default="tensorflow", help="ML 프레임워크 (tensorflow, numpy, compact)")
+    parser.add_argument("--model", help="모델 파일 경로 (기본값: notebooks/model.h5)")
+    parser.add_argument("--scaler", help="스케일러 파일 경로 (기본값: notebooks/scaler.pkl)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="워커 프로세스 수 (0이면 현재 프로세스에서 처리)")
+    parser.add_argument("--intra-op-threads", type=int, help="워커당 연산 스레드 수 (기본값: 코어 수 / 워커 수)")
+    parser.add_argument("--inter-op-threads", type=int, default=1, help="워커당 TensorFlow inter-op 스레드 수")
+    parser.add_argument("--log-level", default="WARNING", help="로그 레벨")
+    return parser
+
+
+def run(args, stream):
+    """입력을 청크 단위로 검증해 stream에 기록하고 처리 통계를 반환합니다."""
+    started = time.perf_counter()
+    if args.workers > 0:
+        validator = ShardedEvaluator(workers=args.workers, framework=args.framework,
+                                     model_path=args.model, scaler_path=args.scaler,
+                                     intra_op_threads=args.intra_op_threads,
+                                     inter_op_threads=args.inter_op_threads)
+    else:
+        validator = TriangleValidatorCore(model_path=args.model, scaler_path=args.scaler, framework=args.framework)
+    load_seconds = time.perf_counter() - started
+
+    writer = ResultWriter(stream, args.output_format)
+    processing_started = time.perf_counter()
+    try:
+        for chunk in iter_chunks(args.input, args.chunk_size, args.input_format):
+            writer.write(validator.validate_batch(chunk))
+    finally:
+        if args.workers > 0:
+            validator.close()
+    processing_seconds = time.perf_counter() - processing_started
+
+    return {
+        "rows": writer.rows_written,
+        "load_seconds": load_seconds,
+        "processing_seconds": processing_seconds,
+        "rows_per_second": writer.rows_written / processing_seconds if processing_seconds > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logging(args.log_level)
+
+    try:
+        if args.output == "-":
+            stats = run(args, sys.stdout)
+            sys.stdout.flush()
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                stats = run(args, f)
+    except Exception as e:
+        logger.exception(f"대량 검증 실패: {e}")
+        return 1
+
+    peak = f"{stats['peak_rss_mb']:.1f} MB" if stats["peak_rss_mb"] is not None else "N/A"
+    print(
+        f"rows={stats['rows']} load={stats['load_seconds']:.2f}s "
+        f"processing={stats['processing_seconds']:.2f}s "
+        f"rows/sec={stats['rows_per_second']:.0f} peak_rss={peak}",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+모델 정확도/일관성 감사 (audit)
+
+여러 입력 분포에서 대량의 삼각형을 청크 단위로 생성해 validate_batch로 검증하고,
+AI 판정을 수학 판정(정답)과 비교한 통계를 분포별로 모읍니다.
+
+- 정확도, 혼동 행렬 (정답 = 수학 판정, 예측 = AI 판정)
+- is_consistent 비율과 AI 결과가 없는 행 수
+- 보정(calibration): 예측값 구간별 평균 예측값과 실제 삼각형 비율, ECE, Brier 점수
+- 가장 크게 틀린 예시 (|예측값 - 정답|이 큰 순)
+
+새 model.h5를 배포하기 전에 분포별 최소 정확도를 기준으로 통과 여부를 판단하는 데 사용합니다.
+"""
+
+import logging
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLES = 1_000_000 # 분포별 샘플 수
+DEFAULT_CHUNK_SIZE = 65536
+DEFAULT_SEED = 0
+DEFAULT_WORST_CASES = 10
+CALIBRATION_BINS = 10
+
+
+def _permute_rows(rng, sides):
+    """각 행의 세 변 순서를 무작위로 섞음 (어느 변이 가장 긴지에 모델이 의존하지 않는지 확인)"""
+    return rng.permuted(sides, axis=1)
+
+
+def uniform(rng, size, low=1.0, high=100.0):
+    """[low, high] 균등 분포"""
+    return rng.uniform(low, high, size=(size, 3))
+
+
+def near_degenerate(rng, size, low=1.0, high=100.0, relative_margin=0.01):
+    """a + b ≈ c: 두 변의 합이 가장 긴 변의 ±relative_margin 안에 있는 삼각형"""
+    longest = rng.uniform(2 * low, high, size)
+    total = longest * (1 + rng.uniform(-relative_margin, relative_margin, size))
+    a = low + rng.uniform(0.0, 1.0, size) * (total - 2 * low)
+    return _permute_rows(rng, np.column_stack([a, total - a, longest]))
+
+
+def extreme_aspect(rng, size, low=1.0, high=100.0, min_ratio=1e-4, max_ratio=1e-1):
+    """
+    한 변이 다른 두 변보다 매우 짧은 (가늘고 긴) 삼각형
+
+    짧은 변 a = b × ratio (ratio는 로그 균등), c = b + δ (|δ| ≤ 1.5a)로 만들어
+    절반 정도가 삼각형 경계(|b - c| < a) 안쪽에 들어갑니다.
+    """
+    b = rng.uniform(low, high, size)
+    a = b * np.exp(rng.uniform(np.log(min_ratio), np.log(max_ratio), size))
+    c = b + rng.uniform(-1.5, 1.5, size) * a
+    return _permute_rows(rng, np.column_stack([a, b, c]))
+
+
+def large_magnitude(rng, size, min_exponent=3.0, max_exponent=6.0):
+    """모양은 [1, 100] 균등 분포와 같고 크기만 10^3 ~ 10^6배인 삼각형"""
+    scale = 10.0 ** rng.uniform(min_exponent, max_exponent, (size, 1))
+    return uniform(rng, size) / 100.0 * scale
+
+
+def small_magnitude(rng, size, min_exponent=-6.0, max_exponent=-3.0):
+    """모양은 [1, 100] 균등 분포와 같고 크기만 10^-6 ~ 10^-3배인 삼각형"""
+    return large_magnitude(rng, size, min_exponent, max_exponent)
+
+
+def integer_grid(rng, size, low=1, high=100):
+    """[low, high] 정수 격자 (a + b = c인 퇴화 삼각형이 자주 나옴)"""
+    return rng.integers(low, high + 1, size=(size, 3)).astype(np.float64)
+
+
+# 이름 -> 생성 함수 fn(rng, size) -> (size, 3) float64
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "near_degenerate": near_degenerate,
+    "extreme_aspect": extreme_aspect,
+    "large_magnitude": large_magnitude,
+    "small_magnitude": small_magnitude,
+    "integer_grid": integer_grid,
+}
+
+
+class DistributionStats:
+    """한 분포의 누적 통계 (청크마다 update)"""
+
+    def __init__(self, name, worst_cases=DEFAULT_WORST_CASES):
+        self.name = name
+        self.worst_cases = worst_cases
+        self.samples = 0
+        self.missing_ai = 0
+        self.consistent = 0
+        # confusion[정답, 예측]: 0 = 불가능, 1 = 가능
+        self.confusion = np.zeros((2, 2), dtype=np.int64)
+        self.bin_count = np.zeros(CALIBRATION_BINS, dtype=np.int64)
+        self.bin_prediction_sum = np.zeros(CALIBRATION_BINS, dtype=np.float64)
+        self.bin_positive = np.zeros(CALIBRATION_BINS, dtype=np.int64)
+        self.squared_error_sum = 0.0
+        self.seconds = 0.0
+        # (오차, 세 변, 예측값, 정답) 후보: 청크마다 상위 worst_cases개만 유지
+        self._worst_error = np.empty(0)
+        self._worst_sides = np.empty((0, 3))
+        self._worst_prediction = np.empty(0)
+        self._worst_label = np.empty(0, dtype=bool)
+
+    def update(self, result):
+        """validate_batch 결과(BatchResult) 한 청크를 누적합니다."""
+        sides = result["sides"]
+        label = result["math_result"]
+        self.samples += len(label)
+        if not result.has_ai:
+            self.missing_ai += len(label)
+            return
+        prediction = result["ai_prediction_value"]
+        has_ai = ~np.isnan(prediction)
+        self.missing_ai += int(np.count_nonzero(~has_ai))
+        if not has_ai.all():
+            sides, label, prediction = sides[has_ai], label[has_ai], prediction[has_ai]
+        predicted = prediction > 0.5
+
+        self.consistent += int(np.count_nonzero(result["is_consistent"]))
+        # 정답/예측 조합(0~3)별 개수를 한 번에 셈
+        self.confusion += np.bincount(label.astype(np.int64) * 2 + predicted, minlength=4).reshape(2, 2)
+
+        bins = np.minimum((prediction * CALIBRATION_BINS).astype(np.int64), CALIBRATION_BINS - 1)
+        self.bin_count += np.bincount(bins, minlength=CALIBRATION_BINS)
+        self.bin_prediction_sum += np.bincount(bins, weights=prediction, minlength=CALIBRATION_BINS)
+        self.bin_positive += np.bincount(bins, weights=label, minlength=CALIBRATION_BINS).astype(np.int64)
+        error = np.abs(prediction - label)
+        self.squared_error_sum += float(np.dot(error, error))
+
+        if self.worst_cases > 0:
+            k = min(self.worst_cases, len(error))
+            top = np.argpartition(error, -k)[-k:]
+            self._merge_worst(error[top], sides[top], prediction[top], label[top])
+
+    def _merge_worst(self, error, sides, prediction, label):
+        error = np.concatenate([self._worst_error, error])
+        order = np.argsort(-error, kind="stable")[:self.worst_cases]
+        self._worst_error = error[order]
+        self._worst_sides = np.concatenate([self._worst_sides, sides])[order]
+        self._worst_prediction = np.concatenate([self._worst_prediction, prediction])[order]
+        self._worst_label = np.concatenate([self._worst_label, label])[order]
+
+    @property
+    def scored(self):
+        """AI 결과가 있는 샘플 수"""
+        return int(self.confusion.sum())
+
+    @property
+    def accuracy(self):
+        scored = self.scored
+        return float(np.trace(self.confusion)) / scored if scored else None
+
+    def summary(self):
+        """분포별 결과를 JSON으로 저장할 수 있는 dict로 반환합니다."""
+        scored = self.scored
+        calibration = []
+        expected_calibration_error = 0.0
+        for index in range(CALIBRATION_BINS):
+            count = int(self.bin_count[index])
+            if count == 0:
+                continue
+            mean_prediction = self.bin_prediction_sum[index] / count
+            positive_rate = self.bin_positive[index] / count
+            expected_calibration_error += count / scored * abs(mean_prediction - positive_rate)
+            calibration.append({
+                "bin": [index / CALIBRATION_BINS, (index + 1) / CALIBRATION_BINS],
+                "count": count,
+                "mean_prediction": float(mean_prediction),
+                "positive_rate": float(positive_rate),
+            })
+        (true_negative, false_positive), (false_negative, true_positive) = self.confusion.tolist()
+        return {
+            "samples": self.samples,
+            "missing_ai": self.missing_ai,
+            "accuracy": self.accuracy,
+            # is_consistent는 AI 결과가 없는 행에서 False이므로 전체 샘플 기준 비율
+            "consistent_rate": self.consistent / self.samples if self.samples else None,
+            "confusion": {
+                "true_positive": true_positive,
+                "false_positive": false_positive,
+                "true_negative": true_negative,
+                "false_negative": false_negative,
+            },
+            "brier_score": self.squared_error_sum / scored if scored else None,
+            "expected_calibration_error": expected_calibration_error if scored else None,
+            "calibration": calibration,
+            "worst_cases": [
+                {"sides": sides.tolist(), "ai_prediction_value": float(prediction), "math_result": bool(label)}
+                for sides, prediction, label in zip(self._worst_sides, self._worst_prediction, self._worst_label)
+            ],
+            "seconds": self.seconds,
+            "samples_per_second": self.samples / self.seconds if self.seconds > 0 else 0.0,
+        }
+
+
+def run_audit(validate_batch, distributions=None, samples=DEFAULT_SAMPLES, chunk_size=DEFAULT_CHUNK_SIZE,
+              seed=DEFAULT_SEED, worst_cases=DEFAULT_WORST_CASES):
+    """
+    분포별로 샘플을 청크 단위로 생성·검증하고 통계를 반환합니다.
+
+    Args:
+        validate_batch (callable): TriangleValidatorCore.validate_batch 또는 ShardedEvaluator.validate_batch
+        distributions (list, optional): DISTRIBUTIONS의 이름 목록 (기본값: 전체)
+        samples (int): 분포별 샘플 수
+        chunk_size (int): 한 번에 생성·검증하는 샘플 수
+        seed (int): 난수 시드 (분포와 청크마다 독립적인 생성기를 만듦)
+        worst_cases (int): 분포별로 보관할 가장 크게 틀린 예시 수
+
+    Returns:
+        dict: 분포 이름 -> DistributionStats.summary()
+    """
+    names = list(distributions or DISTRIBUTIONS)
+    unknown = [name for name in names if name not in DISTRIBUTIONS]
+    if unknown:
+        raise ValueError(f"알 수 없는 분포입니다: {', '.join(unknown)} (사용 가능: {', '.join(DISTRIBUTIONS)})")
+
+    report = {}
+    for name in names:
+        generate = DISTRIBUTIONS[name]
+        # 선택한 분포 조합과 관계없이 같은 분포는 같은 샘플을 만들도록 등록 순서로 시드를 나눔
+        distribution_index = list(DISTRIBUTIONS).index(name)
+        stats = DistributionStats(name, worst_cases)
+        started = time.perf_counter()
+        for chunk_index, start in enumerate(range(0, samples, chunk_size)):
+            rng = np.random.default_rng([seed, distribution_index, chunk_index])
+            stats.update(validate_batch(generate(rng, min(chunk_size, samples - start))))
+        stats.seconds = time.perf_counter() - started
+        report[name] = stats.summary()
+        accuracy = report[name]["accuracy"]
+        logger.info(f"감사 완료: {name} {stats.samples:,}건, 정확도={'N/A' if accuracy is None else f'{accuracy:.4f}'}, "
+                    f"{report[name]['samples_per_second']:,.0f} samples/s")
+    return report
+
+
+def failed_distributions(report, min_accuracy):
+    """정확도가 min_accuracy보다 낮거나 AI 결과가 없는 분포 이름 목록"""
+    return [name for name, summary in report.items()
+            if summary["accuracy"] is None or summary["accuracy"] < min_accuracy]
@@ -0,0 +1,182 @@
+"""
+대량 검증용 입출력
+
+CSV, JSONL, .npy 파일에서 세 변을 고정 크기 청크 단위로 읽고
+검증 결과를 청크 단위로 기록합니다. 파일 전체를 메모리에 올리지 않으므로
+행 수와 관계없이 일정한 메모리로 처리할 수 있습니다.
+"""
+
+import itertools
+import json
+import os
+
+import numpy as np
+
+INPUT_FORMATS = ("csv", "jsonl", "npy")
+OUTPUT_FORMATS = ("csv", "jsonl")
+DEFAULT_CHUNK_SIZE = 65536
+
+RESULT_COLUMNS = ("a", "b", "c", "math_result", "ai_prediction_value", "is_valid_by_ai", "is_consistent")
+
+
+def detect_format(path, default="csv"):
+    """파일 확장자로 입력 형식을 추정합니다."""
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext in ("json", "ndjson"):
+        return "jsonl"
+    return ext if ext in INPUT_FORMATS else default
+
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, input_format=None):
+    """
+    입력 파일에서 (N, 3) float64 배열을 최대 chunk_size 행씩 생성합니다.
+
+    Args:
+        path (str): 입력 파일 경로
+        chunk_size (int): 청크당 최대 행 수
+        input_format (str, optional): "csv", "jsonl", "npy". 생략하면 확장자로 판단
+
+    Yields:
+        numpy.ndarray: (N, 3) 형태의 세 변 배열
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size는 0보다 커야 합니다: {chunk_size}")
+    input_format = input_format or detect_format(path)
+    if input_format == "npy":
+        yield from _iter_npy_chunks(path, chunk_size)
+    elif input_format == "csv":
+        yield from _iter_csv_chunks(path, chunk_size)
+    elif input_format == "jsonl":
+        yield from _iter_jsonl_chunks(path, chunk_size)
+    else:
+        raise ValueError(f"지원되지 않는 입력 형식: {input_format}")
+
+
+def count_rows(path, input_format=None):
+    """입력 파일의 행 수를 반환합니다 (.npy는 헤더만 읽음)."""
+    input_format = input_format or detect_format(path)
+    if input_format == "npy":
+        return int(open_npy(path).shape[0])
+    return sum(chunk.shape[0] for chunk in iter_chunks(path, input_format=input_format))
+
+
+def open_npy(path):
+    """(N, 3) float32/float64 .npy 파일을 메모리 매핑으로 엽니다."""
+    data = np.load(path, mmap_mode="r")
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError(f".npy 입력은 (N, 3) 형태여야 합니다: {data.shape}")
+    if data.dtype not in (np.float32, np.float64):
+        raise ValueError(f".npy 입력은 float32 또는 float64여야 합니다: {data.dtype}")
+    return data
+
+
+def _iter_npy_chunks(path, chunk_size):
+    data = open_npy(path)
+    for start in range(0, data.shape[0], chunk_size):
+        # 메모리 매핑된 구간만 복사하므로 한 번에 청크 하나만 메모리에 올라감
+        yield np.asarray(data[start:start + chunk_size], dtype=np.float64)
+
+
+def _is_header(line):
+    try:
+        [float(v) for v in line.split(",")]
+        return False
+    except ValueError:
+        return True
+
+
+def _iter_csv_chunks(path, chunk_size):
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip())
+        first = next(lines, None)
+        if first is None:
+            return
+        if not _is_header(first):
+            lines = itertools.chain([first], lines)
+        while True:
+            block = list(itertools.islice(lines, chunk_size))
+            if not block:
+                return
+            chunk = np.loadtxt(block, delimiter=",", dtype=np.float64, ndmin=2)
+            if chunk.shape[1] != 3:
+                raise ValueError(f"CSV 입력은 세 개의 열이어야 합니다: {chunk.shape[1]}")
+            yield chunk
+
+
+def _parse_json_row(line):
+    row = json.loads(line)
+    if isinstance(row, dict):
+        if "sides" in row:
+            row = row["sides"]
+        else:
+            row = (row["a"], row["b"], row["c"])
+    if len(row) != 3:
+        raise ValueError(f"JSONL 입력 행은 세 변이어야 합니다: {line.strip()}")
+    return row
+
+
+def _iter_jsonl_chunks(path, chunk_size):
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip())
+        while True:
+            block = [_parse_json_row(line) for line in itertools.islice(lines, chunk_size)]
+            if not block:
+                return
+            yield np.array(block, dtype=np.float64).reshape(-1, 3)
+
+
+class ResultWriter:
+    """validate_batch 결과를 CSV 또는 JSONL로 청크 단위 기록합니다."""
+
+    def __init__(self, stream, output_format="csv"):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"지원되지 않는 출력 형식: {output_format}")
+        self.stream = stream
+        self.output_format = output_format
+        self.rows_written = 0
+        if output_format == "csv":
+            self.stream.write(",".join(RESULT_COLUMNS) + "\n")
+
+    def write(self, results):
+        """validate_batch의 반환값 하나(청크)를 기록합니다."""
+        if self.output_format == "csv":
+            self._write_csv(results)
+        else:
+            self._write_jsonl(results)
+        self.rows_written += len(results["math_result"])
+
+    def _write_csv(self, results):
+        sides = results["sides"]
+        n = sides.shape[0]
+        if n == 0:
+            return
+        columns = [sides[:, 0], sides[:, 1], sides[:, 2], results["math_result"].astype(np.int8)]
+        fmt = ["%.17g", "%.17g", "%.17g", "%d"]
+        if results["ai_prediction_value"] is not None:
+            columns += [results["ai_prediction_value"], results["is_valid_by_ai"].astype(np.int8),
+                        results["is_consistent"].astype(np.int8)]
+            fmt += ["%.8f", "%d", "%d"]
+            np.savetxt(self.stream, np.column_stack(columns), fmt=fmt, delimiter=",")
+        else:
+            # AI 결과가 없으면 해당 열은 비워 둠
+            np.savetxt(self.stream, np.column_stack(columns), fmt=fmt, delimiter=",", newline=",,,\n")
+
+    def _write_jsonl(self, results):
+        sides = results["sides"].tolist()
+        math_result = results["math_result"].tolist()
+        has_ai = results["ai_prediction_value"] is not None
+        if has_ai:
+            ai_values = results["ai_prediction_value"].tolist()
+            ai_valid = results["is_valid_by_ai"].tolist()
+            consistent = results["is_consistent"].tolist()
+        lines = []
+        for i, row in enumerate(sides):
+            lines.append(json.dumps({
+                "sides": row,
+                "math_result": math_result[i],
+                "ai_prediction_value": ai_values[i] if has_ai else None,
+                "is_valid_by_ai": ai_valid[i] if has_ai else None,
+                "is_consistent": consistent[i] if has_ai else None,
+            }))
+        if lines:
+            self.stream.write("\n".join(lines) + "\n")
@@ -0,0 +1,236 @@
+"""
+신뢰도 기반 2단계 예측 (cascade)
+
+1단계는 세 변에서 만든 특성(feature)에 대한 로지스틱 회귀로, 로드 시 실제 모델의 출력을
+흉내 내도록 증류(distillation)해 둡니다. 예측 시 1단계 점수가 0.5 ± band 밖이면 그 값으로
+바로 응답하고, 안쪽(불확실 구간)이거나 증류 범위를 벗어난 입력이면 None을 돌려주어
+호출하는 쪽이 실제 모델로 계산하도록 합니다. PredictionLUT와 같은 lookup / lookup_batch
+규약을 따르므로 TriangleValidatorCore의 빠른 경로 자리에 그대로 들어갑니다.
+
+특성 (s0 <= s1 <= s2는 정렬된 세 변, p는 둘레):
+    (s0 + s1 - s2) / p   삼각 부등식 여유 (0이 경계)
+    s0 / s2, s1 / s2     모양 (가장 긴 변 대비 비율)
+"""
+
+import logging
+import math
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 증류에 사용하는 입력 범위 (학습 데이터 및 MinMaxScaler 범위)
+DEFAULT_LOW = 1.0
+DEFAULT_HIGH = 99.0
+# 1단계 점수가 0.5 ± 이 값 안에 있으면 실제 모델로 계산
+DEFAULT_BAND = 0.45
+DEFAULT_SAMPLES = 100_000 # 증류용 입력 수
+DEFAULT_HOLDOUT = 20_000 # 일치율 측정용 입력 수
+FIT_CHUNK_SIZE = 65536
+FIT_ITERATIONS = 30
+L2_PENALTY = 1e-6
+
+
+def features(sides):
+    """(N, 3) 세 변을 (N, 4) 특성 [여유, s0/s2, s1/s2, 1]로 변환합니다."""
+    ordered = np.sort(np.asarray(sides, dtype=np.float64), axis=1)
+    s0, s1, s2 = ordered[:, 0], ordered[:, 1], ordered[:, 2]
+    perimeter = s0 + s1 + s2
+    return np.column_stack([(s0 + s1 - s2) / perimeter, s0 / s2, s1 / s2, np.ones(len(ordered))])
+
+
+def fit_logistic(x, targets, iterations=FIT_ITERATIONS, l2_penalty=L2_PENALTY):
+    """
+    0~1 사이의 연속 목표값(실제 모델 출력)에 대한 로지스틱 회귀를 뉴턴 방법으로 학습합니다.
+
+    Returns:
+        numpy.ndarray: (특성 수,) 가중치
+    """
+    weights = np.zeros(x.shape[1])
+    identity = np.eye(x.shape[1])
+    for _ in range(iterations):
+        scores = 1.0 / (1.0 + np.exp(-np.clip(x @ weights, -50.0, 50.0)))
+        gradient = x.T @ (scores - targets) / len(x) + l2_penalty * weights
+        hessian = (x * (scores * (1.0 - scores))[:, None]).T @ x / len(x) + l2_penalty * identity
+        step = np.linalg.solve(hessian, gradient)
+        weights -= step
+        if np.abs(step).max() < 1e-8:
+            break
+    return weights
+
+
+class CascadeFirstStage:
+    """
+    증류된 로지스틱 회귀 1단계
+
+    lookup/lookup_batch 호출마다 1단계로 응답한 수와 실제 모델로 넘긴 수를 셉니다 (stats()).
+    """
+
+    def __init__(self, weights, low=DEFAULT_LOW, high=DEFAULT_HIGH, band=DEFAULT_BAND, fingerprint=None):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        if self.weights.shape != (4,):
+            raise ValueError(f"weights는 길이 4여야 합니다: {self.weights.shape}")
+        if not 0.0 <= band < 0.5:
+            raise ValueError(f"band는 0 이상 0.5 미만이어야 합니다: {band}")
+        self.low = float(low)
+        self.high = float(high)
+        self.band = float(band)
+        self.fingerprint = fingerprint
+        self.report = None # fit 또는 measure_agreement 결과
+        # 점수 대신 로짓(logit)으로 비교해 단일 조회에서 exp를 한 번만 계산
+        self._logit_threshold = math.log((0.5 + self.band) / (0.5 - self.band))
+        self._w = tuple(float(w) for w in self.weights)
+        self._lock = threading.Lock()
+        self._first_stage = 0
+        self._escalated = 0
+
+    @classmethod
+    def fit(cls, predict_batch, low=DEFAULT_LOW, high=DEFAULT_HIGH, band=DEFAULT_BAND, samples=DEFAULT_SAMPLES,
+            holdout=DEFAULT_HOLDOUT, seed=0, fingerprint=None):
+        """
+        [low, high] 범위의 무작위 입력에서 실제 모델 출력을 목표값으로 1단계를 학습합니다.
+
+        Args:
+            predict_batch (callable): (N, 3) 배열을 받아 (N,) 예측값을 반환하는 실제 모델 함수
+            low, high (float): 증류 범위 (범위 밖 입력은 항상 실제 모델로 계산)
+            band (float): 불확실 구간 반폭
+            samples (int): 증류용 입력 수
+            holdout (int): 학습 후 일치율 측정용 입력 수
+            seed (int): 난수 시드
+            fingerprint (str, optional): 증류한 모델의 지문
+
+        Returns:
+            CascadeFirstStage: report에 학습 시간과 실제 모델 대비 일치율이 기록된 1단계
+        """
+        started = time.perf_counter()
+        rng = np.random.default_rng(seed)
+        inputs = rng.uniform(low, high, size=(samples, 3))
+        targets = np.empty(samples, dtype=np.float64)
+        for start in range(0, samples, FIT_CHUNK_SIZE):
+            targets[start:start + FIT_CHUNK_SIZE] = predict_batch(inputs[start:start + FIT_CHUNK_SIZE])
+        stage = cls(fit_logistic(features(inputs), targets), low, high, band, fingerprint)
+        fit_seconds = time.perf_counter() - started
+        stage.measure_agreement(predict_batch, holdout, seed + 1)
+        stage.report["fit_seconds"] = fit_seconds
+        stage.report["fit_samples"] = int(samples)
+        # 측정용 조회는 운영 통계에 포함하지 않음
+        stage.reset_stats()
+        return stage
+
+    @classmethod
+    def load(cls, path, fingerprint=None, band=None):
+        """
+        save로 저장한 1단계를 읽습니다. band를 지정하면 저장된 값 대신 사용합니다.
+
+        Returns:
+            CascadeFirstStage: 1단계. 파일이 없거나 fingerprint가 다르면 None
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                stored = str(data["fingerprint"])
+                if fingerprint is not None and stored != fingerprint:
+                    logger.info(f"1단계 파일의 모델 지문이 달라 다시 학습합니다: {path}")
+                    return None
+                return cls(data["weights"], float(data["low"]), float(data["high"]),
+                           float(data["band"]) if band is None else band, stored)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"1단계 파일을 읽지 못했습니다 ({path}): {e}")
+            return None
+
+    def save(self, path):
+        """가중치를 .npz 파일로 저장합니다."""
+        np.savez(path, weights=self.weights, low=self.low, high=self.high, band=self.band,
+                 fingerprint=self.fingerprint or "")
+
+    def scores(self, sides):
+        """(N, 3) 입력의 1단계 점수 (불확실 구간과 범위 검사 없이)"""
+        return 1.0 / (1.0 + np.exp(-np.clip(features(sides) @ self.weights, -50.0, 50.0)))
+
+    def lookup(self, a, b, c):
+        """
+        단일 입력의 1단계 점수를 반환합니다.
+
+        Returns:
+            float: 1단계 점수. 증류 범위 밖이거나 불확실 구간이면 None (실제 모델로 계산)
+        """
+        low, high = self.low, self.high
+        if not (low <= a <= high and low <= b <= high and low <= c <= high):
+            self._count(0, 1)
+            return None
+        s2 = max(a, b, c)
+        s0 = min(a, b, c)
+        s1 = a + b + c - s0 - s2
+        w = self._w
+        logit = w[0] * (s0 + s1 - s2) / (a + b + c) + w[1] * s0 / s2 + w[2] * s1 / s2 + w[3]
+        if abs(logit) < self._logit_threshold:
+            self._count(0, 1)
+            return None
+        self._count(1, 0)
+        return 1.0 / (1.0 + math.exp(-max(-50.0, min(50.0, logit))))
+
+    def lookup_batch(self, sides):
+        """
+        N×3 입력의 1단계 점수를 한 번에 계산합니다.
+
+        Returns:
+            tuple: (values, covered). covered가 False인 행은 실제 모델로 계산해야 하는 행입니다 (values는 NaN).
+        """
+        sides = np.asarray(sides, dtype=np.float64).reshape(-1, 3)
+        in_range = np.all((sides >= self.low) & (sides <= self.high), axis=1)
+        values = np.full(len(sides), np.nan)
+        if in_range.any():
+            values[in_range] = self.scores(sides[in_range])
+        covered = in_range & (np.abs(values - 0.5) >= self.band)
+        values[~covered] = np.nan
+        first_stage = int(np.count_nonzero(covered))
+        self._count(first_stage, len(sides) - first_stage)
+        return values, covered
+
+    def _count(self, first_stage, escalated):
+        with self._lock:
+            self._first_stage += first_stage
+            self._escalated += escalated
+
+    def reset_stats(self):
+        with self._lock:
+            self._first_stage = self._escalated = 0
+
+    def stats(self):
+        """1단계로 응답한 수, 실제 모델로 넘긴 수와 1단계 적중률"""
+        with self._lock:
+            first_stage, escalated = self._first_stage, self._escalated
+        total = first_stage + escalated
+        return {
+            "first_stage": first_stage,
+            "full_model": escalated,
+            "first_stage_rate": first_stage / total if total else 0.0,
+        }
+
+    def measure_agreement(self, predict_batch, samples=DEFAULT_HOLDOUT, seed=1):
+        """
+        증류 범위 안의 무작위 입력에서 0.5 기준 판정이 실제 모델과 얼마나 일치하는지 측정합니다.
+
+        Returns:
+            dict: coverage (1단계로 응답한 비율), first_stage_agreement (1단계로 응답한 행의 일치율),
+                overall_agreement (불확실 구간은 실제 모델을 쓴 최종 판정의 일치율),
+                decision_mismatches, samples, band
+        """
+        rng = np.random.default_rng(seed)
+        inputs = rng.uniform(self.low, self.high, size=(samples, 3))
+        reference = np.asarray(predict_batch(inputs), dtype=np.float64) > 0.5
+        values, covered = self.lookup_batch(inputs)
+        mismatches = int(np.count_nonzero((values[covered] > 0.5) != reference[covered]))
+        answered = int(np.count_nonzero(covered))
+        self.report = {
+            "coverage": answered / samples if samples else 0.0,
+            "first_stage_agreement": 1.0 - mismatches / answered if answered else 1.0,
+            "overall_agreement": 1.0 - mismatches / samples if samples else 1.0,
+            "decision_mismatches": mismatches,
+            "samples": int(samples),
+            "band": self.band,
+        }
+        return self.report
@@ -0,0 +1,171 @@
+"""
+결정 지도 (decision map)
+
+한 변(c)을 고정하고 나머지 두 변(a, b)을 격자로 바꿔 가며 AI 예측값과 수학 판정을 계산해
+2차원 지도로 만듭니다. 모델이 어디서 틀리는지(수학 판정과 다른 영역) 한눈에 볼 수 있습니다.
+
+계산은 성긴 격자에서 촘촘한 격자 순서(coarse-to-fine)로 진행하고, 각 단계는 validate_batch
+청크 단위로 나눠 실행하므로 중간 결과를 바로 그릴 수 있고 청크 사이에서 취소할 수 있습니다.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_SIZE = 256 # 지도 한 변의 픽셀 수
+DEFAULT_LOW = 1.0
+DEFAULT_HIGH = 99.0
+DEFAULT_CHUNK_SIZE = 4096 # validate_batch 한 번에 넣는 점 수
+# 성긴 단계부터 계산할 격자 간격 (픽셀). 마지막 단계(1)에서 모든 픽셀이 채워짐
+DEFAULT_STRIDES = (16, 8, 4, 2, 1)
+
+# 예측값 0 -> 파랑, 1 -> 빨강. 수학 판정과 다른 픽셀은 노랑으로 강조
+_LOW_COLOR = np.array([44, 123, 182], dtype=np.float32)
+_HIGH_COLOR = np.array([215, 25, 28], dtype=np.float32)
+_DISAGREEMENT_COLOR = np.array([255, 221, 0], dtype=np.uint8)
+_MISSING_COLOR = np.array([235, 235, 235], dtype=np.uint8) # 아직 계산하지 않았거나 AI 결과가 없는 픽셀
+
+
+class DecisionMap:
+    """
+    고정된 c에 대한 (a, b) 평면 지도
+
+    values[i, j]는 a = axis[j], b = axis[i]일 때의 AI 예측값입니다 (행 = b, 열 = a).
+    known은 실제로 계산된 픽셀이며, 중간 단계에서는 가장 가까운 계산된 픽셀로 채워 그립니다.
+    """
+
+    def __init__(self, fixed_side, size=DEFAULT_SIZE, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+        self.fixed_side = float(fixed_side)
+        self.size = int(size)
+        self.low = float(low)
+        self.high = float(high)
+        self.axis = np.linspace(self.low, self.high, self.size)
+        self.values = np.full((self.size, self.size), np.nan, dtype=np.float32)
+        self.math_result = np.zeros((self.size, self.size), dtype=bool)
+        self.known = np.zeros((self.size, self.size), dtype=bool)
+        self.stride = None # 마지막으로 완료한 단계의 격자 간격
+        self.has_ai = True
+
+    @property
+    def complete(self):
+        return self.stride == 1
+
+    @property
+    def key(self):
+        return (self.fixed_side, self.size, self.low, self.high)
+
+    def compute(self, validate_batch, strides=DEFAULT_STRIDES, chunk_size=DEFAULT_CHUNK_SIZE,
+                is_cancelled=None, on_chunk=None):
+        """
+        아직 계산하지 않은 픽셀을 성긴 단계부터 계산합니다.
+
+        이미 계산된 픽셀은 건너뛰므로 취소된 지도를 다시 compute하면 이어서 계산합니다.
+
+        Args:
+            validate_batch (callable): (N, 3) 배열을 받아 BatchResult를 반환하는 함수
+                (ai_policy와 관계없이 모든 점의 AI 값이 필요하면 validate_batch_by_math/validate_batch_by_ai로 구성)
+            strides (tuple): 단계별 격자 간격 (큰 값부터)
+            chunk_size (int): validate_batch 한 번에 넣는 점 수
+            is_cancelled (callable, optional): True를 반환하면 다음 청크 전에 중단
+            on_chunk (callable, optional): 청크가 끝날 때마다 on_chunk(stride, done, total) 호출
+
+        Returns:
+            bool: 끝까지 계산했으면 True, 취소되었으면 False
+        """
+        for stride in strides:
+            if self.stride is not None and stride >= self.stride:
+                continue # 이미 완료한 단계
+            rows, cols = np.nonzero(~self.known[::stride, ::stride])
+            rows *= stride
+            cols *= stride
+            total = len(rows)
+            for start in range(0, total, chunk_size):
+                if is_cancelled is not None and is_cancelled():
+                    return False
+                r = rows[start:start + chunk_size]
+                c = cols[start:start + chunk_size]
+                sides = np.column_stack([self.axis[c], self.axis[r], np.full(len(r), self.fixed_side)])
+                result = validate_batch(sides)
+                self.math_result[r, c] = result["math_result"]
+                if result["ai_prediction_value"] is None:
+                    self.has_ai = False
+                else:
+                    self.values[r, c] = result["ai_prediction_value"]
+                self.known[r, c] = True
+                if on_chunk is not None:
+                    on_chunk(stride, min(start + chunk_size, total), total)
+            self.stride = stride
+        return True
+
+    def _filled(self, array):
+        """계산된 픽셀만으로 전체를 채운 배열 (각 픽셀은 현재 단계 격자의 왼쪽 위 점 값을 사용)"""
+        stride = self.stride or 1
+        if stride == 1:
+            return array
+        index = (np.arange(self.size) // stride) * stride
+        return array[np.ix_(index, index)]
+
+    def disagreement(self):
+        """AI 판정(> 0.5)과 수학 판정이 다른 픽셀 (계산되지 않은 픽셀은 False)"""
+        with np.errstate(invalid="ignore"):
+            return self.known & ~np.isnan(self.values) & ((self.values > 0.5) != self.math_result)
+
+    def disagreement_rate(self):
+        computed = int(np.count_nonzero(self.known & ~np.isnan(self.values)))
+        if computed == 0:
+            return 0.0
+        return int(np.count_nonzero(self.disagreement())) / computed
+
+    def render_rgba(self, show_disagreement=True):
+        """
+        지도를 (size, size, 4) uint8 RGBA 배열로 그립니다. 위쪽이 b의 최댓값입니다.
+
+        Args:
+            show_disagreement (bool): True이면 수학 판정과 다른 픽셀을 노랑으로 표시
+        """
+        image = np.empty((self.size, self.size, 4), dtype=np.uint8)
+        image[..., 3] = 255
+        if self.stride is None:
+            image[..., :3] = _MISSING_COLOR
+            return image
+
+        values = self._filled(self.values)
+        missing = np.isnan(values)
+        t = np.nan_to_num(values, nan=0.0)[..., None]
+        image[..., :3] = (_LOW_COLOR * (1 - t) + _HIGH_COLOR * t).astype(np.uint8)
+        image[missing, :3] = _MISSING_COLOR
+        if show_disagreement:
+            image[self._filled(self.disagreement()), :3] = _DISAGREEMENT_COLOR
+        return image[::-1] # 화면 위쪽이 큰 b가 되도록 뒤집음
+
+
+class DecisionMapCache:
+    """
+    (모델 세대, 고정 변, 크기, 범위)별 DecisionMap LRU 캐시
+
+    이미 본 단면으로 돌아오면 계산된(또는 취소되어 일부만 계산된) 지도를 그대로 재사용합니다.
+    모델 세대가 바뀌면(핫 리로드) 이전 지도는 사용하지 않습니다.
+    """
+
+    def __init__(self, max_maps=8):
+        self.max_maps = max_maps
+        self._maps = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, generation, fixed_side, size=DEFAULT_SIZE, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+        key = (generation, float(fixed_side), int(size), float(low), float(high))
+        with self._lock:
+            decision_map = self._maps.get(key)
+            if decision_map is not None:
+                self._maps.move_to_end(key)
+                return decision_map
+            decision_map = DecisionMap(fixed_side, size, low, high)
+            self._maps[key] = decision_map
+            while len(self._maps) > self.max_maps:
+                self._maps.popitem(last=False)
+            return decision_map
+
+    def clear(self):
+        with self._lock:
+            self._maps.clear()
@@ -0,0 +1,649 @@
+"""
+분산 배치 평가 (코디네이터/워커)
+
+코디네이터는 TCP 또는 Unix 소켓에서 워커 연결을 기다리고, 입력을 청크 단위로 나누어
+연결된 워커에 보냅니다. 워커는 TriangleValidatorCore를 한 번 만들어 두고 받은 청크를
+validate_batch로 검증한 뒤 결과를 돌려보냅니다. 워커가 코디네이터에 접속하는 방식이므로
+워커는 다른 호스트나 컨테이너에 있어도 코디네이터 주소만 알면 됩니다.
+
+- 워커마다 prefetch개까지 청크를 미리 보내 네트워크 왕복 시간을 숨깁니다.
+- 워커 연결이 끊기거나 task_timeout 안에 응답하지 않으면 그 워커가 가진 청크를 다른 워커에
+  다시 보냅니다. 한 청크가 max_attempts번 실패하면 작업 전체를 실패로 처리합니다.
+- 결과는 입력 순서대로 기록하며, 순서를 기다리며 보관하는 청크 수는 window로 제한합니다.
+
+메시지 형식: 4바이트 길이(big-endian) + JSON 헤더 + 헤더의 payload_bytes만큼의 원시 바이트.
+입력과 결과는 little-endian NumPy 배열 바이트로 보내며 피클은 사용하지 않습니다.
+받는 쪽은 메시지마다 허용할 payload 크기를 정하므로(핸드셰이크는 0, 청크는 행 수 기준)
+인증 전의 상대가 큰 메모리를 할당하게 만들 수 없습니다.
+"""
+
+import collections
+import hmac
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import stat
+import struct
+import threading
+import time
+
+import numpy as np
+
+from core.results import BatchResult
+from core.triangle_validator_core import as_sides_array
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+DEFAULT_PORT = 7070
+DEFAULT_PREFETCH = 2 # 워커당 동시에 보내 두는 청크 수
+DEFAULT_MAX_ATTEMPTS = 3 # 청크 하나를 시도하는 최대 횟수
+DEFAULT_TASK_TIMEOUT = 600.0 # 워커가 청크 하나에 응답해야 하는 시간 (초)
+DEFAULT_WINDOW = 64 # 순서대로 기록하기 위해 읽어 둘 수 있는 최대 청크 수
+DEFAULT_CONNECT_TIMEOUT = 30.0 # 워커가 코디네이터 접속을 재시도하는 시간 (초)
+HANDSHAKE_TIMEOUT = 10.0
+MAX_HEADER_BYTES = 1 << 20
+MAX_CHUNK_ROWS = 1 << 22 # 청크 하나의 최대 행 수 (입력 payload 약 96MB)
+
+_LENGTH = struct.Struct("!I")
+
+
+def parse_address(address):
+    """
+    "host:port" 또는 "unix:/path/to/socket" 문자열을 소켓 주소로 변환합니다.
+
+    Returns:
+        tuple | str: TCP는 (host, port), Unix 소켓은 경로 문자열
+    """
+    if not isinstance(address, str):
+        return address
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+    host, separator, port = address.rpartition(":")
+    if not separator:
+        return address, DEFAULT_PORT
+    return host.strip("[]") or "0.0.0.0", int(port)
+
+
+def format_address(address):
+    """parse_address의 역변환"""
+    if isinstance(address, str):
+        return f"unix:{address}"
+    host, port = address[:2]
+    return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+
+
+def send_message(sock, header, payload=b""):
+    """헤더(dict)와 원시 바이트 payload를 한 메시지로 보냅니다."""
+    data = json.dumps(dict(header, payload_bytes=len(payload))).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+    if payload:
+        sock.sendall(payload)
+
+
+def _recv_exact(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ConnectionError("상대방이 연결을 닫았습니다.")
+        received += count
+    return buffer
+
+
+def recv_message(sock, max_payload=0):
+    """
+    메시지 하나를 받습니다.
+
+    Args:
+        max_payload (int): 허용하는 최대 payload 크기 (bytes). 헤더가 더 큰 값을 요구하면 읽기 전에 거부
+
+    Returns:
+        tuple: (헤더 dict, payload bytearray)
+
+    Raises:
+        ConnectionError: 연결이 끊겼거나 형식이 잘못된 경우
+    """
+    (length,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if length > MAX_HEADER_BYTES:
+        raise ConnectionError(f"메시지 헤더가 너무 큽니다: {length} bytes")
+    try:
+        header = json.loads(_recv_exact(sock, length))
+    except ValueError as e:
+        raise ConnectionError(f"메시지 헤더를 해석할 수 없습니다: {e}") from e
+    if not isinstance(header, dict):
+        raise ConnectionError(f"메시지 헤더가 객체가 아닙니다: {type(header).__name__}")
+    size = header.get("payload_bytes", 0)
+    if type(size) is not int or not 0 <= size <= max_payload:
+        raise ConnectionError(f"payload 크기가 허용 범위를 벗어났습니다: {size} (최대 {max_payload} bytes)")
+    return header, _recv_exact(sock, size)
+
+
+def encode_sides(sides):
+    return np.ascontiguousarray(sides, dtype="<f8").tobytes()
+
+
+def decode_sides(payload, rows):
+    if len(payload) != rows * 24:
+        raise ConnectionError(f"입력 크기가 행 수와 맞지 않습니다: {len(payload)} bytes, {rows}행")
+    return np.frombuffer(payload, dtype="<f8").reshape(rows, 3)
+
+
+def encode_result(results):
+    """validate_batch 결과를 (has_ai, payload)로 만듭니다. payload = math(uint8 N) + ai(float64 N)"""
+    payload = np.asarray(results["math_result"], dtype=bool).astype(np.uint8).tobytes()
+    ai_prediction_value = results["ai_prediction_value"]
+    if ai_prediction_value is None:
+        return False, payload
+    return True, payload + np.ascontiguousarray(ai_prediction_value, dtype="<f8").tobytes()
+
+
+def decode_result(sides, has_ai, payload):
+    rows = len(sides)
+    expected = rows * (9 if has_ai else 1)
+    if len(payload) != expected:
+        raise ConnectionError(f"결과 크기가 행 수와 맞지 않습니다: {len(payload)} bytes, {rows}행")
+    math_result = np.frombuffer(payload, dtype=np.uint8, count=rows).astype(bool)
+    ai_prediction_value = np.frombuffer(payload, dtype="<f8", offset=rows) if has_ai else None
+    return BatchResult.from_columns(sides, math_result, ai_prediction_value)
+
+
+def _is_socket(path):
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _connect(address, timeout):
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address)
+    else:
+        sock = socket.create_connection(address, timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+class _Job:
+    """
+    코디네이터의 run 한 번에 해당하는 작업 상태
+
+    take/fail은 코디네이터의 condition을 잡은 상태에서 호출하고,
+    complete는 결과를 순서대로 기록하기 위해 직접 잠급니다.
+    """
+
+    def __init__(self, chunks, write, condition, max_attempts, window, on_progress):
+        self._chunks = iter(chunks)
+        self._write = write
+        self._condition = condition
+        self._write_lock = threading.Lock()
+        self._on_progress = on_progress
+        self.max_attempts = max_attempts
+        self.window = window
+        self.exhausted = False
+        self.next_read = 0
+        self.next_write = 0
+        self.pending = {} # 청크 번호 → 입력 (처리 중이거나 재시도 대기 중)
+        self.retry = collections.deque()
+        self.attempts = collections.Counter()
+        self.results = {}
+        self.rows = 0
+        self.retries = 0
+        self.error = None
+        self.started = time.perf_counter()
+
+    @property
+    def finished(self):
+        return self.error is not None or (self.exhausted and self.next_write == self.next_read)
+
+    def take(self):
+        """다음에 보낼 (청크 번호, 입력)을 반환합니다. 보낼 것이 없으면 None."""
+        if self.error is not None:
+            return None
+        if self.retry:
+            index = self.retry.popleft()
+            return index, self.pending[index]
+        if self.exhausted or self.next_read - self.next_write >= self.window:
+            return None
+        try:
+            sides = next(self._chunks)
+        except StopIteration:
+            self.exhausted = True
+            self._condition.notify_all()
+            return None
+        except Exception as e:
+            logger.error(f"입력 청크 읽기 실패: {e}")
+            self.error = e
+            self._condition.notify_all()
+            return None
+        sides = as_sides_array(sides)
+        if len(sides) > MAX_CHUNK_ROWS:
+            self.error = ValueError(f"청크가 너무 큽니다: {len(sides)}행 (최대 {MAX_CHUNK_ROWS}행)")
+            self._condition.notify_all()
+            return None
+        index = self.next_read
+        self.next_read += 1
+        self.pending[index] = sides
+        return index, self.pending[index]
+
+    def fail(self, indexes, reason):
+        """워커에서 처리하지 못한 청크를 재시도 대기열에 넣습니다."""
+        for index in indexes:
+            if index not in self.pending or self.error is not None:
+                continue
+            self.attempts[index] += 1
+            if self.attempts[index] >= self.max_attempts:
+                self.error = RuntimeError(f"청크 {index}가 {self.attempts[index]}번 실패했습니다: {reason}")
+                logger.error(str(self.error))
+            else:
+                self.retries += 1
+                self.retry.append(index)
+                logger.warning(f"청크 {index} 재시도 ({self.attempts[index]}/{self.max_attempts}): {reason}")
+        self._condition.notify_all()
+
+    def complete(self, index, result):
+        """청크 결과를 보관하고, 순서가 된 결과부터 기록합니다."""
+        with self._condition:
+            if index not in self.pending or self.error is not None:
+                return # 이미 다른 워커가 처리했거나 작업이 중단됨
+            del self.pending[index]
+            self.results[index] = result
+        with self._write_lock:
+            while True:
+                with self._condition:
+                    result = self.results.pop(self.next_write, None)
+                    if result is None or self.error is not None:
+                        return
+                try:
+                    self._write(result)
+                except Exception as e:
+                    with self._condition:
+                        self.error = e
+                        self._condition.notify_all()
+                    return
+                with self._condition:
+                    self.next_write += 1
+                    self.rows += len(result)
+                    progress = self.progress()
+                    self._condition.notify_all()
+                if self._on_progress is not None:
+                    self._on_progress(progress)
+
+    def progress(self):
+        elapsed = time.perf_counter() - self.started
+        return {
+            "rows": self.rows,
+            "chunks_done": self.next_write,
+            "chunks_read": self.next_read,
+            "in_flight": len(self.pending) - len(self.retry),
+            "retries": self.retries,
+            "seconds": elapsed,
+            "rows_per_second": self.rows / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+class Coordinator:
+    """
+    워커에 청크를 나누어 보내고 결과를 입력 순서대로 모으는 코디네이터
+
+    사용 예:
+        with Coordinator("127.0.0.1:7070") as coordinator:
+            workers = start_local_workers(coordinator.address, 4, framework="numpy")
+            coordinator.wait_for_workers(4, timeout=60)
+            stats = coordinator.run(iter_chunks("triangles.npy"), writer.write)
+    """
+
+    def __init__(self, address=("127.0.0.1", DEFAULT_PORT), token=None, prefetch=DEFAULT_PREFETCH,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, task_timeout=DEFAULT_TASK_TIMEOUT, window=DEFAULT_WINDOW):
+        """
+        Args:
+            address: 대기할 주소 ("host:port", "unix:/path", (host, port)). 포트 0이면 임의 포트
+            token (str, optional): 워커가 접속할 때 보내야 하는 공유 토큰
+            prefetch (int): 워커당 동시에 보내 두는 청크 수
+            max_attempts (int): 청크 하나를 시도하는 최대 횟수
+            task_timeout (float): 워커가 청크 하나에 응답해야 하는 시간 (초). 넘으면 연결을 끊고 재시도
+            window (int): 순서대로 기록하기 위해 읽어 둘 수 있는 최대 청크 수 (메모리 상한)
+        """
+        if prefetch < 1 or max_attempts < 1 or window < 1:
+            raise ValueError("prefetch, max_attempts, window는 1 이상이어야 합니다.")
+        self.token = token
+        self.prefetch = prefetch
+        self.max_attempts = max_attempts
+        self.task_timeout = task_timeout
+        self.window = window
+        self._condition = threading.Condition()
+        self._run_lock = threading.Lock()
+        self._job = None
+        self._closed = False
+        self._workers = {} # 이름 → 연결 상태와 처리 통계
+        self._threads = []
+
+        address = parse_address(address)
+        if isinstance(address, str):
+            if _is_socket(address):
+                os.unlink(address) # 이전 실행이 남긴 소켓 파일
+            elif os.path.lexists(address):
+                raise FileExistsError(f"소켓이 아닌 파일이 이미 있습니다: {address}")
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(address)
+            self._server.listen()
+        else:
+            self._server = socket.create_server(address)
+        self.address = self._server.getsockname()
+        self._accept_thread = threading.Thread(target=self._accept_loop, name="triangle-coordinator", daemon=True)
+        self._accept_thread.start()
+        logger.info(f"코디네이터 대기 시작: {format_address(self.address)}")
+
+    def _accept_loop(self):
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return # close로 서버 소켓이 닫힘
+            thread = threading.Thread(target=self._handle_connection, args=(sock,), daemon=True)
+            with self._condition:
+                self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+            thread.start()
+
+    def _handshake(self, sock):
+        """hello를 받아 확인하고 워커 이름을 반환합니다. 거부하면 None."""
+        sock.settimeout(HANDSHAKE_TIMEOUT)
+        header, _ = recv_message(sock)
+        if header.get("type") != "hello" or header.get("protocol") != PROTOCOL_VERSION:
+            send_message(sock, {"type": "rejected", "reason": f"지원하지 않는 프로토콜: {header.get('protocol')}"})
+            return None
+        token = str(header.get("token") or "").encode("utf-8")
+        if self.token is not None and not hmac.compare_digest(token, self.token.encode("utf-8")):
+            send_message(sock, {"type": "rejected", "reason": "토큰이 일치하지 않습니다."})
+            return None
+        with self._condition:
+            base = str(header.get("name") or "worker")
+            name, suffix = base, 1
+            while name in self._workers and self._workers[name]["connected"]:
+                suffix += 1
+                name = f"{base}#{suffix}"
+            stats = self._workers.setdefault(name, {"chunks": 0, "rows": 0, "failures": 0})
+            stats["connected"] = True
+            self._condition.notify_all()
+        send_message(sock, {"type": "welcome", "name": name})
+        sock.settimeout(self.task_timeout)
+        return name
+
+    def _take(self, block):
+        """다음에 보낼 (job, 청크 번호, 입력). block이면 보낼 것이 생기거나 종료될 때까지 기다립니다."""
+        with self._condition:
+            while not self._closed:
+                job = self._job
+                if job is not None:
+                    task = job.take()
+                    if task is not None:
+                        return (job,) + task
+                if not block:
+                    return None
+                self._condition.wait()
+            return None
+
+    def _handle_connection(self, sock):
+        name = None
+        in_flight = collections.deque()
+        try:
+            if isinstance(self.address, tuple):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            name = self._handshake(sock)
+            if name is None:
+                return
+            logger.info(f"워커 연결: {name}")
+            while True:
+                while len(in_flight) < self.prefetch:
+                    task = self._take(block=not in_flight)
+                    if task is None:
+                        break
+                    job, index, sides = task
+                    in_flight.append(task)
+                    send_message(sock, {"type": "task", "chunk": index, "rows": len(sides)}, encode_sides(sides))
+                if not in_flight:
+                    send_message(sock, {"type": "shutdown"}) # 코디네이터 종료
+                    return
+                job, index, sides = in_flight[0] # 워커는 받은 순서대로 응답
+                header, payload = recv_message(sock, max_payload=len(sides) * 9)
+                if header.get("chunk") != index:
+                    raise ConnectionError(f"기대한 청크 {index} 대신 {header.get('chunk')}의 응답을 받았습니다.")
+                if header.get("type") == "result":
+                    result = decode_result(sides, bool(header.get("has_ai")), payload)
+                    in_flight.popleft()
+                    job.complete(index, result)
+                    with self._condition:
+                        self._workers[name]["chunks"] += 1
+                        self._workers[name]["rows"] += len(sides)
+                else:
+                    in_flight.popleft()
+                    with self._condition:
+                        self._workers[name]["failures"] += 1
+                        job.fail([index], f"{name}: {header.get('message')}")
+        except (OSError, ConnectionError, ValueError) as e:
+            if in_flight:
+                logger.warning(f"워커 {name} 연결 끊김 ({len(in_flight)}개 청크 재시도): {e}")
+            else:
+                logger.info(f"워커 {name} 연결 종료: {e}")
+        finally:
+            with self._condition:
+                for job, index, _ in in_flight:
+                    job.fail([index], f"워커 {name} 연결 끊김")
+                if name is not None:
+                    self._workers[name]["connected"] = False
+                    if in_flight:
+                        self._workers[name]["failures"] += len(in_flight)
+                self._condition.notify_all()
+            sock.close()
+
+    def wait_for_workers(self, count, timeout=None):
+        """
+        연결된 워커가 count개 이상이 될 때까지 기다립니다.
+
+        Returns:
+            bool: 시간 안에 연결되었으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self.connected_workers() >= count, timeout)
+
+    def connected_workers(self):
+        return sum(1 for stats in self._workers.values() if stats["connected"])
+
+    def run(self, chunks, write, timeout=None, on_progress=None):
+        """
+        청크를 워커에 나누어 검증하고 결과를 입력 순서대로 write에 넘깁니다.
+
+        Args:
+            chunks (iterable): (N, 3) 배열 청크 (예: bulk_io.iter_chunks)
+            write (callable): 청크 결과(BatchResult)를 순서대로 받는 함수 (예: ResultWriter.write)
+            timeout (float, optional): 전체 작업 제한 시간 (초)
+            on_progress (callable, optional): 청크 결과를 기록할 때마다 진행 상황 dict를 받는 함수
+
+        Returns:
+            dict: rows, chunks, retries, seconds, rows_per_second, workers(워커별 처리 통계)
+
+        Raises:
+            RuntimeError: 청크가 max_attempts번 실패했거나 입력/기록 중 오류가 난 경우
+            TimeoutError: timeout 안에 끝나지 않은 경우
+        """
+        # 빈 입력은 워커가 없어도 바로 끝나도록 첫 청크를 미리 확인
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        chunks = itertools.chain([first] if first is not None else [], chunks)
+        with self._run_lock:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("코디네이터가 이미 종료되었습니다.")
+                job = _Job(chunks, write, self._condition, self.max_attempts, self.window, on_progress)
+                self._job = job
+                self._condition.notify_all()
+                if first is None:
+                    job.exhausted = True
+                self._condition.wait_for(lambda: job.finished or self._closed, timeout)
+                self._job = None
+                if not job.finished:
+                    # 아직 워커에 남은 청크의 결과는 무시
+                    job.error = (RuntimeError("코디네이터가 종료되어 작업을 끝내지 못했습니다.") if self._closed
+                                 else TimeoutError(f"분산 작업이 {timeout}초 안에 끝나지 않았습니다."))
+                progress = job.progress()
+                workers = {name: dict(stats) for name, stats in self._workers.items()}
+            if isinstance(job.error, TimeoutError):
+                raise job.error
+            if job.error is not None:
+                raise RuntimeError(f"분산 작업 실패: {job.error}") from job.error
+
+        logger.info(f"분산 작업 완료: {progress['rows']}행, {progress['chunks_done']}청크, "
+                    f"재시도 {progress['retries']}회, {progress['seconds']:.2f}초")
+        return {
+            "rows": progress["rows"],
+            "chunks": progress["chunks_done"],
+            "retries": progress["retries"],
+            "seconds": progress["seconds"],
+            "rows_per_second": progress["rows_per_second"],
+            "workers": workers,
+        }
+
+    def close(self, timeout=5.0):
+        """워커에 종료 메시지를 보내고 서버 소켓을 닫습니다."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+        self._server.close()
+        for thread in threads:
+            thread.join(timeout)
+        if isinstance(self.address, str) and _is_socket(self.address):
+            os.unlink(self.address)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class Worker:
+    """
+    코디네이터에 접속해 받은 청크를 TriangleValidatorCore.validate_batch로 검증하는 워커
+
+    사용 예:
+        Worker("coordinator-host:7070", framework="numpy").run()
+    """
+
+    def __init__(self, address, name=None, token=None, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                 max_chunk_rows=MAX_CHUNK_ROWS, **core_options):
+        """
+        Args:
+            address: 코디네이터 주소 ("host:port", "unix:/path", (host, port))
+            name (str, optional): 워커 이름 (기본값: 호스트명:pid)
+            token (str, optional): 코디네이터와 공유하는 토큰
+            connect_timeout (float): 코디네이터가 아직 없을 때 접속을 재시도하는 시간 (초)
+            max_chunk_rows (int): 받을 수 있는 청크의 최대 행 수
+            **core_options: TriangleValidatorCore 생성 인자 (framework, model_path, scaler_path 등)
+        """
+        self.address = parse_address(address)
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.token = token
+        self.connect_timeout = connect_timeout
+        self.max_chunk_rows = max_chunk_rows
+        self.core_options = core_options
+
+    def _connect(self):
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return _connect(self.address, HANDSHAKE_TIMEOUT)
+            except OSError as e:
+                if time.monotonic() >= deadline:
+                    raise ConnectionError(f"코디네이터에 접속할 수 없습니다: {format_address(self.address)}: {e}") from e
+                time.sleep(0.2)
+
+    def run(self):
+        """
+        코디네이터가 종료 메시지를 보내거나 연결을 닫을 때까지 청크를 처리합니다.
+
+        Returns:
+            dict: chunks, rows (이 워커가 처리한 청크/행 수)
+
+        Raises:
+            ConnectionError: 접속하지 못했거나 코디네이터가 접속을 거부한 경우
+        """
+        from core.triangle_validator_core import TriangleValidatorCore
+
+        # 모델 로드 시간이 청크 처리 시간에 포함되지 않도록 접속 전에 준비
+        core = TriangleValidatorCore(**self.core_options)
+        processed = {"chunks": 0, "rows": 0}
+        sock = self._connect()
+        try:
+            send_message(sock, {"type": "hello", "protocol": PROTOCOL_VERSION, "name": self.name,
+                                "token": self.token})
+            header, _ = recv_message(sock)
+            if header.get("type") != "welcome":
+                raise ConnectionError(f"코디네이터가 접속을 거부했습니다: {header.get('reason')}")
+            sock.settimeout(None) # 다음 청크는 언제 올지 모름
+            logger.info(f"코디네이터 접속: {format_address(self.address)} ({header.get('name')})")
+            while True:
+                try:
+                    header, payload = recv_message(sock, max_payload=self.max_chunk_rows * 24)
+                except ConnectionError:
+                    logger.info("코디네이터 연결이 끊겨 워커를 종료합니다.")
+                    break
+                if header.get("type") == "shutdown":
+                    break
+                index, rows = header.get("chunk"), header.get("rows")
+                if type(rows) is not int:
+                    raise ConnectionError(f"잘못된 청크 메시지입니다: {header}")
+                try:
+                    has_ai, result = encode_result(core.validate_batch(decode_sides(payload, rows)))
+                except Exception as e:
+                    logger.error(f"청크 {index} 검증 실패: {e}", exc_info=True)
+                    send_message(sock, {"type": "error", "chunk": index, "message": str(e)})
+                    continue
+                send_message(sock, {"type": "result", "chunk": index, "rows": rows, "has_ai": has_ai}, result)
+                processed["chunks"] += 1
+                processed["rows"] += rows
+        finally:
+            sock.close()
+            core.close()
+        return processed
+
+
+def _run_local_worker(address, options):
+    if options.get("framework") == "tensorflow" and options.get("intra_op_threads"):
+        from models.adapters.tf_adapter import configure_threads
+        configure_threads(options["intra_op_threads"], 1)
+    options = {key: value for key, value in options.items() if key != "intra_op_threads"}
+    Worker(address, **options).run()
+
+
+def start_local_workers(address, count, **options):
+    """
+    같은 머신에 워커 프로세스 count개를 시작합니다 (spawn, 데몬 프로세스).
+
+    Args:
+        address: 코디네이터 주소
+        count (int): 워커 수
+        **options: Worker 인자 (token, framework, model_path, scaler_path, intra_op_threads 등)
+
+    Returns:
+        list: multiprocessing.Process 목록 (종료는 코디네이터 close 후 join)
+    """
+    # TensorFlow는 fork 이후 안전하지 않으므로 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    processes = []
+    for number in range(count):
+        worker_options = dict(options, name=options.get("name") or f"local-{number}")
+        process = context.Process(target=_run_local_worker, args=(format_address(address), worker_options),
+                                  name=f"triangle-worker-{number}", daemon=True)
+        process.start()
+        processes.append(process)
+    return processes
@@ -0,0 +1,201 @@
+"""
+AI 예측 룩업 테이블 (LUT)
+
+입력 영역을 균일한 3차원 격자로 나눠 각 격자점의 모델 출력을 미리 계산해 두고,
+예측 시에는 순전파 대신 주변 8개 격자점의 삼선형 보간(trilinear interpolation)으로
+값을 구합니다. 격자 범위를 벗어나거나, 결정 경계(0.5)가 지나가는 칸이거나,
+보간값이 0.5에 가까우면 None을 돌려주어 호출하는 쪽이 실제 모델로 대체(fallback)하도록 합니다.
+모델 출력은 경계에서 급격히 변하므로 경계가 지나가는 칸의 보간값은 신뢰할 수 없습니다.
+"""
+
+import array
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 학습 데이터(및 MinMaxScaler)의 변 길이 범위
+DEFAULT_LOW = 1.0
+DEFAULT_HIGH = 99.0
+DEFAULT_POINTS = 99 # 축당 격자점 수 (기본 범위에서 간격 1.0)
+# 보간값이 0.5 ± 이 값 안에 있으면 실제 모델로 대체
+DEFAULT_MARGIN = 0.05
+# 격자 값을 계산할 때 한 번에 모델에 넣는 행 수
+BUILD_CHUNK_SIZE = 65536
+
+
+class PredictionLUT:
+    """
+    삼선형 보간 기반 예측 테이블
+
+    values는 (points, points, points) 형태로, values[i, j, k]는
+    (low + i*step, low + j*step, low + k*step) 입력에 대한 모델 출력입니다.
+    """
+
+    def __init__(self, values, low=DEFAULT_LOW, high=DEFAULT_HIGH, margin=DEFAULT_MARGIN, fingerprint=None):
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 3 or len(set(values.shape)) != 1 or values.shape[0] < 2:
+            raise ValueError(f"values는 (n, n, n) 형태여야 합니다 (n >= 2): {values.shape}")
+        self.values = values
+        self.points = values.shape[0]
+        self.low = float(low)
+        self.high = float(high)
+        self.margin = float(margin)
+        self.fingerprint = fingerprint
+        self.report = None # measure_error 결과
+        self._inv_step = (self.points - 1) / (self.high - self.low)
+        # 단일 조회에서 numpy 스칼라 인덱싱 대신 빠른 float 인덱싱을 쓰기 위한 평탄화 사본
+        self._flat = array.array("d", values.ravel().tobytes())
+        # 칸(cell)의 8개 꼭짓점 판정이 서로 다르면 결정 경계가 지나가는 칸
+        above = values > 0.5
+        corners = [above[di:self.points - 1 + di, dj:self.points - 1 + dj, dk:self.points - 1 + dk]
+                   for di in (0, 1) for dj in (0, 1) for dk in (0, 1)]
+        self.boundary_cells = np.logical_or.reduce(corners) & ~np.logical_and.reduce(corners)
+        self._boundary_flat = array.array("b", self.boundary_cells.astype(np.int8).ravel().tobytes())
+
+    @classmethod
+    def build(cls, predict_batch, low=DEFAULT_LOW, high=DEFAULT_HIGH, points=DEFAULT_POINTS,
+              margin=DEFAULT_MARGIN, fingerprint=None):
+        """
+        격자점 전체에 대해 모델을 실행해 테이블을 만듭니다.
+
+        Args:
+            predict_batch (callable): (N, 3) 배열을 받아 (N,) 예측값을 반환하는 함수
+            low (float): 격자 최솟값
+            high (float): 격자 최댓값
+            points (int): 축당 격자점 수
+            margin (float): 결정 경계 대체 구간의 반폭
+            fingerprint (str, optional): 테이블을 만든 모델의 지문
+
+        Returns:
+            PredictionLUT: 생성된 테이블
+        """
+        axis = np.linspace(low, high, points)
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+        values = np.empty(grid.shape[0], dtype=np.float64)
+        for start in range(0, grid.shape[0], BUILD_CHUNK_SIZE):
+            end = start + BUILD_CHUNK_SIZE
+            values[start:end] = predict_batch(grid[start:end])
+        return cls(values.reshape(points, points, points), low, high, margin, fingerprint)
+
+    @classmethod
+    def load(cls, path, fingerprint=None):
+        """
+        save로 저장한 테이블을 읽습니다.
+
+        Returns:
+            PredictionLUT: 테이블. 파일이 없거나 fingerprint가 다르면 None
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                stored = str(data["fingerprint"])
+                if fingerprint is not None and stored != fingerprint:
+                    logger.info(f"LUT 파일의 모델 지문이 달라 다시 생성합니다: {path}")
+                    return None
+                lut = cls(data["values"], float(data["low"]), float(data["high"]), float(data["margin"]), stored)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"LUT 파일을 읽지 못했습니다 ({path}): {e}")
+            return None
+        return lut
+
+    def save(self, path):
+        """테이블을 .npz 파일로 저장합니다 (빌드 산출물로 재사용)."""
+        np.savez(path, values=self.values.astype(np.float32), low=self.low, high=self.high,
+                 margin=self.margin, fingerprint=self.fingerprint or "")
+
+    def lookup(self, a, b, c):
+        """
+        단일 입력을 보간합니다.
+
+        Returns:
+            float: 보간된 예측값. 범위를 벗어나거나 결정 경계에 가까우면 None
+        """
+        inv_step = self._inv_step
+        x = (a - self.low) * inv_step
+        y = (b - self.low) * inv_step
+        z = (c - self.low) * inv_step
+        last = self.points - 1
+        if not (0.0 <= x <= last and 0.0 <= y <= last and 0.0 <= z <= last):
+            return None
+        # 최댓값 경계에서도 오른쪽 격자점이 존재하도록 마지막 칸으로 제한
+        i = min(int(x), last - 1)
+        j = min(int(y), last - 1)
+        k = min(int(z), last - 1)
+        if self._boundary_flat[(i * last + j) * last + k]:
+            return None
+        fx, fy, fz = x - i, y - j, z - k
+
+        n = self.points
+        v = self._flat
+        base = (i * n + j) * n + k
+        di, dj = n * n, n
+        c00 = v[base] * (1 - fz) + v[base + 1] * fz
+        c01 = v[base + dj] * (1 - fz) + v[base + dj + 1] * fz
+        c10 = v[base + di] * (1 - fz) + v[base + di + 1] * fz
+        c11 = v[base + di + dj] * (1 - fz) + v[base + di + dj + 1] * fz
+        value = (c00 * (1 - fy) + c01 * fy) * (1 - fx) + (c10 * (1 - fy) + c11 * fy) * fx
+        if abs(value - 0.5) < self.margin:
+            return None
+        return value
+
+    def lookup_batch(self, sides):
+        """
+        N×3 입력을 한 번에 보간합니다.
+
+        Returns:
+            tuple: (values, covered). covered가 False인 행은 범위를 벗어났거나 결정 경계가
+                지나가는 칸 또는 0.5 근처여서 실제 모델로 다시 계산해야 하는 행입니다 (values는 NaN).
+        """
+        sides = np.asarray(sides, dtype=np.float64).reshape(-1, 3)
+        last = self.points - 1
+        coords = (sides - self.low) * self._inv_step
+        finite = np.isfinite(coords)
+        in_range = np.all(finite & (coords >= 0.0) & (coords <= last), axis=1)
+        # NaN/inf는 clip 후에도 정수 인덱스로 바꿀 수 없으므로 0으로 두고 covered=False로 모델에 넘김
+        coords = np.clip(np.where(finite, coords, 0.0), 0.0, last)
+        index = np.minimum(coords.astype(np.intp), last - 1)
+        frac = coords - index
+
+        values = np.zeros(sides.shape[0], dtype=np.float64)
+        for corner in range(8):
+            offsets = np.array([(corner >> 2) & 1, (corner >> 1) & 1, corner & 1])
+            weights = np.prod(np.where(offsets, frac, 1.0 - frac), axis=1)
+            i, j, k = (index + offsets).T
+            values += weights * self.values[i, j, k]
+
+        boundary = self.boundary_cells[index[:, 0], index[:, 1], index[:, 2]]
+        covered = in_range & ~boundary & (np.abs(values - 0.5) >= self.margin)
+        values[~covered] = np.nan
+        return values, covered
+
+    def measure_error(self, predict_batch, samples=20000, seed=0):
+        """
+        격자 범위 안의 무작위 입력에서 실제 모델과의 차이를 측정합니다.
+
+        Args:
+            predict_batch (callable): 실제 모델의 배치 예측 함수
+            samples (int): 측정에 사용할 무작위 입력 수
+            seed (int): 난수 시드
+
+        Returns:
+            dict: max_abs_error, mean_abs_error (LUT로 응답한 행 기준), coverage (LUT로 응답한 비율),
+                decision_mismatches (LUT로 응답한 행 중 0.5 기준 판정이 모델과 다른 수), samples
+        """
+        rng = np.random.default_rng(seed)
+        inputs = rng.uniform(self.low, self.high, size=(samples, 3))
+        reference = np.asarray(predict_batch(inputs), dtype=np.float64)
+
+        interpolated, covered = self.lookup_batch(inputs)
+        errors = np.abs(interpolated[covered] - reference[covered])
+        mismatches = (interpolated[covered] > 0.5) != (reference[covered] > 0.5)
+        self.report = {
+            "max_abs_error": float(errors.max()) if errors.size else 0.0,
+            "mean_abs_error": float(errors.mean()) if errors.size else 0.0,
+            "coverage": float(covered.mean()),
+            "decision_mismatches": int(mismatches.sum()),
+            "samples": int(samples),
+        }
+        return self.report
@@ -0,0 +1,232 @@
+"""
+경량 메트릭
+
+카운터, 게이지, 고정 버킷 히스토그램과 Prometheus 텍스트 형식 출력을 제공합니다.
+외부 의존성 없이 여러 스레드에서 안전하게 기록할 수 있습니다.
+"""
+
+import bisect
+import sys
+import threading
+
+# 지연 시간(초)용 기본 버킷: 50µs ~ 5s
+DEFAULT_LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+# 배치 크기/큐 깊이용 기본 버킷
+DEFAULT_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+    def snapshot(self):
+        return self.value
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+
+class Gauge:
+    """현재 값을 나타내는 게이지"""
+
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def snapshot(self):
+        return self.value
+
+    def render(self):
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (Prometheus histogram과 같은 누적 버킷 의미)"""
+
+    def __init__(self, name, help_text="", buckets=DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1) # 마지막 칸은 +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def reset(self):
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+    def snapshot(self):
+        """누적 버킷 개수, 합계, 개수를 반환합니다."""
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        cumulative = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return {"buckets": cumulative, "sum": total, "count": count}
+
+    def quantile(self, q):
+        """버킷 상한으로 근사한 분위수를 반환합니다. 기록이 없으면 None."""
+        snapshot = self.snapshot()
+        if snapshot["count"] == 0:
+            return None
+        target = q * snapshot["count"]
+        for bound, running in snapshot["buckets"]:
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def render(self):
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for bound, running in snapshot["buckets"]:
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {running}')
+        lines.append(f"{self.name}_sum {_format_value(snapshot['sum'])}")
+        lines.append(f"{self.name}_count {snapshot['count']}")
+        return lines
+
+
+class PipelineMetrics:
+    """
+    검증 경로(hot path) 계측 묶음
+
+    TriangleValidatorCore와 어댑터가 공유하며, 단계별 소요 시간 히스토그램과
+    검증/AI 예측/AI-수학 불일치 카운터를 기록합니다. 계측을 켜지 않으면
+    코어와 어댑터는 이 객체 대신 None을 들고 있어 시간 측정 자체를 건너뜁니다.
+    """
+
+    # input_conversion: 입력을 float/배열로 변환, scaler_transform: 스케일러 변환,
+    # model_forward: 모델 순전파, math_check: 삼각형 부등식 검사, result_assembly: 결과 dict 구성
+    STAGES = ("input_conversion", "scaler_transform", "model_forward", "math_check", "result_assembly")
+
+    def __init__(self, prefix="triangle"):
+        self.stages = {
+            stage: Histogram(f"{prefix}_stage_{stage}_seconds", f"Time spent in the {stage} stage")
+            for stage in self.STAGES
+        }
+        self.validations = Counter(f"{prefix}_validations_total", "Triangles validated")
+        self.ai_predictions = Counter(f"{prefix}_ai_predictions_total", "Triangles evaluated by the AI model")
+        self.disagreements = Counter(f"{prefix}_ai_math_disagreements_total",
+                                     "Triangles where the AI decision differs from the math result")
+
+    def observe(self, stage, seconds):
+        self.stages[stage].observe(seconds)
+
+    def record_results(self, validations, ai_predictions=0, disagreements=0):
+        self.validations.inc(validations)
+        if ai_predictions:
+            self.ai_predictions.inc(ai_predictions)
+        if disagreements:
+            self.disagreements.inc(disagreements)
+
+    def metrics(self):
+        return [self.validations, self.ai_predictions, self.disagreements] + list(self.stages.values())
+
+    def snapshot(self):
+        """
+        단계별 통계와 카운터를 dict로 반환합니다.
+
+        Returns:
+            dict: stages (단계별 count, total_seconds, p50_seconds, p99_seconds),
+                validations, ai_predictions, disagreements
+        """
+        stages = {}
+        for stage, histogram in self.stages.items():
+            data = histogram.snapshot()
+            stages[stage] = {
+                "count": data["count"],
+                "total_seconds": data["sum"],
+                "p50_seconds": histogram.quantile(0.5),
+                "p99_seconds": histogram.quantile(0.99),
+            }
+        return {
+            "stages": stages,
+            "validations": self.validations.snapshot(),
+            "ai_predictions": self.ai_predictions.snapshot(),
+            "disagreements": self.disagreements.snapshot(),
+        }
+
+    def render(self):
+        return render_prometheus(self.metrics())
+
+    def reset(self):
+        for histogram in self.stages.values():
+            histogram.reset()
+        for counter in (self.validations, self.ai_predictions, self.disagreements):
+            counter.reset()
+
+
+def render_prometheus(metrics):
+    """메트릭 객체 목록을 Prometheus 텍스트 노출 형식으로 변환합니다."""
+    lines = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS(MB)를 반환합니다. 측정할 수 없으면 None."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 byte 단위
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
@@ -0,0 +1,276 @@
+"""
+프로세스 공용 모델 레지스트리
+
+같은 모델/스케일러 파일을 사용하는 TriangleValidatorCore 인스턴스들이 가중치를
+한 번만 로드해 공유하도록 합니다. 버전은 (프레임워크, 어댑터 옵션, 파일 내용 해시)로
+식별하므로 경로가 달라도 내용이 같으면 같은 버전을 사용합니다.
+
+파일 감시를 켜면 model.h5 / scaler.pkl이 바뀌었을 때 새 버전을 백그라운드에서 로드한 뒤
+핸들이 가리키는 버전을 한 번에 교체합니다. 이미 진행 중인 요청은 시작할 때 잡아 둔
+이전 버전으로 끝까지 처리되므로 요청이 끊기지 않습니다.
+"""
+
+import logging
+import os
+import threading
+import time
+import weakref
+
+from core.prediction_cache import file_fingerprint
+from core.profiling import phase
+from models.adapters import get_adapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+# 파일 수정 후 이 시간이 지나야 새 버전을 로드 (복사 중인 파일을 읽지 않도록)
+DEFAULT_SETTLE_SECONDS = 1.0
+
+
+def _options_key(adapter_options):
+    return tuple(sorted((adapter_options or {}).items()))
+
+
+def _stat_signature(*paths):
+    """파일 변경 감지용 (mtime_ns, size) 묶음. 파일이 없으면 해당 항목은 None."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+class ModelVersion:
+    """한 번 로드된 모델과 스케일러 쌍 (불변)"""
+
+    __slots__ = ("model", "scaler", "fingerprint", "loaded_at", "__weakref__")
+
+    def __init__(self, model, scaler, fingerprint):
+        self.model = model
+        self.scaler = scaler
+        self.fingerprint = fingerprint
+        self.loaded_at = time.time()
+
+    @property
+    def is_ready(self):
+        return self.model is not None and self.scaler is not None
+
+
+class ModelHandle:
+    """
+    경로별 현재 버전을 가리키는 핸들
+
+    current는 참조 하나를 바꾸는 방식으로 교체되므로, 사용하는 쪽은
+    요청마다 current를 한 번만 읽어 모델과 스케일러를 함께 사용하면 됩니다.
+    """
+
+    def __init__(self, model_path, scaler_path, framework, adapter_options):
+        self.model_path = model_path
+        self.scaler_path = scaler_path
+        self.framework = framework
+        self.adapter_options = dict(adapter_options or {})
+        self.current = None
+        self.generation = 0 # 버전이 교체될 때마다 1씩 증가
+        self._signature = None
+        self._failed_signature = None # 로드에 실패한 파일 상태 (바뀌기 전까지 다시 시도하지 않음)
+
+    def _swap(self, version, signature):
+        self.current = version
+        self.generation += 1
+        self._signature = signature
+
+
+class ModelRegistry:
+    """
+    모델 레지스트리
+
+    사용 예:
+        registry = ModelRegistry()
+        handle = registry.acquire(model_path, scaler_path, framework="numpy")
+        version = handle.current
+        registry.start_watching()
+    """
+
+    def __init__(self, poll_interval=DEFAULT_POLL_INTERVAL, settle_seconds=DEFAULT_SETTLE_SECONDS):
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+        # _handles, _versions, _load_locks 접근만 보호. 모델 로드(수 초)는 이 잠금 밖에서 수행
+        self._lock = threading.RLock()
+        self._handles = {}
+        # 버전 키별 로드 잠금: 같은 내용을 동시에 요청하면 한 번만 로드하고 나머지는 결과를 공유
+        self._load_locks = {}
+        # 내용 해시가 같은 버전은 경로가 달라도 공유. 어떤 핸들도 쓰지 않으면 자동으로 해제
+        self._versions = weakref.WeakValueDictionary()
+        self._watcher = None
+        self._stop_event = threading.Event()
+
+    def acquire(self, model_path, scaler_path, framework="tensorflow", adapter_options=None):
+        """
+        경로에 해당하는 핸들을 반환합니다. 처음 요청된 경로면 모델과 스케일러를 로드합니다.
+
+        Args:
+            model_path (str): 모델 파일 경로
+            scaler_path (str): 스케일러 파일 경로
+            framework (str): ML 프레임워크 이름
+            adapter_options (dict, optional): 어댑터 생성자 옵션 (로드 결과에 영향을 주므로 키에 포함)
+
+        Returns:
+            ModelHandle: current가 로드된 버전을 가리키는 핸들
+        """
+        model_path = os.path.realpath(model_path)
+        scaler_path = os.path.realpath(scaler_path)
+        key = (framework.lower(), _options_key(adapter_options), model_path, scaler_path)
+        with self._lock:
+            handle = self._handles.get(key)
+        if handle is not None:
+            return handle
+
+        # 전역 잠금 밖에서 로드하므로 다른 모델의 acquire, 감시 스레드가 이 로드를 기다리지 않음
+        handle = ModelHandle(model_path, scaler_path, framework, adapter_options)
+        signature = _stat_signature(model_path, scaler_path)
+        handle._swap(self._load_version(handle), signature)
+        with self._lock:
+            # 같은 경로를 동시에 요청했다면 먼저 등록된 핸들을 사용 (버전은 _load_version에서 공유됨)
+            return self._handles.setdefault(key, handle)
+
+    def _load_version(self, handle):
+        """핸들의 파일로 버전을 만듭니다. 내용이 같은 버전이 이미 있으면 재사용합니다."""
+        try:
+            fingerprint = file_fingerprint(handle.model_path, handle.scaler_path)
+        except OSError:
+            fingerprint = None # 파일이 없으면 공유하지 않고 아래에서 실패를 기록
+        if fingerprint is None:
+            return self._load_files(handle, None)
+        version_key = (handle.framework.lower(), _options_key(handle.adapter_options), fingerprint)
+        with self._lock:
+            version = self._versions.get(version_key)
+            if version is None:
+                load_lock = self._load_locks.setdefault(version_key, threading.Lock())
+        if version is not None:
+            logger.info(f"공유 모델 재사용: {handle.model_path} ({fingerprint[:12]})")
+            return version
+
+        with load_lock:
+            with self._lock:
+                version = self._versions.get(version_key)
+            if version is not None:
+                # 같은 내용을 먼저 요청한 스레드가 로드를 마침
+                logger.info(f"공유 모델 재사용: {handle.model_path} ({fingerprint[:12]})")
+                return version
+            version = self._load_files(handle, fingerprint)
+            with self._lock:
+                if version.is_ready:
+                    self._versions[version_key] = version
+                if self._load_locks.get(version_key) is load_lock:
+                    del self._load_locks[version_key]
+        return version
+
+    def _load_files(self, handle, fingerprint):
+        """어댑터로 모델과 스케일러 파일을 읽어 새 버전을 만듭니다 (잠금 없이 호출)."""
+        model = scaler = None
+        adapter = get_adapter(handle.framework, **handle.adapter_options)
+        # 어댑터(모델 계층)는 core를 임포트하지 않으므로 세부 단계 기록 함수를 넘겨 줌
+        adapter.phase_hook = phase
+        try:
+            # 프레임워크 임포트와 파일 로드를 따로 기록해 어느 쪽이 느려졌는지 구분
+            with phase("framework_import", framework=handle.framework):
+                adapter.import_framework()
+            with phase("load_model", framework=handle.framework):
+                model = adapter.load_model(handle.model_path)
+            logger.info(f"AI 모델 로드 성공: {handle.model_path}")
+        except Exception as e:
+            logger.error(f"AI 모델 로드 실패 ({handle.model_path}): {e}")
+
+        try:
+            with phase("load_scaler", framework=handle.framework):
+                scaler = adapter.load_scaler(handle.scaler_path)
+            logger.info(f"Scaler 로드 성공: {handle.scaler_path}")
+        except Exception as e:
+            logger.error(f"Scaler 로드 실패 ({handle.scaler_path}): {e}")
+
+        return ModelVersion(model, scaler, fingerprint)
+
+    def check_for_updates(self):
+        """
+        감시 중인 모든 파일을 확인하고, 내용이 바뀐 핸들의 버전을 교체합니다.
+
+        새 버전 로드에 실패하면 이전 버전을 유지하고, 파일이 다시 바뀔 때 재시도합니다.
+
+        Returns:
+            list: 버전이 교체된 ModelHandle 목록
+        """
+        with self._lock:
+            handles = list(self._handles.values())
+
+        reloaded = []
+        now = time.time()
+        for handle in handles:
+            signature = _stat_signature(handle.model_path, handle.scaler_path)
+            if signature in (handle._signature, handle._failed_signature) or None in signature:
+                continue
+            if any(now - mtime_ns / 1e9 < self.settle_seconds for mtime_ns, _ in signature):
+                continue # 아직 쓰는 중일 수 있으므로 다음 확인 때 로드
+
+            current = handle.current
+            try:
+                fingerprint = file_fingerprint(handle.model_path, handle.scaler_path)
+            except OSError as e:
+                logger.warning(f"모델 파일 확인 실패 ({handle.model_path}): {e}")
+                continue
+            if current is not None and fingerprint == current.fingerprint:
+                handle._signature = signature # 내용은 그대로 (touch 등)
+                continue
+
+            logger.info(f"모델 파일 변경 감지, 새 버전 로드: {handle.model_path}")
+            version = self._load_version(handle)
+            if not version.is_ready:
+                logger.warning(f"새 모델 버전을 로드하지 못해 이전 버전을 유지합니다: {handle.model_path}")
+                handle._failed_signature = signature
+                continue
+            with self._lock:
+                handle._swap(version, signature)
+            logger.info(f"모델 버전 교체 완료: {handle.model_path} ({fingerprint[:12]}, 세대 {handle.generation})")
+            reloaded.append(handle)
+        return reloaded
+
+    def start_watching(self, poll_interval=None):
+        """백그라운드 스레드에서 주기적으로 check_for_updates를 호출합니다."""
+        if poll_interval is not None:
+            self.poll_interval = poll_interval
+        with self._lock:
+            if self._watcher is not None:
+                return
+            self._stop_event.clear()
+            self._watcher = threading.Thread(target=self._watch, name="model-registry-watcher", daemon=True)
+            self._watcher.start()
+        logger.info(f"모델 파일 감시 시작: {self.poll_interval}s 간격")
+
+    def stop_watching(self):
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._stop_event.set()
+            watcher.join()
+
+    def _watch(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.check_for_updates()
+            except Exception as e:
+                logger.error(f"모델 파일 감시 중 오류: {e}", exc_info=True)
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def default_registry():
+    """프로세스 전체에서 공유하는 ModelRegistry를 반환합니다."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+        return _default_registry
@@ -0,0 +1,192 @@
+"""
+다중 프로세스 샤드 평가
+
+입력을 샤드로 나누어 여러 워커 프로세스에서 검증합니다. 각 워커는 초기화 시
+TriangleValidatorCore를 한 번만 만들고, 입력과 출력은 공유 메모리 버퍼를 통해
+주고받으므로 큰 NumPy 배열을 피클링하지 않습니다. 결과는 입력 순서대로 모입니다.
+"""
+
+import logging
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.results import BatchResult
+from core.triangle_validator_core import as_sides_array
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 65536
+
+# 워커 프로세스 시작 전에 설정하는 스레드 관련 환경 변수 (NumPy BLAS, OpenMP, TensorFlow)
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+class _SharedBuffers:
+    """입력(N×3 float64)과 출력(math bool, ai float64)용 공유 메모리 묶음"""
+
+    def __init__(self, capacity, names=None):
+        self.capacity = capacity
+        # 워커에서 연결(attach)한 세그먼트도 같은 resource_tracker에 등록되므로
+        # 부모가 unlink할 때 함께 정리됩니다 (spawn 자식은 부모의 tracker를 공유).
+        create = names is None
+        sizes = (capacity * 3 * 8, capacity, capacity * 8)
+        names = names or (None, None, None)
+        self.segments = [
+            shared_memory.SharedMemory(name=name, create=create, size=max(size, 1))
+            for name, size in zip(names, sizes)
+        ]
+        self.sides = np.ndarray((capacity, 3), dtype=np.float64, buffer=self.segments[0].buf)
+        self.math_result = np.ndarray((capacity,), dtype=np.bool_, buffer=self.segments[1].buf)
+        self.ai_prediction_value = np.ndarray((capacity,), dtype=np.float64, buffer=self.segments[2].buf)
+
+    @property
+    def names(self):
+        return tuple(segment.name for segment in self.segments)
+
+    def close(self, unlink=False):
+        # ndarray가 버퍼를 참조하고 있으면 close가 실패하므로 먼저 해제
+        self.sides = self.math_result = self.ai_prediction_value = None
+        for segment in self.segments:
+            segment.close()
+            if unlink:
+                segment.unlink()
+
+
+# 워커 프로세스 전역 상태
+_worker_core = None
+_worker_buffers = None
+
+
+def _init_worker(config):
+    """워커 프로세스 초기화: 스레드 예산을 적용하고 TriangleValidatorCore를 한 번만 생성합니다."""
+    global _worker_core
+    from core.triangle_validator_core import TriangleValidatorCore
+
+    if config["framework"] == "tensorflow":
+        from models.adapters.tf_adapter import configure_threads
+        configure_threads(config["intra_op_threads"], config["inter_op_threads"])
+
+    _worker_core = TriangleValidatorCore(model_path=config["model_path"], scaler_path=config["scaler_path"],
+                                         framework=config["framework"])
+    logger.info(f"샤드 워커 초기화 완료: pid={os.getpid()}")
+
+
+def _evaluate_shard(task):
+    """공유 메모리의 [start, end) 구간을 검증하고 결과를 같은 위치에 기록합니다."""
+    global _worker_buffers
+    names, capacity, start, end = task
+    if _worker_buffers is None or _worker_buffers.names != names:
+        if _worker_buffers is not None:
+            _worker_buffers.close()
+        _worker_buffers = _SharedBuffers(capacity, names=names)
+
+    results = _worker_core.validate_batch(_worker_buffers.sides[start:end])
+    _worker_buffers.math_result[start:end] = results["math_result"]
+    if results["ai_prediction_value"] is None:
+        return start, end, False
+    _worker_buffers.ai_prediction_value[start:end] = results["ai_prediction_value"]
+    return start, end, True
+
+
+class ShardedEvaluator:
+    """
+    프로세스 풀 기반 배치 평가기
+
+    사용 예:
+        with ShardedEvaluator(workers=4, framework="numpy") as evaluator:
+            results = evaluator.evaluate(sides)
+    """
+
+    def __init__(self, workers=None, framework="tensorflow", model_path=None, scaler_path=None,
+                 shard_size=DEFAULT_SHARD_SIZE, intra_op_threads=None, inter_op_threads=1):
+        """
+        Args:
+            workers (int, optional): 워커 프로세스 수. 기본값은 CPU 코어 수
+            shard_size (int): 워커 하나가 한 번에 처리하는 최대 행 수
+            intra_op_threads (int, optional): 워커당 연산 스레드 수.
+                기본값은 CPU 코어 수를 워커 수로 나눈 값 (최소 1)
+            inter_op_threads (int): 워커당 TensorFlow inter-op 스레드 수
+        """
+        cpu_count = os.cpu_count() or 1
+        self.workers = workers or cpu_count
+        self.shard_size = shard_size
+        self.intra_op_threads = intra_op_threads or max(1, cpu_count // self.workers)
+        self.inter_op_threads = inter_op_threads
+        self._buffers = None
+
+        config = {
+            "framework": framework,
+            "model_path": model_path,
+            "scaler_path": scaler_path,
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+        }
+        # TensorFlow는 fork 이후 안전하지 않으므로 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        # 자식 프로세스는 생성 시점의 환경 변수를 물려받으므로 풀 생성 동안만 스레드 수를 제한
+        saved_env = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+        os.environ.update({name: str(self.intra_op_threads) for name in THREAD_ENV_VARS})
+        try:
+            self._pool = context.Pool(self.workers, initializer=_init_worker, initargs=(config,))
+        finally:
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+        logger.info(f"ShardedEvaluator 시작: workers={self.workers}, intra_op={self.intra_op_threads}, "
+                    f"inter_op={self.inter_op_threads}")
+
+    def _ensure_capacity(self, n):
+        if self._buffers is not None and self._buffers.capacity >= n:
+            return self._buffers
+        if self._buffers is not None:
+            self._buffers.close(unlink=True)
+        self._buffers = _SharedBuffers(n)
+        return self._buffers
+
+    def evaluate(self, sides):
+        """
+        N×3 입력을 샤드로 나누어 워커에서 검증합니다.
+
+        Returns:
+            BatchResult: TriangleValidatorCore.validate_batch와 같은 형태의 결과
+        """
+        sides = as_sides_array(sides)
+        n = sides.shape[0]
+        buffers = self._ensure_capacity(n)
+        buffers.sides[:n] = sides
+
+        shard_size = max(1, min(self.shard_size, -(-n // self.workers))) if n else 1
+        tasks = [(buffers.names, buffers.capacity, start, min(start + shard_size, n))
+                 for start in range(0, n, shard_size)]
+        # 모든 샤드가 끝날 때까지 기다린 뒤 결과를 읽어야 하므로 먼저 리스트로 수집
+        shard_flags = [ok for _, _, ok in self._pool.imap_unordered(_evaluate_shard, tasks)]
+        has_ai = all(shard_flags)
+
+        if not has_ai and n:
+            logger.warning("일부 워커에서 AI 예측을 수행하지 못해 AI 결과를 생략합니다.")
+        # from_columns가 결과 배열로 복사하므로 공유 버퍼는 다음 호출에서 재사용 가능
+        return BatchResult.from_columns(sides, buffers.math_result[:n],
+                                        buffers.ai_prediction_value[:n] if has_ai else None)
+
+    # validate_batch와 같은 이름으로도 호출할 수 있도록 제공 (CLI 등에서 core 대신 사용)
+    validate_batch = evaluate
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._buffers is not None:
+            self._buffers.close(unlink=True)
+            self._buffers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
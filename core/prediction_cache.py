@@ -0,0 +1,247 @@
+"""
+AI 예측 결과 캐시
+
+세 변을 양자화한 값을 키로 사용합니다. 모델 입력도 정렬하는 경우(sort_key=True)에는
+순서만 다른 입력의 예측값이 같으므로 정렬된 세 변을 키로 사용해 순열끼리 캐시를 공유합니다.
+메모리 LRU 캐시와, 재시작 후에도 유지되는 선택적 SQLite 저장소를 제공합니다.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+# 기본 양자화 단위: 이 값보다 작은 차이는 같은 입력으로 취급
+DEFAULT_QUANTUM = 1e-6
+
+
+def file_fingerprint(*paths):
+    """파일 내용의 SHA-256 해시를 이어 붙여 하나의 지문(fingerprint)을 만듭니다."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _close_connection(conn):
+    """남은 쓰기를 커밋하고 연결을 닫습니다 (close 또는 저장소가 회수될 때 한 번 실행)."""
+    try:
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class SqlitePredictionStore:
+    """
+    예측 결과를 SQLite 파일에 저장하는 영구 캐시 계층
+
+    각 행은 모델/스케일러 지문과 함께 저장되고 조회도 지문별로 하므로, model.h5나 scaler.pkl이
+    바뀌면 이전 지문의 행은 사용되지 않습니다. 같은 파일을 다른 모델(핫 리로드 중 겹치는 프로세스,
+    다른 프레임워크)이 함께 쓸 수 있으므로 열 때 다른 지문의 행을 지우지 않습니다. 자신의 지문을
+    교체할 때 close(discard=True)로 이전 지문의 행을 지우고, 남은 행은 evict_other_fingerprints로 정리합니다.
+
+    close를 호출하지 않아도 저장소 객체가 회수되거나(핫 리로드로 교체된 캐시를 진행 중인 요청이
+    모두 놓았을 때) 프로세스가 종료되면 연결이 닫힙니다.
+    """
+
+    # 이 횟수만큼 쓰기가 쌓이면 커밋
+    COMMIT_EVERY = 64
+
+    def __init__(self, path, fingerprint):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        # ViewModel 워커 스레드 등 생성 스레드가 아닌 곳에서도 사용하므로 잠금으로 보호
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            "fingerprint TEXT NOT NULL, sides TEXT NOT NULL, value REAL NOT NULL, "
+            "PRIMARY KEY (fingerprint, sides))"
+        )
+        self._conn.commit()
+        # atexit.register(self.close)는 인스턴스를 끝까지 붙잡으므로 self를 참조하지 않는 finalizer 사용
+        self._finalizer = weakref.finalize(self, _close_connection, self._conn)
+
+    @staticmethod
+    def _encode(sides_key):
+        return ":".join(str(v) for v in sides_key)
+
+    def get(self, sides_key):
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT value FROM predictions WHERE fingerprint = ? AND sides = ?",
+                (self.fingerprint, self._encode(sides_key)),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, sides_key, value):
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO predictions (fingerprint, sides, value) VALUES (?, ?, ?)",
+                (self.fingerprint, self._encode(sides_key), float(value)),
+            )
+            self._pending_writes += 1
+            if self._pending_writes >= self.COMMIT_EVERY:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def __len__(self):
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM predictions WHERE fingerprint = ?", (self.fingerprint,)
+            ).fetchone()[0]
+
+    def flush(self):
+        with self._lock:
+            if self._conn is not None and self._pending_writes:
+                self._conn.commit()
+                self._pending_writes = 0
+
+    def evict_other_fingerprints(self):
+        """
+        이 저장소의 지문이 아닌 행을 모두 삭제합니다.
+
+        같은 파일을 쓰는 다른 모델의 캐시도 지워지므로, 이 파일을 쓰는 프로세스가 모두 같은 모델로
+        전환된 뒤 실행하는 정리 단계입니다.
+
+        Returns:
+            int: 삭제한 행 수
+        """
+        with self._lock:
+            if self._conn is None:
+                return 0
+            deleted = self._conn.execute(
+                "DELETE FROM predictions WHERE fingerprint != ?", (self.fingerprint,)
+            ).rowcount
+            self._conn.commit()
+            self._pending_writes = 0
+        if deleted:
+            logger.info(f"다른 모델의 영구 캐시 {deleted}건 삭제: {self.path}")
+        return deleted
+
+    def close(self, discard=False):
+        """
+        연결을 닫습니다.
+
+        Args:
+            discard (bool): True이면 닫기 전에 이 지문의 행을 삭제 (이 인스턴스가 지문을 교체할 때)
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            if discard:
+                deleted = self._conn.execute(
+                    "DELETE FROM predictions WHERE fingerprint = ?", (self.fingerprint,)
+                ).rowcount
+                logger.info(f"교체된 모델의 영구 캐시 {deleted}건 삭제: {self.path}")
+            self._conn = None
+            self._finalizer()
+
+
+class PredictionCache:
+    """
+    LRU 예측 캐시
+
+    키는 (모델/스케일러 지문, 양자화된 세 변)이며, sort_key=True이면 세 변을 정렬해
+    순서만 다른 입력이 같은 키를 갖습니다 (순열 무관).
+    persistent_path를 지정하면 메모리에서 찾지 못한 키를 SQLite 저장소에서 다시 찾습니다.
+    """
+
+    def __init__(self, max_size=4096, fingerprint="", quantum=DEFAULT_QUANTUM, persistent_path=None, sort_key=True):
+        if max_size <= 0:
+            raise ValueError(f"max_size는 0보다 커야 합니다: {max_size}")
+        self.max_size = max_size
+        self.fingerprint = fingerprint
+        self.quantum = quantum
+        self.sort_key = sort_key
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.persistent_hits = 0
+        self.store = None
+        if persistent_path:
+            directory = os.path.dirname(os.path.abspath(persistent_path))
+            os.makedirs(directory, exist_ok=True)
+            self.store = SqlitePredictionStore(persistent_path, fingerprint)
+
+    def make_key(self, a, b, c):
+        """세 변을 양자화해 키를 만듭니다. sort_key이면 정렬해 순서와 무관한 키가 됩니다."""
+        quantum = self.quantum
+        key = (round(a / quantum), round(b / quantum), round(c / quantum))
+        return tuple(sorted(key)) if self.sort_key else key
+
+    def get(self, key):
+        """캐시된 예측값을 반환합니다. 없으면 None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        if self.store is not None:
+            value = self.store.get(key)
+            if value is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.persistent_hits += 1
+                    self._insert(key, value)
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """예측값을 저장합니다. 가장 오래 사용되지 않은 항목부터 내보냅니다."""
+        with self._lock:
+            self._insert(key, value)
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def _insert(self, key, value):
+        # 호출자가 self._lock을 잡고 있어야 함
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """hit/miss/eviction 카운터와 현재 크기를 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "persistent_hits": self.persistent_hits,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self, discard=False):
+        if self.store is not None:
+            self.store.close(discard=discard)
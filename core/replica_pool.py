@@ -0,0 +1,71 @@
+"""
+모델 복제본 풀
+
+여러 스레드가 동시에 검증을 요청할 때 각 요청이 복제본 하나를 빌려 쓰고 돌려주도록 합니다.
+복제본 수가 동시에 실행되는 모델 호출 수의 상한이 되므로, 호출 스레드가 늘어나도
+프레임워크 내부 연산 스레드가 CPU를 과다 구독하지 않고 처리량이 일정하게 유지됩니다.
+"""
+
+import contextlib
+import logging
+import queue
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaPool:
+    """
+    모델 복제본 풀
+
+    사용 예:
+        pool = ReplicaPool.create(adapter, model, replicas=4)
+        with pool.acquire() as replica:
+            adapter.predict(replica, sides, scaler=scaler)
+    """
+
+    def __init__(self, models):
+        if not models:
+            raise ValueError("복제본이 하나 이상 필요합니다.")
+        self.size = len(models)
+        # 최근에 반납된 복제본을 먼저 사용 (CPU 캐시에 남아 있을 가능성이 높음)
+        self._available = queue.LifoQueue()
+        for model in models:
+            self._available.put(model)
+
+    @classmethod
+    def create(cls, adapter, model, replicas):
+        """
+        model과 adapter.clone_model로 만든 복제본으로 풀을 만듭니다.
+
+        Args:
+            adapter (MLModelAdapter): 복제에 사용할 어댑터
+            model (object): 로드된 원본 모델 (풀의 첫 번째 복제본으로 사용)
+            replicas (int): 전체 복제본 수
+
+        Returns:
+            ReplicaPool: 생성된 풀
+        """
+        models = [model] + [adapter.clone_model(model) for _ in range(replicas - 1)]
+        logger.info(f"모델 복제본 풀 생성: {replicas}개 ({adapter.get_framework_name()})")
+        return cls(models)
+
+    @contextlib.contextmanager
+    def acquire(self, timeout=None):
+        """
+        복제본 하나를 빌립니다. 모두 사용 중이면 반납될 때까지 기다립니다.
+
+        Raises:
+            TimeoutError: timeout(초) 안에 복제본을 빌리지 못한 경우
+        """
+        try:
+            model = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"{timeout}s 안에 사용 가능한 모델 복제본이 없습니다.") from None
+        try:
+            yield model
+        finally:
+            self._available.put(model)
+
+    def available(self):
+        """현재 빌릴 수 있는 복제본 수 (근사값)"""
+        return self._available.qsize()
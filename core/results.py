@@ -0,0 +1,185 @@
+"""
+검증 결과 타입
+
+단일 검증은 __slots__ 기반 ValidationResult, 배치 검증은 NumPy 구조화 배열(structured array)
+하나에 모든 행을 담는 BatchResult로 반환합니다. 배치 결과는 행마다 Python 객체를 만들지 않고
+잘라내기(slice), 필터링, .npy 저장, 열 단위 버퍼 추출을 할 수 있습니다.
+
+두 타입 모두 기존 dict 결과와 같은 키로 인덱싱할 수 있습니다 (result["math_result"]).
+"""
+
+import numpy as np
+
+RESULT_FIELDS = ("sides", "math_result", "ai_prediction_value", "is_valid_by_ai", "is_consistent")
+AI_FIELDS = ("ai_prediction_value", "is_valid_by_ai", "is_consistent")
+
+# 행 하나: 세 변(float64×3) + 수학 결과 + AI 예측값 + AI 판정 + 일치 여부 (35 bytes, 패딩 없음)
+RESULT_DTYPE = np.dtype([
+    ("sides", np.float64, (3,)),
+    ("math_result", np.bool_),
+    ("ai_prediction_value", np.float64),
+    ("is_valid_by_ai", np.bool_),
+    ("is_consistent", np.bool_),
+])
+
+
+class ValidationResult:
+    """
+    단일 삼각형 검증 결과
+
+    AI 예측을 수행하지 못했으면 AI 관련 필드는 None입니다.
+    """
+
+    __slots__ = RESULT_FIELDS
+
+    def __init__(self, sides, math_result, ai_prediction_value=None, is_valid_by_ai=None, is_consistent=None):
+        self.sides = sides # (a, b, c) float 튜플
+        self.math_result = math_result
+        self.ai_prediction_value = ai_prediction_value
+        self.is_valid_by_ai = is_valid_by_ai
+        self.is_consistent = is_consistent
+
+    def __getitem__(self, key):
+        # 기존 dict 결과와의 호환: result["math_result"]
+        if key not in RESULT_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def keys(self):
+        return RESULT_FIELDS
+
+    def to_dict(self):
+        """JSON 직렬화 등에 사용할 dict (sides는 리스트)"""
+        return {
+            "sides": list(self.sides),
+            "math_result": self.math_result,
+            "ai_prediction_value": self.ai_prediction_value,
+            "is_valid_by_ai": self.is_valid_by_ai,
+            "is_consistent": self.is_consistent,
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, ValidationResult):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == {key: (list(value) if key == "sides" else value) for key, value in other.items()}
+        return NotImplemented
+
+    def __repr__(self):
+        return (f"ValidationResult(sides={self.sides}, math_result={self.math_result}, "
+                f"ai_prediction_value={self.ai_prediction_value}, is_valid_by_ai={self.is_valid_by_ai}, "
+                f"is_consistent={self.is_consistent})")
+
+
+class BatchResult:
+    """
+    N개 삼각형의 검증 결과 (RESULT_DTYPE 구조화 배열 기반)
+
+    result["math_result"]처럼 필드 이름으로 열(column)을 꺼내고, result[i]로 한 행을
+    ValidationResult로, result[mask] 또는 result[a:b]로 부분 결과를 얻습니다.
+    has_ai가 False이면 AI 관련 열은 None을 반환합니다. has_ai가 True여도 ai_prediction_value가 NaN인 행
+    (행마다 표본을 고른 배치에서 AI 평가를 건너뛴 행)은 AI 결과가 없는 행으로 취급합니다.
+    """
+
+    __slots__ = ("data", "has_ai")
+
+    def __init__(self, data, has_ai):
+        self.data = data
+        self.has_ai = has_ai
+
+    @classmethod
+    def from_columns(cls, sides, math_result, ai_prediction_value=None):
+        """
+        열 배열로 결과를 만듭니다. is_valid_by_ai, is_consistent는 ai_prediction_value에서 계산합니다.
+
+        Args:
+            sides (numpy.ndarray): (N, 3) 입력
+            math_result (numpy.ndarray): (N,) 수학 검증 결과
+            ai_prediction_value (numpy.ndarray, optional): (N,) AI 예측값. None이면 AI 열은 비어 있음
+        """
+        data = np.empty(len(math_result), dtype=RESULT_DTYPE)
+        data["sides"] = sides
+        data["math_result"] = math_result
+        if ai_prediction_value is None:
+            data["ai_prediction_value"] = np.nan
+            data["is_valid_by_ai"] = False
+            data["is_consistent"] = False
+        else:
+            data["ai_prediction_value"] = ai_prediction_value
+            data["is_valid_by_ai"] = data["ai_prediction_value"] > 0.5
+            data["is_consistent"] = data["math_result"] == data["is_valid_by_ai"]
+        return cls(data, ai_prediction_value is not None)
+
+    @classmethod
+    def load(cls, path):
+        """save로 저장한 .npy 파일을 읽습니다 (mmap으로 열어 필요한 부분만 읽음)."""
+        data = np.load(path, mmap_mode="r", allow_pickle=False)
+        if data.dtype != RESULT_DTYPE:
+            raise ValueError(f"검증 결과 파일 형식이 아닙니다: {data.dtype}")
+        return cls(data, not np.isnan(data["ai_prediction_value"]).all() if len(data) else True)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in RESULT_FIELDS:
+                raise KeyError(key)
+            if key in AI_FIELDS and not self.has_ai:
+                return None
+            return self.data[key]
+        if isinstance(key, (int, np.integer)):
+            return self.row(key)
+        # 슬라이스, 불리언 마스크, 인덱스 배열
+        return BatchResult(self.data[key], self.has_ai)
+
+    def keys(self):
+        return RESULT_FIELDS
+
+    def row(self, index):
+        """index번째 행을 ValidationResult로 반환합니다."""
+        record = self.data[index]
+        sides = tuple(float(value) for value in record["sides"])
+        if not self.has_ai or np.isnan(record["ai_prediction_value"]):
+            return ValidationResult(sides, bool(record["math_result"]))
+        return ValidationResult(sides, bool(record["math_result"]), float(record["ai_prediction_value"]),
+                                bool(record["is_valid_by_ai"]), bool(record["is_consistent"]))
+
+    def filter(self, mask):
+        """mask가 True인 행만 담은 BatchResult를 반환합니다."""
+        return BatchResult(self.data[np.asarray(mask, dtype=bool)], self.has_ai)
+
+    def inconsistent(self):
+        """AI와 수학 판정이 다른 행만 반환합니다. AI 결과가 없으면 빈 결과."""
+        if not self.has_ai:
+            return self.filter(np.zeros(len(self), dtype=bool))
+        return self.filter(~self.data["is_consistent"] & ~np.isnan(self.data["ai_prediction_value"]))
+
+    def save(self, path):
+        """구조화 배열 그대로 .npy 파일에 저장합니다."""
+        np.save(path, np.ascontiguousarray(self.data), allow_pickle=False)
+
+    def columns(self):
+        """
+        필드별로 연속된(contiguous) 배열을 반환합니다.
+
+        구조화 배열의 열은 행 간격(stride)이 있는 뷰이므로, Arrow 등 열 지향 버퍼가 필요한
+        곳에는 이 결과를 사용합니다. AI 결과가 없으면 AI 열은 None입니다.
+        """
+        return {name: (np.ascontiguousarray(self[name]) if self[name] is not None else None)
+                for name in RESULT_FIELDS}
+
+    def to_arrow(self):
+        """pyarrow.Table로 변환합니다 (pyarrow가 설치된 경우)."""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow에는 pyarrow가 필요합니다: pip install pyarrow") from e
+        columns = self.columns()
+        sides = columns.pop("sides")
+        arrays = {"a": sides[:, 0], "b": sides[:, 1], "c": sides[:, 2]}
+        arrays.update({name: values for name, values in columns.items() if values is not None})
+        return pa.table(arrays)
+
+    def __repr__(self):
+        return f"BatchResult(rows={len(self)}, has_ai={self.has_ai})"
@@ -0,0 +1,194 @@
+"""
+섀도(shadow) AI 평가
+
+요청 경로에서는 수학 판정만 반환하고, AI 예측은 백그라운드 스레드에서 모아서(배치)
+실행합니다. AI 판정과 수학 판정의 일치 여부는 누적 통계(stats())와 PipelineMetrics의
+ai_predictions / disagreements 카운터에 기록되어 요청 지연 없이 모델 품질을 계속 감시할 수 있습니다.
+
+대기 중인 행이 max_pending을 넘으면 새 행은 버리고(dropped) 요청은 막지 않습니다.
+"""
+
+import collections
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 4096 # 한 번에 평가하는 최대 행 수
+DEFAULT_MAX_DELAY = 0.05 # 첫 행이 들어온 뒤 배치를 채우기 위해 기다리는 최대 시간 (초)
+DEFAULT_MAX_PENDING = 65536 # 대기 중인 최대 행 수 (넘으면 버림)
+DEFAULT_RECENT_DISAGREEMENTS = 20 # 보관할 최근 불일치 예시 수
+
+
+def _row_count(sides):
+    """submit에 넘긴 sides의 행 수 ((N, 3) 배열이면 N, 세 변 하나면 1)"""
+    return len(sides) if isinstance(sides, np.ndarray) and sides.ndim == 2 else 1
+
+
+class ShadowEvaluator:
+    """
+    백그라운드 배치 AI 평가기
+
+    사용 예:
+        shadow = ShadowEvaluator(core.validate_batch_by_ai, metrics=core.metrics)
+        shadow.submit((3, 4, 5), True)
+        shadow.stats()
+    """
+
+    def __init__(self, predict_batch, metrics=None, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY,
+                 max_pending=DEFAULT_MAX_PENDING, recent_disagreements=DEFAULT_RECENT_DISAGREEMENTS):
+        """
+        Args:
+            predict_batch (callable): (N, 3) 배열을 받아 (N,) 예측값 (실패 시 None)을 반환하는 함수
+            metrics (PipelineMetrics, optional): ai_predictions / disagreements를 기록할 계측 객체
+            max_batch (int): 한 번에 평가하는 최대 행 수
+            max_delay (float): 배치를 채우기 위해 기다리는 최대 시간 (초)
+            max_pending (int): 대기 중인 최대 행 수
+            recent_disagreements (int): 보관할 최근 불일치 예시 수
+        """
+        self.predict_batch = predict_batch
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self._queue = queue.SimpleQueue()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._submitted = 0
+        self._dropped = 0
+        self._evaluated = 0
+        self._disagreements = 0
+        self._failed = 0
+        self._recent = collections.deque(maxlen=recent_disagreements)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="triangle-shadow", daemon=True)
+        self._thread.start()
+
+    def submit(self, sides, math_result):
+        """
+        삼각형 하나 또는 여러 개를 평가 대기열에 넣습니다 (즉시 반환).
+
+        Args:
+            sides: 세 변 (a, b, c) 또는 (N, 3) 배열
+            math_result: 수학 판정 (bool 또는 (N,) bool 배열)
+
+        Returns:
+            bool: 대기열에 넣었으면 True, 대기 행이 너무 많거나 종료되어 버렸으면 False
+        """
+        rows = _row_count(sides)
+        with self._condition:
+            self._submitted += rows
+            if self._closed or self._pending + rows > self.max_pending:
+                self._dropped += rows
+                return False
+            self._pending += rows
+        self._queue.put((sides, math_result))
+        return True
+
+    def _collect(self):
+        """첫 항목을 기다린 뒤 max_delay 안에 들어온 항목을 max_batch행까지 모읍니다."""
+        item = self._queue.get()
+        if item is None:
+            return None
+        items = [item]
+        rows = _row_count(item[0])
+        deadline = time.monotonic() + self.max_delay
+        while rows < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None) # 현재 배치를 처리한 뒤 종료하도록 되돌려 둠
+                break
+            items.append(item)
+            rows += _row_count(item[0])
+        return items
+
+    def _run(self):
+        while True:
+            items = self._collect()
+            if items is None:
+                return
+            sides = np.vstack([np.asarray(item[0], dtype=np.float64).reshape(-1, 3) for item in items])
+            math_result = np.concatenate([np.asarray(item[1], dtype=bool).reshape(-1) for item in items])
+            try:
+                self._evaluate(sides, math_result)
+            except Exception as e:
+                # 섀도 평가는 요청에 영향을 주지 않아야 하므로 오류는 기록만 함
+                logger.error(f"섀도 AI 평가 실패: {len(sides)}건: {e}", exc_info=True)
+                with self._condition:
+                    self._failed += len(sides)
+            finally:
+                with self._condition:
+                    self._pending -= len(sides)
+                    self._condition.notify_all()
+
+    def _evaluate(self, sides, math_result):
+        predictions = self.predict_batch(sides)
+        if predictions is None:
+            with self._condition:
+                self._failed += len(sides)
+            return
+        predictions = np.asarray(predictions, dtype=np.float64)
+        disagree = (predictions > 0.5) != math_result
+        count = int(np.count_nonzero(disagree))
+        with self._condition:
+            self._evaluated += len(sides)
+            self._disagreements += count
+            for index in np.flatnonzero(disagree)[-self._recent.maxlen:]:
+                self._recent.append({
+                    "sides": sides[index].tolist(),
+                    "ai_prediction_value": float(predictions[index]),
+                    "math_result": bool(math_result[index]),
+                })
+        if self.metrics is not None:
+            # 검증 건수는 요청 경로에서 이미 기록했으므로 AI 예측/불일치만 추가
+            self.metrics.record_results(0, len(sides), count)
+
+    def wait_idle(self, timeout=None):
+        """
+        대기 중인 행이 모두 평가될 때까지 기다립니다 (테스트/종료 처리용).
+
+        Returns:
+            bool: 시간 안에 모두 평가되었으면 True
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def stats(self):
+        """
+        섀도 평가 통계를 반환합니다.
+
+        Returns:
+            dict: submitted, dropped, pending, evaluated, failed, disagreements,
+                consistent_rate (평가된 행 중 AI와 수학 판정이 같은 비율), recent_disagreements
+        """
+        with self._condition:
+            evaluated = self._evaluated
+            return {
+                "submitted": self._submitted,
+                "dropped": self._dropped,
+                "pending": self._pending,
+                "evaluated": evaluated,
+                "failed": self._failed,
+                "disagreements": self._disagreements,
+                "consistent_rate": 1.0 - self._disagreements / evaluated if evaluated else None,
+                "recent_disagreements": list(self._recent),
+            }
+
+    def close(self, timeout=None):
+        """남은 행을 평가한 뒤 백그라운드 스레드를 종료합니다."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
@@ -0,0 +1,249 @@
+"""
+헤드리스 모델 학습
+
+노트북(notebooks/AI-Triangle-Validator.ipynb) 없이 TriangleValidatorCore가 사용하는
+model.h5 + scaler.pkl 쌍을 만듭니다.
+
+학습 데이터는 NumPy 벡터 연산으로 청크 단위로 생성하고 라벨은 validate_by_math와 같은
+triangle_mask 규칙으로 붙입니다. 청크는 tf.data 파이프라인에서 병렬로 생성되고 미리 읽어
+(prefetch) 두므로, 수억 개의 샘플도 메모리에는 몇 개의 청크만 올라갑니다.
+각 청크는 (seed, 학습/검증, 청크 번호)로 만든 난수 생성기를 사용하므로 생성 순서나
+병렬도와 관계없이 같은 seed면 같은 데이터가 만들어집니다.
+"""
+
+import logging
+import math
+import os
+import time
+
+import numpy as np
+
+from core.profiling import phase
+from core.triangle_validator_core import triangle_mask
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOW = 1.0
+DEFAULT_HIGH = 100.0
+DEFAULT_SAMPLES = 2_000_000
+DEFAULT_VALIDATION_SAMPLES = 200_000
+DEFAULT_EPOCHS = 8
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_CHUNK_SIZE = 65536 # 생성 단위 (샘플 수)
+DEFAULT_EDGE_FRACTION = 0.3 # 삼각형 경계 근처에 모아 생성하는 샘플 비율
+# 경계 근처 샘플의 (두 변의 합 - 나머지 변) 범위: ±(high - low) × EDGE_MARGIN
+EDGE_MARGIN = 0.05
+DEFAULT_SEED = 42
+
+TRAIN_STREAM = 0
+VALIDATION_STREAM = 1
+
+
+def chunk_rng(seed, stream, index):
+    """(seed, 학습/검증 구분, 청크 번호)별로 독립적인 난수 생성기"""
+    return np.random.default_rng([seed, stream, index])
+
+
+def generate_samples(rng, size, low=DEFAULT_LOW, high=DEFAULT_HIGH, edge_fraction=DEFAULT_EDGE_FRACTION,
+                     sort_inputs=False):
+    """
+    세 변 샘플과 라벨을 한 번에 생성합니다.
+
+    [low, high] 균등 분포에서 뽑은 세 변은 약 절반이 삼각형이 되므로 클래스가 거의 균형을 이룹니다.
+    여기에 edge_fraction만큼은 두 변의 합이 나머지 변과 거의 같은(삼각 부등식 경계 근처) 샘플을
+    섞어 모델이 경계를 세밀하게 학습하도록 합니다.
+
+    Args:
+        rng (numpy.random.Generator): 난수 생성기
+        size (int): 샘플 수
+        low, high (float): 변 길이 범위
+        edge_fraction (float): 경계 근처 샘플 비율 (0~1)
+        sort_inputs (bool): True이면 각 행의 세 변을 정렬 (sort_model_input=True로 사용할 모델용)
+
+    Returns:
+        tuple: ((size, 3) float64 세 변, (size,) bool 라벨)
+    """
+    sides = rng.uniform(low, high, size=(size, 3))
+    edge_count = int(round(size * edge_fraction))
+    if edge_count > 0:
+        # 가장 긴 변 c를 먼저 뽑고, a + b = c + margin 이 되도록 나눈 뒤 세 변의 순서를 섞음
+        margin = rng.uniform(-EDGE_MARGIN, EDGE_MARGIN, edge_count) * (high - low)
+        longest = rng.uniform(2 * low + EDGE_MARGIN * (high - low), high, edge_count)
+        total = longest + margin
+        a = low + rng.uniform(0.0, 1.0, edge_count) * (total - 2 * low)
+        edge = np.column_stack([a, total - a, longest])
+        np.clip(edge, low, high, out=edge)
+        sides[:edge_count] = rng.permuted(edge, axis=1)
+        # 경계 샘플이 청크 앞쪽에 몰리지 않도록 행 순서를 섞음
+        sides = sides[rng.permutation(size)]
+    if sort_inputs:
+        sides.sort(axis=1)
+    # 라벨은 실제 값(클리핑 이후)으로 다시 계산하므로 항상 수학 판정과 일치
+    return sides, triangle_mask(sides)
+
+
+def fit_scaler(low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """
+    생성 범위 [low, high]에 맞춘 MinMaxScaler를 반환합니다.
+
+    데이터 범위를 미리 알고 있으므로 전체 데이터를 한 번 더 읽지 않고 범위 양 끝으로 바로 학습합니다.
+    """
+    from sklearn.preprocessing import MinMaxScaler
+
+    return MinMaxScaler().fit(np.array([[low] * 3, [high] * 3], dtype=np.float64))
+
+
+def make_dataset(scaler, num_samples, stream=TRAIN_STREAM, seed=DEFAULT_SEED, batch_size=DEFAULT_BATCH_SIZE,
+                 chunk_size=DEFAULT_CHUNK_SIZE, low=DEFAULT_LOW, high=DEFAULT_HIGH,
+                 edge_fraction=DEFAULT_EDGE_FRACTION, sort_inputs=False):
+    """
+    청크 단위로 생성하는 tf.data.Dataset을 만듭니다.
+
+    청크는 병렬로 생성되지만 순서는 고정(deterministic)이며, 각 청크의 샘플은 이미 무작위이므로
+    별도의 셔플 버퍼를 두지 않습니다.
+
+    Returns:
+        tf.data.Dataset: (스케일된 float32 (batch, 3), float32 (batch, 1) 라벨) 배치
+    """
+    import tensorflow as tf
+
+    num_chunks = math.ceil(num_samples / chunk_size)
+
+    def load_chunk(index):
+        index = int(index)
+        size = min(chunk_size, num_samples - index * chunk_size)
+        sides, labels = generate_samples(chunk_rng(seed, stream, index), size, low, high, edge_fraction, sort_inputs)
+        return scaler.transform(sides).astype(np.float32), labels.astype(np.float32).reshape(-1, 1)
+
+    def load_chunk_tensors(index):
+        features, labels = tf.numpy_function(load_chunk, [index], (tf.float32, tf.float32))
+        features.set_shape((None, 3))
+        labels.set_shape((None, 1))
+        return features, labels
+
+    return (tf.data.Dataset.range(num_chunks)
+            .map(load_chunk_tensors, num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
+            .flat_map(lambda features, labels: tf.data.Dataset.from_tensor_slices((features, labels)).batch(batch_size))
+            .prefetch(tf.data.AUTOTUNE))
+
+
+def build_model(learning_rate=0.001):
+    """노트북과 같은 구조의 Sequential 모델 (NumpyAdapter로도 읽을 수 있는 Dense/Dropout 레이어만 사용)"""
+    import tensorflow as tf
+    from tensorflow.keras import layers, models
+
+    model = models.Sequential([
+        layers.Input(shape=(3,)),
+        layers.Dense(128, activation="relu"),
+        layers.Dropout(0.2),
+        layers.Dense(64, activation="relu"),
+        layers.Dropout(0.2),
+        layers.Dense(32, activation="relu"),
+        layers.Dense(1, activation="sigmoid"),
+    ])
+    model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=learning_rate),
+                  loss="binary_crossentropy", metrics=["accuracy"])
+    return model
+
+
+def _throughput_callback(samples_per_epoch, epochs_report):
+    """에포크마다 소요 시간과 처리량을 epochs_report에 추가하는 Keras 콜백"""
+    import tensorflow as tf
+
+    class ThroughputCallback(tf.keras.callbacks.Callback):
+        def on_epoch_begin(self, epoch, logs=None):
+            self._started = time.perf_counter()
+
+        def on_epoch_end(self, epoch, logs=None):
+            seconds = time.perf_counter() - self._started
+            entry = {
+                "epoch": epoch + 1,
+                "seconds": seconds,
+                "samples_per_second": samples_per_epoch / seconds if seconds > 0 else 0.0,
+            }
+            entry.update({key: float(value) for key, value in (logs or {}).items()})
+            epochs_report.append(entry)
+            logger.info(f"에포크 {entry['epoch']}: {seconds:.1f}s, {entry['samples_per_second']:,.0f} samples/s, "
+                        f"loss={entry.get('loss', float('nan')):.4f}, val_accuracy={entry.get('val_accuracy', float('nan')):.4f}")
+
+    return ThroughputCallback()
+
+
+def _replace_atomically(save, path):
+    """임시 파일에 저장한 뒤 교체하여 핫 리로드 감시자가 쓰다 만 파일을 읽지 않도록 합니다."""
+    directory, name = os.path.split(path)
+    stem, extension = os.path.splitext(name)
+    # Keras는 확장자로 저장 형식을 정하므로 임시 파일도 같은 확장자를 사용
+    partial_path = os.path.join(directory, f".{stem}.partial{extension}")
+    save(partial_path)
+    os.replace(partial_path, path)
+
+
+def train(output_dir, samples=DEFAULT_SAMPLES, validation_samples=DEFAULT_VALIDATION_SAMPLES, epochs=DEFAULT_EPOCHS,
+          batch_size=DEFAULT_BATCH_SIZE, chunk_size=DEFAULT_CHUNK_SIZE, seed=DEFAULT_SEED, low=DEFAULT_LOW,
+          high=DEFAULT_HIGH, edge_fraction=DEFAULT_EDGE_FRACTION, sort_inputs=False, learning_rate=0.001,
+          deterministic=False, model_name="model.h5", scaler_name="scaler.pkl"):
+    """
+    합성 데이터로 모델을 학습하고 output_dir에 model.h5와 scaler.pkl을 저장합니다.
+
+    Args:
+        output_dir (str): 저장 디렉터리 (없으면 생성)
+        samples (int): 에포크당 학습 샘플 수
+        validation_samples (int): 검증 샘플 수 (0이면 검증하지 않음)
+        epochs (int): 에포크 수
+        batch_size (int): 학습 배치 크기
+        chunk_size (int): 데이터 생성 청크 크기
+        seed (int): 데이터 생성과 가중치 초기화에 쓰는 시드
+        low, high (float): 변 길이 범위
+        edge_fraction (float): 삼각 부등식 경계 근처 샘플 비율
+        sort_inputs (bool): 정렬된 세 변으로 학습 (TriangleValidatorCore(sort_model_input=True)용)
+        learning_rate (float): Adam 학습률
+        deterministic (bool): True이면 TensorFlow 연산도 결정적으로 실행 (느려질 수 있음)
+        model_name, scaler_name (str): 저장 파일 이름
+
+    Returns:
+        dict: 저장 경로, 에포크별 시간/처리량/손실/정확도, 전체 소요 시간
+    """
+    started = time.perf_counter()
+    import joblib
+    with phase("tensorflow_import"):
+        import tensorflow as tf
+
+    tf.keras.utils.set_random_seed(seed)
+    if deterministic:
+        tf.config.experimental.enable_op_determinism()
+    os.makedirs(output_dir, exist_ok=True)
+
+    scaler = fit_scaler(low, high)
+    data_options = dict(seed=seed, batch_size=batch_size, chunk_size=chunk_size, low=low, high=high,
+                        edge_fraction=edge_fraction, sort_inputs=sort_inputs)
+    train_dataset = make_dataset(scaler, samples, stream=TRAIN_STREAM, **data_options)
+    validation_dataset = None
+    if validation_samples > 0:
+        validation_dataset = make_dataset(scaler, validation_samples, stream=VALIDATION_STREAM, **data_options)
+
+    model = build_model(learning_rate)
+    epochs_report = []
+    logger.info(f"학습 시작: 샘플 {samples:,}개 × {epochs} 에포크, 배치 {batch_size}, seed={seed}")
+    with phase("train_fit"):
+        model.fit(train_dataset, epochs=epochs, validation_data=validation_dataset, verbose=0,
+                  callbacks=[_throughput_callback(samples, epochs_report)])
+
+    model_path = os.path.join(output_dir, model_name)
+    scaler_path = os.path.join(output_dir, scaler_name)
+    # 스케일러를 먼저 교체: 새 모델이 이전 스케일러와 함께 로드되는 구간을 없앰
+    _replace_atomically(lambda path: joblib.dump(scaler, path), scaler_path)
+    _replace_atomically(model.save, model_path)
+    logger.info(f"모델 저장 완료: {model_path}, {scaler_path}")
+
+    train_seconds = sum(entry["seconds"] for entry in epochs_report)
+    return {
+        "model_path": model_path,
+        "scaler_path": scaler_path,
+        "seed": seed,
+        "samples": samples,
+        "validation_samples": validation_samples,
+        "epochs": epochs_report,
+        "samples_per_second": samples * len(epochs_report) / train_seconds if train_seconds > 0 else 0.0,
+        "total_seconds": time.perf_counter() - started,
+    }
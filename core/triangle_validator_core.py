@@ -1,10 +1,24 @@
 import numpy as np
 # import tensorflow as tf # 어댑터를 통해 사용
 import os
+import random
 import sys
+import time
+import threading
+import contextlib
 import logging # 로깅 모듈 임포트
 from models.adapters import get_adapter # 어댑터 임포트
-import joblib # scaler 로드를 위해 추가
+# joblib(scaler 로드)과 TensorFlow는 임포트 비용이 크므로 load_models에서 처음 필요할 때 임포트
+# asyncio, concurrent.futures도 시작 시간(첫 수학 검증까지)에 포함되지 않도록 avalidate에서 임포트
+from core.prediction_cache import PredictionCache, DEFAULT_QUANTUM
+from core.model_registry import default_registry
+from core.lookup_table import PredictionLUT
+from core.cascade import CascadeFirstStage, DEFAULT_HOLDOUT as DEFAULT_CASCADE_HOLDOUT
+from core.replica_pool import ReplicaPool
+from core.results import BatchResult, ValidationResult
+from core.metrics import PipelineMetrics
+from core.profiling import phase
+from core.shadow import ShadowEvaluator
 
 logger = logging.getLogger(__name__) # 모듈용 로거
 
@@ -15,6 +29,9 @@ logger = logging.getLogger(__name__) # 모듈용 로거
 APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEFAULT_MODEL_PATH = os.path.join(APP_ROOT, 'notebooks', 'model.h5')
 DEFAULT_SCALER_PATH = os.path.join(APP_ROOT, 'notebooks', 'scaler.pkl')
+PREDICTION_MODES = ("model", "lut", "cascade")
+# validate/validate_batch에서 AI 예측을 언제 실행할지
+AI_POLICIES = ("always", "never", "sampled", "shadow")
 
 # 실행 파일(exe) 환경 경로 설정
 if getattr(sys, 'frozen', False):
@@ -36,75 +53,552 @@ if getattr(sys, 'frozen', False):
             DEFAULT_SCALER_PATH = os.path.join(sys._MEIPASS, 'scaler.pkl')
 
 class TriangleValidatorCore:
-    """삼각형 검증을 위한 핵심 로직을 제공하는 클래스"""
+    """
+    삼각형 검증을 위한 핵심 로직을 제공하는 클래스
+
+    validate/validate_batch 계열 메서드는 여러 스레드에서 동시에 호출해도 안전합니다.
+    요청마다 모델 버전을 한 번만 읽고, 캐시와 계측은 내부 잠금을 사용하며, 모델 호출은
+    상태를 바꾸지 않습니다. replicas > 1이면 동시에 실행되는 모델 호출 수가 복제본 수로 제한됩니다.
+    asyncio 코드에서는 avalidate/avalidate_batch를 사용합니다.
+    """
     
-    def __init__(self, model_path=None, scaler_path=None, framework="tensorflow"):
+    def __init__(self, model_path=None, scaler_path=None, framework="tensorflow", adapter_options=None,
+                 cache_size=0, cache_path=None, cache_quantum=DEFAULT_QUANTUM, sort_model_input=False, metrics=None,
+                 load_on_init=True, registry=None, prediction_mode="model", lut_options=None,
+                 replicas=1, executor_workers=None, cascade_options=None, ai_policy="always", ai_sample_rate=1.0,
+                 ai_sample_seed=None, shadow_options=None):
+        """
+        Args:
+            cache_size (int): AI 예측 LRU 캐시 크기. 0이면 캐시를 사용하지 않습니다.
+                sort_model_input=True일 때만 캐시 키를 정렬해 순서만 다른 입력이 예측값을 공유하고,
+                False이면 모델 출력이 변의 순서에 따라 다르므로 입력 순서 그대로 키를 만듭니다.
+            cache_path (str, optional): 지정하면 SQLite 영구 캐시를 함께 사용합니다.
+                model/scaler 파일 내용이 바뀌면 새 지문의 행만 조회하며, 핫 리로드로 교체된 지문의 행은 삭제합니다.
+                같은 파일을 다른 모델이 함께 써도 서로의 행을 지우지 않습니다.
+            cache_quantum (float): 캐시 키를 만들 때 변 길이를 양자화하는 단위
+            sort_model_input (bool): True이면 모델에 세 변을 정렬해서 입력합니다.
+                현재 모델은 정렬된 입력으로 학습되지 않았으므로 기본값은 False입니다.
+            metrics (PipelineMetrics or bool, optional): 검증 경로 계측. True이면 새로 만들고,
+                PipelineMetrics 인스턴스를 넘기면 여러 코어가 함께 기록합니다.
+                기본값(None)은 계측하지 않으며 시간 측정도 하지 않습니다.
+            load_on_init (bool): False이면 생성자에서 모델과 스케일러를 로드하지 않습니다.
+                load_models()를 나중에(예: 백그라운드 스레드에서) 호출해야 하며,
+                그 전까지 validate_by_math는 바로 사용할 수 있고 AI 검증은 None을 반환합니다.
+            registry (ModelRegistry, optional): 모델을 가져올 레지스트리.
+                기본값은 프로세스 공용 레지스트리로, 같은 파일을 쓰는 인스턴스끼리 모델을 공유합니다.
+            prediction_mode (str): "model"은 매번 순전파, "lut"은 로드 시 입력 영역 격자에서
+                모델을 미리 계산해 두고 삼선형 보간으로 응답합니다. 격자 밖이나 결정 경계 근처
+                입력은 실제 모델로 계산합니다.
+                "cascade"는 로드 시 모델을 흉내 내도록 증류한 로지스틱 회귀가 먼저 응답하고,
+                그 점수가 0.5 근처(불확실 구간)이거나 증류 범위 밖인 입력만 실제 모델로 계산합니다.
+            lut_options (dict, optional): PredictionLUT.build 옵션 (points, low, high, margin)과
+                빌드 결과를 재사용할 .npz 경로 path
+            cascade_options (dict, optional): CascadeFirstStage.fit 옵션 (band, samples, low, high, holdout)과
+                학습 결과를 재사용할 .npz 경로 path
+            replicas (int): 모델 복제본 수. 1이면 모든 스레드가 모델 하나를 함께 호출하고,
+                2 이상이면 요청마다 복제본 하나를 빌려 쓰므로 동시 모델 호출 수가 이 값으로 제한됩니다.
+                TensorFlow 스레드 수는 adapter_options의 intra_op_threads, inter_op_threads로 지정하며
+                (replicas × intra_op_threads)가 CPU 코어 수를 넘지 않도록 설정하는 것이 좋습니다.
+            executor_workers (int, optional): avalidate/avalidate_batch가 사용하는 스레드 수.
+                기본값은 replicas (그보다 많으면 복제본을 기다리기만 함)
+            ai_policy (str): validate/validate_batch에서 AI 예측을 실행하는 방식.
+                "always"는 매번, "never"는 실행하지 않음 (AI 관련 값은 None),
+                "sampled"는 요청마다 확률 ai_sample_rate로 요청 경로에서 실행,
+                "shadow"는 수학 판정만 바로 반환하고 확률 ai_sample_rate로 고른 행을 백그라운드에서
+                배치로 평가해 불일치 통계(shadow_stats(), metrics의 ai_predictions/disagreements)에 기록합니다.
+                validate_by_ai / validate_batch_by_ai를 직접 호출하면 정책과 관계없이 AI 예측을 실행합니다.
+            ai_sample_rate (float): "sampled", "shadow" 정책의 표본 비율 (0~1)
+            ai_sample_seed (int, optional): 표본 추출 난수 시드 (재현이 필요한 경우)
+            shadow_options (dict, optional): ShadowEvaluator 옵션 (max_batch, max_delay, max_pending 등)
+        """
+        if replicas < 1:
+            raise ValueError(f"replicas는 1 이상이어야 합니다: {replicas}")
+        if prediction_mode not in PREDICTION_MODES:
+            raise ValueError(f"지원되지 않는 예측 모드: {prediction_mode} (가능한 값: {PREDICTION_MODES})")
+        if ai_policy not in AI_POLICIES:
+            raise ValueError(f"지원되지 않는 AI 평가 정책: {ai_policy} (가능한 값: {AI_POLICIES})")
+        if not 0.0 <= ai_sample_rate <= 1.0:
+            raise ValueError(f"ai_sample_rate는 0~1 사이여야 합니다: {ai_sample_rate}")
         current_model_path = model_path if model_path else DEFAULT_MODEL_PATH
         current_scaler_path = scaler_path if scaler_path else DEFAULT_SCALER_PATH
         
-        self.model = None
-        self.scaler = None
-        self.adapter = get_adapter(framework) # 어댑터 인스턴스 생성
-        
-        try:
-            self.model = self.adapter.load_model(current_model_path)
-            logger.info(f"AI 모델 로드 성공: {current_model_path}")
-        except Exception as e:
-            logger.error(f"AI 모델 로드 실패 ({current_model_path}): {e}")
-            
-        try:
-            self.scaler = joblib.load(current_scaler_path)
-            logger.info(f"Scaler 로드 성공: {current_scaler_path}")
-        except Exception as e:
-            logger.error(f"Scaler 로드 실패 ({current_scaler_path}): {e}")
+        self.model_path = current_model_path
+        self.scaler_path = current_scaler_path
+        self.framework = framework
+        self.adapter_options = dict(adapter_options or {})
+        self.model_fingerprint = None
+        self.sort_model_input = sort_model_input
+        self.prediction_mode = prediction_mode
+        self.lut_options = dict(lut_options or {})
+        self.cascade_options = dict(cascade_options or {})
+        self.adapter = get_adapter(framework, **self.adapter_options) # 예측용 어댑터 인스턴스 (모델 로드는 레지스트리가 담당)
+        if metrics is True:
+            metrics = PipelineMetrics()
+        self.metrics = metrics or None
+        self.adapter.metrics = self.metrics # 어댑터는 scaler_transform, model_forward 단계를 기록
+        self._registry = registry
+        self._handle = None
+        self._cache_options = (cache_size, cache_path, cache_quantum)
+        self.replicas = replicas
+        # 버전마다 캐시/LUT/복제본 풀을 새로 만들어야 하는지 여부
+        self._has_version_state = cache_size > 0 or prediction_mode != "model" or replicas > 1
+        # (모델 버전, PredictionCache, 빠른 경로 (PredictionLUT 또는 CascadeFirstStage), ReplicaPool)
+        self._version_state = (None, None, None, None)
+        self._load_lock = threading.RLock()
+        self._executor_workers = executor_workers or replicas
+        self._executor = None
+        self.ai_policy = ai_policy
+        self.ai_sample_rate = ai_sample_rate
+        self._sampler = random.Random(ai_sample_seed)
+        self._shadow_options = dict(shadow_options or {})
+        self._shadow = None
+
+        if load_on_init:
+            self.load_models()
+
+    @property
+    def model(self):
+        version = self._handle.current if self._handle is not None else None
+        return version.model if version is not None else None
+
+    @property
+    def scaler(self):
+        version = self._handle.current if self._handle is not None else None
+        return version.scaler if version is not None else None
+
+    @property
+    def model_generation(self):
+        """핫 리로드로 모델 버전이 교체된 횟수 + 1 (로드 전에는 0)"""
+        return self._handle.generation if self._handle is not None else 0
+
+    @property
+    def is_ready(self):
+        """AI 검증에 필요한 모델과 스케일러가 모두 로드되었는지 여부"""
+        version = self._handle.current if self._handle is not None else None
+        return version is not None and version.is_ready
+
+    def load_models(self):
+        """
+        모델 레지스트리에서 모델과 스케일러를 가져옵니다.
+
+        같은 파일을 이미 다른 인스턴스가 로드했다면 그 버전을 공유합니다.
+        여러 스레드에서 호출해도 한 번만 수행하며, 로드에 실패한 경우 다시 시도하지 않습니다
+        (레지스트리 파일 감시가 켜져 있으면 파일이 바뀔 때 다시 로드됩니다).
+
+        Returns:
+            bool: AI 검증을 사용할 수 있으면 True
+        """
+        with self._load_lock, phase("model_load"):
+            if self._handle is None:
+                registry = self._registry if self._registry is not None else default_registry()
+                self._handle = registry.acquire(self.model_path, self.scaler_path,
+                                                framework=self.framework, adapter_options=self.adapter_options)
+            self._current_version()
+            return self.is_ready
+
+    def _current_version(self):
+        """
+        요청 하나에서 사용할 (모델 버전, 예측 캐시, 빠른 경로 (룩업 테이블 또는 1단계), 복제본 풀)을 반환합니다.
+
+        버전 객체 하나를 잡아 두고 모델과 스케일러를 함께 사용하므로, 처리 도중 핫 리로드로
+        버전이 교체되어도 그 요청은 이전 버전으로 일관되게 끝납니다. 캐시, 빠른 경로, 복제본도
+        버전과 한 묶음으로 반환하므로 이전 버전의 예측값이 새 버전에 섞이지 않습니다.
+        """
+        version = self._handle.current if self._handle is not None else None
+        state = self._version_state
+        if version is not state[0] and self._has_version_state:
+            state = self._rebuild_version_state(version)
+        return version, state[1], state[2], state[3]
+
+    @contextlib.contextmanager
+    def _model_for(self, version, replicas):
+        """요청 하나가 사용할 모델 (복제본 풀이 있으면 빌려 쓰고 반납)"""
+        if replicas is None:
+            yield version.model
+        else:
+            with replicas.acquire() as model:
+                yield model
+
+    def _rebuild_version_state(self, version):
+        with self._load_lock:
+            state = self._version_state
+            if version is state[0]:
+                return state
+            cache_size, cache_path, cache_quantum = self._cache_options
+            cache = fast_path = replicas = None
+            self.model_fingerprint = None
+            if version is not None and version.is_ready and version.fingerprint is not None:
+                # 같은 파일이라도 정렬 여부가 다르면 예측값이 다르므로 지문에 포함
+                self.model_fingerprint = f"{version.fingerprint}:sorted={int(self.sort_model_input)}"
+                if cache_size > 0:
+                    if state[1] is not None:
+                        # 이전 캐시의 영구 저장소만 닫음: 남은 쓰기를 커밋해 새 저장소의 쓰기가 잠기지 않게 하고,
+                        # 진행 중인 요청은 이전 캐시의 메모리 LRU를 계속 사용 (닫힌 저장소의 get/put은 무시됨).
+                        # 이 인스턴스가 지문을 교체하는 경우에만 이전 지문의 행을 삭제
+                        state[1].close(discard=state[1].fingerprint != self.model_fingerprint)
+                    cache = PredictionCache(cache_size, fingerprint=self.model_fingerprint,
+                                            quantum=cache_quantum, persistent_path=cache_path,
+                                            sort_key=self.sort_model_input)
+                if self.prediction_mode == "lut":
+                    with phase("lut_prepare"):
+                        fast_path = self._prepare_lut(version)
+                elif self.prediction_mode == "cascade":
+                    with phase("cascade_fit"):
+                        fast_path = self._prepare_cascade(version)
+            if version is not None and version.is_ready and self.replicas > 1:
+                with phase("replica_clone"):
+                    replicas = ReplicaPool.create(self.adapter, version.model, self.replicas)
+            # 튜플 하나를 교체하므로 읽는 쪽은 항상 일관된 묶음을 봄
+            self._version_state = (version, cache, fast_path, replicas)
+            return self._version_state
+
+    def _model_predict_batch(self, version):
+        """빠른 경로(LUT, 1단계)를 만들 때 사용하는 실제 모델의 배치 예측 함수"""
+        def predict_batch(sides):
+            if self.sort_model_input:
+                sides = np.sort(sides, axis=1)
+            return self.adapter.predict_batch(version.model, sides, scaler=version.scaler)
+        return predict_batch
+
+    def _prepare_lut(self, version):
+        """저장된 LUT를 읽거나, 없으면 모델로 격자를 계산해 만듭니다."""
+        options = dict(self.lut_options)
+        path = options.pop("path", None)
+        fingerprint = f"{self.model_fingerprint}:{sorted(options.items())}"
+        predict_batch = self._model_predict_batch(version)
+
+        lut = PredictionLUT.load(path, fingerprint) if path else None
+        if lut is None:
+            started = time.perf_counter()
+            lut = PredictionLUT.build(predict_batch, fingerprint=fingerprint, **options)
+            logger.info(f"AI 예측 LUT 생성: 축당 {lut.points}점, {time.perf_counter() - started:.2f}s")
+            if path:
+                lut.save(path)
+        report = lut.measure_error(predict_batch)
+        logger.info(f"AI 예측 LUT 오차 (모델 대비): {report}")
+        return lut
+
+    def _prepare_cascade(self, version):
+        """저장된 1단계를 읽거나, 없으면 모델 출력으로 증류해 만듭니다."""
+        options = dict(self.cascade_options)
+        path = options.pop("path", None)
+        # 불확실 구간은 학습 결과에 영향을 주지 않으므로 지문에서 제외 (band만 바꿔도 파일 재사용)
+        fit_options = {key: value for key, value in options.items() if key != "band"}
+        fingerprint = f"{self.model_fingerprint}:{sorted(fit_options.items())}"
+        predict_batch = self._model_predict_batch(version)
+
+        stage = CascadeFirstStage.load(path, fingerprint, band=options.get("band")) if path else None
+        if stage is None:
+            stage = CascadeFirstStage.fit(predict_batch, fingerprint=fingerprint, **options)
+            if path:
+                stage.save(path)
+        else:
+            stage.measure_agreement(predict_batch, options.get("holdout", DEFAULT_CASCADE_HOLDOUT))
+            stage.reset_stats()
+        logger.info(f"AI 예측 1단계 (모델 대비): {stage.report}")
+        return stage
+
+    @property
+    def cache(self):
+        return self._version_state[1]
+
+    def lut_report(self):
+        """LUT의 모델 대비 최대/평균 절대 오차와 적용 비율을 반환합니다. LUT 모드가 아니면 None."""
+        lut = self._version_state[2]
+        return lut.report if isinstance(lut, PredictionLUT) else None
+
+    def cascade_report(self):
+        """
+        cascade 모드의 1단계 학습 결과와 단계별 응답 수를 반환합니다. cascade 모드가 아니면 None.
+
+        Returns:
+            dict: fit (학습 시간, 실제 모델 대비 일치율, 적용 비율)와 stages (1단계/실제 모델 응답 수, 1단계 적중률)
+        """
+        stage = self._version_state[2]
+        if not isinstance(stage, CascadeFirstStage):
+            return None
+        return {"fit": stage.report, "stages": stage.stats()}
+
+    def cache_stats(self):
+        """AI 예측 캐시의 hit/miss/eviction 통계를 반환합니다. 캐시를 사용하지 않으면 None."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def metrics_snapshot(self):
+        """단계별 소요 시간과 검증/불일치 카운터를 반환합니다. 계측을 사용하지 않으면 None."""
+        return self.metrics.snapshot() if self.metrics is not None else None
 
     def validate_by_math(self, a, b, c):
         """수학적 방법으로 삼각형 가능 여부를 확인합니다."""
         # 0 이하의 값은 삼각형 변이 될 수 없음
         if a <= 0 or b <= 0 or c <= 0:
-            logger.debug(f"수학적 검증 실패 (0 이하 변): a={a}, b={b}, c={c}")
+            logger.debug("수학적 검증 실패 (0 이하 변): a=%s, b=%s, c=%s", a, b, c)
             return False
         result = (a + b > c) and (a + c > b) and (b + c > a)
-        logger.debug(f"수학적 검증: a={a}, b={b}, c={c} -> {result}")
+        # 호출 빈도가 높은 경로이므로 로그 레벨이 꺼져 있으면 포맷팅하지 않도록 지연 인자 사용
+        logger.debug("수학적 검증: a=%s, b=%s, c=%s -> %s", a, b, c, result)
         return result
     
     def validate_by_ai(self, a, b, c):
         """AI 모델로 삼각형 가능 여부를 예측합니다."""
-        if self.model is None:
+        version, cache, fast_path, replicas = self._current_version()
+        if version is None or version.model is None:
             logger.warning("AI 모델이 로드되지 않아 AI 검증을 건너뜁니다.")
             return None
-        if self.scaler is None:
+        if version.scaler is None:
             logger.warning("Scaler가 로드되지 않아 AI 검증을 건너뜁니다.")
             return None
         
         try:
-            sides_for_ai = np.array([[float(a), float(b), float(c)]]) 
+            if fast_path is not None:
+                prediction = fast_path.lookup(float(a), float(b), float(c))
+                if prediction is not None:
+                    return prediction
+                # LUT 격자 밖, 결정 경계 근처 또는 1단계의 불확실 구간: 아래에서 실제 모델로 계산
+
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(float(a), float(b), float(c))
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("AI 예측 캐시 적중 (Core): a=%s, b=%s, c=%s -> pred=%s", a, b, c, cached)
+                    return cached
+
+            metrics = self.metrics
+            if metrics is not None:
+                started = time.perf_counter()
+            sides = [float(a), float(b), float(c)]
+            if self.sort_model_input:
+                sides.sort()
+            sides_for_ai = np.array([sides]) 
+            if metrics is not None:
+                metrics.observe("input_conversion", time.perf_counter() - started)
             # scaled_data = self.scaler.transform(sides_for_ai) # 어댑터 내부에서 수행
             # prediction = self.adapter.predict(self.model, scaled_data)
-            prediction = self.adapter.predict(self.model, sides_for_ai, scaler=self.scaler) # scaler 전달
-            logger.debug(f"AI 예측 (Core): a={a}, b={b}, c={c} -> pred={prediction}") # 스케일된 데이터 로깅은 어댑터에서
+            with self._model_for(version, replicas) as model:
+                prediction = self.adapter.predict(model, sides_for_ai, scaler=version.scaler) # scaler 전달
+            logger.debug("AI 예측 (Core): a=%s, b=%s, c=%s -> pred=%s", a, b, c, prediction) # 스케일된 데이터 로깅은 어댑터에서
+            if cache_key is not None:
+                cache.put(cache_key, prediction)
             return prediction
         except Exception as e:
             logger.error(f"AI 예측 실패 (Core): a={a},b={b},c={c}): {e}", exc_info=True)
             return None
     
     def validate(self, a, b, c):
-        """모든 방법으로 삼각형 가능 여부를 확인합니다."""
+        """모든 방법으로 삼각형 가능 여부를 확인합니다. AI 예측 실행 여부는 ai_policy를 따릅니다."""
+        metrics = self.metrics
+        if metrics is not None:
+            started = time.perf_counter()
         math_result = self.validate_by_math(a, b, c)
-        ai_prediction_value = self.validate_by_ai(a, b, c)
+        if metrics is not None:
+            metrics.observe("math_check", time.perf_counter() - started)
+        policy = self.ai_policy
+        if policy == "always" or (policy == "sampled" and self._sample()):
+            ai_prediction_value = self.validate_by_ai(a, b, c)
+        else:
+            ai_prediction_value = None
+            if policy == "shadow" and self._sample():
+                self._get_shadow().submit((float(a), float(b), float(c)), math_result)
+        if metrics is not None:
+            started = time.perf_counter()
         
         # ai_prediction_value가 None이 아닐 경우에만 is_valid_by_ai 계산
         is_valid_by_ai = None
         if ai_prediction_value is not None:
             is_valid_by_ai = ai_prediction_value > 0.5
         
-        return {
-            "sides": [float(a), float(b), float(c)],
-            "math_result": math_result,
-            "ai_prediction_value": ai_prediction_value,
-            "is_valid_by_ai": is_valid_by_ai,
-            "is_consistent": math_result == is_valid_by_ai if is_valid_by_ai is not None else None
-        }
+        result = ValidationResult(
+            (float(a), float(b), float(c)),
+            math_result,
+            ai_prediction_value,
+            is_valid_by_ai,
+            math_result == is_valid_by_ai if is_valid_by_ai is not None else None
+        )
+        if metrics is not None:
+            metrics.observe("result_assembly", time.perf_counter() - started)
+            metrics.record_results(1, int(is_valid_by_ai is not None), int(result.is_consistent is False))
+        return result
+
+    def validate_batch_by_math(self, sides):
+        """수학적 방법으로 N개의 삼각형 가능 여부를 한 번에 확인합니다."""
+        return triangle_mask(as_sides_array(sides))
+
+    def validate_batch_by_ai(self, sides):
+        """AI 모델로 N개의 삼각형 가능 여부를 한 번의 호출로 예측합니다."""
+        version, _, fast_path, replicas = self._current_version()
+        if version is None or version.model is None:
+            logger.warning("AI 모델이 로드되지 않아 AI 배치 검증을 건너뜁니다.")
+            return None
+        if version.scaler is None:
+            logger.warning("Scaler가 로드되지 않아 AI 배치 검증을 건너뜁니다.")
+            return None
+
+        sides = as_sides_array(sides)
+        model_input = np.sort(sides, axis=1) if self.sort_model_input else sides
+        try:
+            if fast_path is not None:
+                # LUT/1단계로 응답할 수 없는 행만 모델로 계산
+                predictions, covered = fast_path.lookup_batch(sides)
+                if not covered.all():
+                    with self._model_for(version, replicas) as model:
+                        predictions[~covered] = self.adapter.predict_batch(model, model_input[~covered],
+                                                                           scaler=version.scaler)
+                return predictions
+            with self._model_for(version, replicas) as model:
+                predictions = self.adapter.predict_batch(model, model_input, scaler=version.scaler)
+            logger.debug("AI 배치 예측 (Core): %d건", len(sides))
+            return predictions
+        except Exception as e:
+            logger.error(f"AI 배치 예측 실패 (Core): {len(sides)}건: {e}", exc_info=True)
+            return None
+
+    def validate_batch(self, sides, sample_rows=False):
+        """N×3 배열(또는 세 변 튜플의 iterable)을 한 번에 검증하고 BatchResult를 반환합니다.
+
+        result["math_result"]처럼 validate()와 같은 키로 길이 N의 열을 꺼낼 수 있습니다.
+        AI 예측을 수행할 수 없거나 ai_policy에 따라 건너뛰면 AI 관련 키의 값은 None입니다.
+        "sampled" 정책은 배치 전체를 하나의 요청으로 보고 표본 여부를 정하고,
+        "shadow" 정책은 행마다 표본 여부를 정합니다.
+
+        Args:
+            sides: (N, 3) 입력
+            sample_rows (bool): True이면 각 행을 별도 요청으로 보고 "sampled" 정책의 표본을 행마다 고름
+                (마이크로 배처처럼 독립된 요청을 묶은 경우). 고르지 않은 행의 ai_prediction_value는 NaN이며
+                result.row(i)에서는 AI 필드가 None입니다.
+        """
+        sides = as_sides_array(sides)
+        math_result = self.validate_batch_by_math(sides)
+        policy = self.ai_policy
+        if policy == "sampled" and sample_rows:
+            ai_prediction_value = self._validate_sampled_rows(sides)
+        elif policy == "always" or (policy == "sampled" and self._sample()):
+            ai_prediction_value = self.validate_batch_by_ai(sides)
+        else:
+            ai_prediction_value = None
+            if policy == "shadow" and len(sides):
+                self._submit_shadow_rows(sides, math_result)
+        result = BatchResult.from_columns(sides, math_result, ai_prediction_value)
+
+        if self.metrics is not None:
+            # 배치 경로는 단계별 시간 대신 건수만 기록 (단일 호출 히스토그램과 섞이지 않도록)
+            n = len(sides)
+            evaluated = int(np.count_nonzero(~np.isnan(result.data["ai_prediction_value"]))) if result.has_ai else 0
+            disagreements = len(result.inconsistent()) if result.has_ai else 0
+            self.metrics.record_results(n, evaluated, disagreements)
+
+        return result
+
+    def _sample(self):
+        """요청 하나를 AI 평가 표본으로 고를지 여부"""
+        rate = self.ai_sample_rate
+        return rate >= 1.0 or (rate > 0.0 and self._sampler.random() < rate)
+
+    def _validate_sampled_rows(self, sides):
+        """행마다 확률 ai_sample_rate로 고른 행만 AI로 평가합니다. 고르지 않은 행은 NaN, 하나도 없으면 None."""
+        rate = self.ai_sample_rate
+        if rate >= 1.0:
+            return self.validate_batch_by_ai(sides)
+        if rate <= 0.0 or not len(sides):
+            return None
+        rng = np.random.default_rng(self._sampler.getrandbits(64))
+        selected = rng.random(len(sides)) < rate
+        if not selected.any():
+            return None
+        predictions = self.validate_batch_by_ai(sides[selected])
+        if predictions is None:
+            return None
+        ai_prediction_value = np.full(len(sides), np.nan)
+        ai_prediction_value[selected] = predictions
+        return ai_prediction_value
+
+    def _submit_shadow_rows(self, sides, math_result):
+        """배치에서 행마다 확률 ai_sample_rate로 고른 행을 섀도 평가 대기열에 넣습니다."""
+        rate = self.ai_sample_rate
+        if rate >= 1.0:
+            # 호출한 쪽이 배열을 재사용할 수 있으므로 사본을 넘김
+            self._get_shadow().submit(sides.copy(), math_result)
+        elif rate > 0.0:
+            rng = np.random.default_rng(self._sampler.getrandbits(64))
+            selected = rng.random(len(sides)) < rate
+            if selected.any():
+                self._get_shadow().submit(sides[selected], math_result[selected])
+
+    def _get_shadow(self):
+        shadow = self._shadow
+        if shadow is None:
+            with self._load_lock:
+                if self._shadow is None:
+                    self._shadow = ShadowEvaluator(self.validate_batch_by_ai, metrics=self.metrics,
+                                                   **self._shadow_options)
+                shadow = self._shadow
+        return shadow
+
+    def shadow_stats(self):
+        """섀도 평가 통계 (ShadowEvaluator.stats())를 반환합니다. 섀도 평가를 시작하지 않았으면 None."""
+        shadow = self._shadow
+        return shadow.stats() if shadow is not None else None
+
+    def wait_for_shadow(self, timeout=None):
+        """대기 중인 섀도 평가가 끝날 때까지 기다립니다 (테스트/종료 처리용)."""
+        shadow = self._shadow
+        return shadow.wait_idle(timeout) if shadow is not None else True
+
+    def _get_executor(self):
+        with self._load_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self._executor_workers,
+                                                    thread_name_prefix="triangle-validate")
+            return self._executor
+
+    async def avalidate(self, a, b, c):
+        """validate를 실행기 스레드에서 실행합니다 (이벤트 루프를 막지 않음)."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.validate, a, b, c)
+
+    async def avalidate_batch(self, sides):
+        """validate_batch를 실행기 스레드에서 실행합니다 (이벤트 루프를 막지 않음)."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.validate_batch, sides)
+
+    def close(self):
+        """
+        avalidate/avalidate_batch용 실행기와 섀도 평가 스레드를 종료합니다 (남은 섀도 평가는 마칩니다).
+        이후 호출하면 새로 만듭니다.
+        """
+        with self._load_lock:
+            executor, self._executor = self._executor, None
+            shadow, self._shadow = self._shadow, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if shadow is not None:
+            shadow.close()
+
+def as_sides_array(sides):
+    """입력을 (N, 3) float64 배열로 변환합니다."""
+    if not isinstance(sides, np.ndarray):
+        if not isinstance(sides, (list, tuple)):
+            sides = list(sides) # 제너레이터 등 임의의 iterable 지원
+        if len(sides) == 0:
+            return np.empty((0, 3), dtype=np.float64)
+    sides = np.asarray(sides, dtype=np.float64)
+    if sides.ndim == 1 and sides.shape[0] == 3:
+        sides = sides.reshape(1, 3)
+    if sides.ndim != 2 or sides.shape[1] != 3:
+        raise ValueError(f"sides는 (N, 3) 형태여야 합니다: {sides.shape}")
+    return sides
+
+def triangle_mask(sides):
+    """
+    (N, 3) 배열의 각 행이 삼각형이 될 수 있는지 나타내는 bool 배열을 반환합니다.
+
+    validate_by_math와 동일한 규칙 (0 이하 변 / 삼각형 부등식)을 하나의 벡터 연산으로 평가합니다.
+    학습 데이터 라벨도 이 함수로 만들므로 모델과 수학 판정이 같은 기준을 사용합니다.
+    """
+    a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+    return (a > 0) & (b > 0) & (c > 0) & (a + b > c) & (a + c > b) & (b + c > a)
 
 # Test (선택적)
 if __name__ == '__main__':
@@ -0,0 +1,164 @@
+"""
+분산 대량 검증 CLI (코디네이터/워커)
+
+코디네이터는 입력 파일을 청크로 나누어 접속한 워커에 보내고, 결과를 입력 순서대로
+stdout 또는 파일로 기록합니다. 워커는 다른 호스트나 컨테이너에서 코디네이터 주소로 접속합니다.
+
+사용 예:
+    # 한 머신에서 로컬 워커 4개로 실행
+    python distribute.py coordinator triangles.npy -o results.csv --local-workers 4 --framework numpy
+    # 여러 머신: 코디네이터는 외부 접속을 받고 워커 2개가 접속할 때까지 기다림
+    python distribute.py coordinator triangles.npy -o results.csv --listen 0.0.0.0:7070 --min-workers 2 --token s3cret
+    python distribute.py worker --connect coordinator-host:7070 --framework numpy --token s3cret
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from core.bulk_io import DEFAULT_CHUNK_SIZE, INPUT_FORMATS, OUTPUT_FORMATS, ResultWriter, iter_chunks
+from core.distributed import (DEFAULT_MAX_ATTEMPTS, DEFAULT_PORT, DEFAULT_PREFETCH, DEFAULT_TASK_TIMEOUT,
+                              MAX_CHUNK_ROWS, Coordinator, Worker, format_address, start_local_workers)
+
+logger = logging.getLogger(__name__) # distribute 모듈용 로거
+
+TOKEN_ENV = "TRIANGLE_DISTRIBUTED_TOKEN"
+
+
+def setup_logging(level="INFO"):
+    """결과가 stdout으로 나갈 수 있으므로 로그는 stderr로 보냅니다."""
+    logging.basicConfig(
+        level=getattr(logging, level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+
+def add_core_arguments(parser):
+    parser.add_argument("--framework", default="tensorflow", help="ML 프레임워크 (tensorflow, numpy, compact)")
+    parser.add_argument("--model", help="모델 파일 경로 (기본값: notebooks/model.h5)")
+    parser.add_argument("--scaler", help="스케일러 파일 경로 (기본값: notebooks/scaler.pkl)")
+    parser.add_argument("--intra-op-threads", type=int, help="워커당 연산 스레드 수")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 분산 대량 검증")
+    parser.add_argument("--token", default=os.environ.get(TOKEN_ENV),
+                        help=f"코디네이터와 워커가 공유하는 토큰 (기본값: ${TOKEN_ENV})")
+    parser.add_argument("--log-level", default="WARNING", help="로그 레벨")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="입력을 나누어 워커에 보내고 결과를 모음")
+    coordinator.add_argument("input", help="입력 파일 (CSV, JSONL, float32/float64 .npy)")
+    coordinator.add_argument("-o", "--output", default="-", help="결과 파일 경로 (기본값: stdout)")
+    coordinator.add_argument("--input-format", choices=INPUT_FORMATS, help="입력 형식 (기본값: 확장자로 판단)")
+    coordinator.add_argument("--output-format", choices=OUTPUT_FORMATS, default="csv", help="출력 형식")
+    coordinator.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    coordinator.add_argument("--listen", default=f"127.0.0.1:{DEFAULT_PORT}",
+                             help="대기 주소 (host:port 또는 unix:/path)")
+    coordinator.add_argument("--local-workers", type=int, default=0, help="이 머신에서 시작할 워커 프로세스 수")
+    coordinator.add_argument("--min-workers", type=int, help="작업 시작 전에 기다릴 워커 수 (기본값: 로컬 워커 수, 최소 1)")
+    coordinator.add_argument("--worker-wait", type=float, default=300.0, help="워커 접속을 기다리는 최대 시간 (초)")
+    coordinator.add_argument("--prefetch", type=int, default=DEFAULT_PREFETCH, help="워커당 미리 보내는 청크 수")
+    coordinator.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help="청크당 최대 시도 횟수")
+    coordinator.add_argument("--task-timeout", type=float, default=DEFAULT_TASK_TIMEOUT,
+                             help="청크 하나의 응답 제한 시간 (초)")
+    coordinator.add_argument("--progress-interval", type=float, default=10.0,
+                             help="진행 상황 출력 간격 (초, 0이면 출력하지 않음)")
+    add_core_arguments(coordinator)
+
+    worker = subparsers.add_parser("worker", help="코디네이터에 접속해 청크를 검증")
+    worker.add_argument("--connect", default=f"127.0.0.1:{DEFAULT_PORT}",
+                        help="코디네이터 주소 (host:port 또는 unix:/path)")
+    worker.add_argument("--name", help="워커 이름 (기본값: 호스트명:pid)")
+    worker.add_argument("--connect-timeout", type=float, default=30.0, help="코디네이터 접속 재시도 시간 (초)")
+    add_core_arguments(worker)
+    return parser
+
+
+def progress_printer(interval):
+    """interval초마다 진행 상황을 stderr에 출력하는 on_progress 콜백"""
+    last = [0.0]
+
+    def on_progress(progress):
+        now = time.monotonic()
+        if now - last[0] < interval:
+            return
+        last[0] = now
+        print(f"progress: rows={progress['rows']} chunks={progress['chunks_done']}/{progress['chunks_read']} "
+              f"in_flight={progress['in_flight']} retries={progress['retries']} "
+              f"rows/sec={progress['rows_per_second']:.0f}", file=sys.stderr)
+
+    return on_progress
+
+
+def run_coordinator(args, stream):
+    """코디네이터를 열고 (필요하면 로컬 워커를 시작해) 입력 전체를 검증합니다."""
+    processes = []
+    with Coordinator(args.listen, token=args.token, prefetch=args.prefetch, max_attempts=args.max_attempts,
+                     task_timeout=args.task_timeout) as coordinator:
+        print(f"coordinator listening on {format_address(coordinator.address)}", file=sys.stderr)
+        if args.local_workers > 0:
+            processes = start_local_workers(coordinator.address, args.local_workers, token=args.token,
+                                            framework=args.framework, model_path=args.model,
+                                            scaler_path=args.scaler, intra_op_threads=args.intra_op_threads)
+        min_workers = args.min_workers or max(1, args.local_workers)
+        if not coordinator.wait_for_workers(min_workers, timeout=args.worker_wait):
+            raise TimeoutError(f"{args.worker_wait}초 안에 워커 {min_workers}개가 접속하지 않았습니다 "
+                               f"(현재 {coordinator.connected_workers()}개).")
+
+        writer = ResultWriter(stream, args.output_format)
+        on_progress = progress_printer(args.progress_interval) if args.progress_interval > 0 else None
+        stats = coordinator.run(iter_chunks(args.input, args.chunk_size, args.input_format), writer.write,
+                                on_progress=on_progress)
+    for process in processes:
+        process.join(timeout=10)
+    return stats
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.role == "coordinator" and not 0 < args.chunk_size <= MAX_CHUNK_ROWS:
+        parser.error(f"--chunk-size는 1 이상 {MAX_CHUNK_ROWS} 이하여야 합니다.")
+    setup_logging(args.log_level)
+
+    if args.role == "worker":
+        worker = Worker(args.connect, name=args.name, token=args.token, connect_timeout=args.connect_timeout,
+                        framework=args.framework, model_path=args.model, scaler_path=args.scaler)
+        if args.framework == "tensorflow" and args.intra_op_threads:
+            from models.adapters.tf_adapter import configure_threads
+            configure_threads(args.intra_op_threads, 1)
+        try:
+            processed = worker.run()
+        except Exception as e:
+            logger.exception(f"워커 실행 실패: {e}")
+            return 1
+        print(f"worker processed chunks={processed['chunks']} rows={processed['rows']}", file=sys.stderr)
+        return 0
+
+    try:
+        if args.output == "-":
+            stats = run_coordinator(args, sys.stdout)
+            sys.stdout.flush()
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                stats = run_coordinator(args, f)
+    except Exception as e:
+        logger.exception(f"분산 검증 실패: {e}")
+        return 1
+
+    per_worker = " ".join(f"{name}={worker['chunks']}" for name, worker in sorted(stats["workers"].items()))
+    print(
+        f"rows={stats['rows']} chunks={stats['chunks']} retries={stats['retries']} "
+        f"processing={stats['seconds']:.2f}s rows/sec={stats['rows_per_second']:.0f} workers: {per_worker}",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
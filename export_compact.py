@@ -0,0 +1,108 @@
+"""
+압축 모델 내보내기 CLI
+
+model.h5 + scaler.pkl을 int8/float16 가중치와 접힌 스케일러를 담은 .npz 압축 모델로 변환하고
+크기, 지연 시간, 정확도를 원본과 비교해 출력합니다. 압축 모델은 framework="compact"로 실행합니다.
+
+사용 예:
+    python export_compact.py -o notebooks/model_compact.npz
+    python export_compact.py -o model_fp16.npz --dtype float16 --prune 0.5 --remove-dead --report export.json
+    python cli.py triangles.npy --framework compact --model notebooks/model_compact.npz --scaler notebooks/model_compact.npz
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from models.adapters.compact_adapter import WEIGHT_DTYPES
+from models.compact_export import DEFAULT_HOLDOUT_SAMPLES, export_compact
+
+logger = logging.getLogger(__name__) # export_compact 모듈용 로거
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="압축 모델(.npz) 내보내기")
+    parser.add_argument("-o", "--output", required=True, help="저장할 .npz 경로")
+    parser.add_argument("--model", help="원본 모델 파일 경로 (기본값: notebooks/model.h5)")
+    parser.add_argument("--scaler", help="원본 스케일러 파일 경로 (기본값: notebooks/scaler.pkl)")
+    parser.add_argument("--dtype", choices=WEIGHT_DTYPES, default="int8", help="가중치 저장 형식")
+    parser.add_argument("--prune", type=float, default=0.0, help="레이어별로 0으로 만들 가중치 비율 (0~1)")
+    parser.add_argument("--remove-dead", action="store_true",
+                        help="보정 입력에서 출력이 항상 0인 유닛을 제거 (학습 범위 밖 입력의 출력이 바뀔 수 있음)")
+    parser.add_argument("--holdout", type=int, default=DEFAULT_HOLDOUT_SAMPLES, help="정확도 측정용 입력 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--report", help="보고서를 저장할 JSON 경로")
+    parser.add_argument("--log-level", default="WARNING", help="로그 레벨")
+    return parser
+
+
+def _change(new, old):
+    """old 대비 new의 변화율 열 (기준값이 0이면 n/a)"""
+    if not old:
+        return f"{'n/a':>12}"
+    return f"{new / old - 1:>+12.1%}"
+
+
+def format_report(report):
+    """보고서를 원본/압축 비교 표로 만듭니다."""
+    size = report["size_bytes"]
+    accuracy = report["accuracy"]
+    parameters = report["parameters"]
+    lines = [
+        f"{'':<22}{'original':>14}{'compact':>14}{'change':>12}",
+        f"{'size (bytes)':<22}{size['original']:>14,}{size['compact']:>14,}"
+        f"{_change(size['compact'], size['original'])}",
+        f"{'parameters':<22}{parameters['original']:>14,}{parameters['compact_nonzero']:>14,}"
+        f"{_change(parameters['compact_nonzero'], parameters['original'])}",
+        f"{'accuracy (vs math)':<22}{accuracy['original']:>14.4%}{accuracy['compact']:>14.4%}"
+        f"{accuracy['delta'] * 100:>+11.3f}p",
+    ]
+    latency = report.get("latency")
+    if latency:
+        original, compact = latency["original"], latency["compact"]
+        lines.append(f"{'single latency (ms)':<22}{original['single_ms']:>14.3f}{compact['single_ms']:>14.3f}"
+                     f"{_change(compact['single_ms'], original['single_ms'])}")
+        lines.append(f"{'batch rows/sec':<22}{original['batch_rows_per_second']:>14,.0f}"
+                     f"{compact['batch_rows_per_second']:>14,.0f}"
+                     f"{_change(compact['batch_rows_per_second'], original['batch_rows_per_second'])}")
+    lines.append(f"decision agreement with original: {report['agreement']:.4%} "
+                 f"(max |Δ| {report['max_abs_deviation']:.4f}, {report['holdout_samples']:,} held-out samples)")
+    for name, comparison in report.get("out_of_range", {}).items():
+        if comparison["agreement"] is None:
+            continue
+        lines.append(f"out of range ({name} inputs): agreement {comparison['agreement']:.4%} "
+                     f"(max |Δ| {comparison['max_abs_deviation']:.4f}, {comparison['flipped']:,} flipped)")
+    lines.append(f"removed units per hidden layer: {report['removed_units']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.holdout < 1:
+        parser.error("--holdout은 1 이상이어야 합니다.")
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+    try:
+        report = export_compact(args.output, model_path=args.model, scaler_path=args.scaler, weight_dtype=args.dtype,
+                                prune=args.prune, remove_dead=args.remove_dead,
+                                holdout_samples=args.holdout, seed=args.seed)
+    except Exception as e:
+        logger.exception(f"압축 모델 내보내기 실패: {e}")
+        return 1
+
+    print(f"saved {report['output_path']} ({report['weight_dtype']}, prune={report['prune']})")
+    print(format_report(report))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,22 @@
+import time
+PROCESS_STARTED = time.perf_counter() # 첫 프레임까지의 시간 측정 기준 (PySide6 임포트 전)
+
+import argparse
 import sys
 import traceback
 import os # os 모듈 임포트
 import logging # 로깅 모듈 임포트
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QUrl, QTimer
 from PySide6.QtQml import QQmlApplicationEngine
 from core.triangle_validator_core import TriangleValidatorCore
+from core.model_registry import default_registry
+from core import profiling
+from core.profiling import phase
 # from models.triangle_model import TriangleModel # 더 이상 직접 사용하지 않으므로 제거
 from viewmodels.triangle_viewmodel import TriangleViewModel
+from viewmodels.decision_map_viewmodel import DecisionMapViewModel, IMAGE_PROVIDER_ID
+IMPORTS_FINISHED = time.perf_counter()
 
 # 애플리케이션 루트 경로 설정
 APP_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -28,25 +37,85 @@ def setup_logging():
 
 logger = logging.getLogger(__name__) # main 모듈용 로거
 
+def parse_args(argv):
+    """애플리케이션 옵션을 읽습니다. 알 수 없는 인자는 Qt 옵션으로 QApplication에 전달합니다."""
+    parser = argparse.ArgumentParser(description="AI 삼각형 검증기")
+    parser.add_argument("--profile", nargs="?", const=profiling.DEFAULT_TRACE_PATH,
+                        default=os.environ.get(profiling.PROFILE_ENV_VAR),
+                        help="시작 단계 타임라인을 Chrome trace JSON으로 저장 "
+                             f"(환경 변수 {profiling.PROFILE_ENV_VAR}=경로 로도 지정 가능)")
+    parser.add_argument("--profile-cprofile", action="store_true",
+                        help="메인 스레드를 cProfile로 감싸 <trace 경로>.prof로 저장")
+    parser.add_argument("--profile-tracemalloc", action="store_true",
+                        help="단계마다 Python 힙 사용량을 기록하고 종료 시 상위 할당 위치를 저장 "
+                             "(TensorFlow 임포트가 크게 느려지므로 타임라인과 따로 측정 권장)")
+    parser.add_argument("--profile-exit", action="store_true",
+                        help="첫 예측까지 기록한 뒤 자동 종료 (빌드 간 반복 측정용)")
+    return parser.parse_known_args(argv)
+
+def start_profiling(args):
+    """프로파일링 옵션이 켜져 있으면 타임라인(과 cProfile)을 시작합니다."""
+    if not args.profile:
+        return None, None
+    timeline = profiling.enable_profiling(args.profile, origin=PROCESS_STARTED, trace_memory=args.profile_tracemalloc)
+    # 이 모듈의 임포트(PySide6, NumPy, core)는 타임라인을 켜기 전에 끝났으므로 측정값으로 추가
+    timeline.add_complete("python_imports", PROCESS_STARTED, IMPORTS_FINISHED)
+    profiler = None
+    if args.profile_cprofile:
+        import cProfile
+        profiler = cProfile.Profile() # 메인(GUI) 스레드만 기록. 백그라운드 모델 로드는 타임라인으로 확인
+        profiler.enable()
+    logger.info(f"프로파일링 사용: {args.profile}")
+    return timeline, profiler
+
+def finish_profiling(timeline, profiler):
+    """타임라인과 cProfile/tracemalloc 결과를 trace 경로 옆에 저장합니다."""
+    if timeline is None:
+        return
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(timeline.path + ".prof")
+        logger.info(f"cProfile 결과 저장: {timeline.path}.prof")
+    if timeline.trace_memory:
+        profiling.save_tracemalloc_report(timeline.path + ".tracemalloc.txt")
+    timeline.save()
+
 def main():
     try:
         setup_logging() # 로깅 설정 함수 호출
+        args, qt_args = parse_args(sys.argv[1:])
+        timeline, profiler = start_profiling(args)
         logger.info("애플리케이션 시작 중...")
-        app = QApplication(sys.argv)
+        with phase("qapplication_init"):
+            app = QApplication(sys.argv[:1] + qt_args)
+        if timeline is not None:
+            app.aboutToQuit.connect(lambda: finish_profiling(timeline, profiler))
         
         logger.info("의존성 설정 중...")
-        validator = TriangleValidatorCore()
-        logger.info("TriangleValidatorCore 생성 완료")
+        # GUI는 한 번에 한 건씩 예측하므로 지연 시간 최적화 모드 사용
+        # 모델/스케일러(TensorFlow 임포트 포함)는 창이 그려진 뒤 백그라운드에서 로드
+        with phase("core_init"):
+            validator = TriangleValidatorCore(adapter_options={"latency_mode": True}, load_on_init=False)
+        logger.info("TriangleValidatorCore 생성 완료 (모델은 첫 프레임 이후 로드)")
+        # 재학습한 model.h5 / scaler.pkl로 교체되면 재시작 없이 새 버전으로 전환
+        default_registry().start_watching()
         
         # QML 엔진 생성
         logger.info("QML 엔진 생성 중...")
-        engine = QQmlApplicationEngine()
+        with phase("qml_engine_init"):
+            engine = QQmlApplicationEngine()
         
         # Python 객체를 QML에 노출
         logger.info("ViewModel 생성 중...")
-        triangle_viewmodel = TriangleViewModel(validator)
+        with phase("viewmodel_init"):
+            triangle_viewmodel = TriangleViewModel(validator)
+            # validator 호출이 겹치지 않도록 결정 지도 계산도 검증 스레드 풀에서 실행
+            decision_map_viewmodel = DecisionMapViewModel(
+                validator, thread_pool=triangle_viewmodel.validation_thread_pool())
         logger.info("ViewModel을 QML에 노출 중...")
         engine.rootContext().setContextProperty("triangleVisualizer", triangle_viewmodel)
+        engine.rootContext().setContextProperty("decisionMap", decision_map_viewmodel)
+        engine.addImageProvider(IMAGE_PROVIDER_ID, decision_map_viewmodel.image_provider)
         
         # QML 파일 로드 (애플리케이션 루트 기준 상대 경로)
         logger.info("QML 파일 로드 중...")
@@ -75,12 +144,39 @@ def main():
                 logger.critical(f"QML 파일 완전 실패: {fallback_qml_path}")
                 sys.exit(-1)
         
-        engine.load(QUrl.fromLocalFile(qml_path))
+        with phase("qml_load"):
+            engine.load(QUrl.fromLocalFile(qml_path))
         
         if not engine.rootObjects():
             logger.critical("QML 파일 로드 실패 또는 루트 객체 없음")
             sys.exit(-1)
         
+        window = engine.rootObjects()[0]
+
+        def on_first_frame():
+            window.frameSwapped.disconnect(on_first_frame)
+            logger.info(f"첫 프레임까지 걸린 시간 (time-to-first-frame): {time.perf_counter() - PROCESS_STARTED:.3f}s")
+            profiling.mark("first_frame")
+            triangle_viewmodel.loadModelInBackground()
+
+        window.frameSwapped.connect(on_first_frame)
+
+        if timeline is not None:
+            def on_model_state_changed():
+                if triangle_viewmodel.isModelLoading:
+                    return
+                triangle_viewmodel.modelStateChanged.disconnect(on_model_state_changed)
+                if triangle_viewmodel.modelReady:
+                    # 첫 예측(TensorFlow 첫 실행 비용 포함)을 GUI 스레드에서 한 번 측정
+                    with phase("first_predict"):
+                        validator.validate(3, 4, 5)
+                else:
+                    profiling.mark("model_load_failed")
+                if args.profile_exit:
+                    QTimer.singleShot(0, app.quit)
+
+            triangle_viewmodel.modelStateChanged.connect(on_model_state_changed)
+
         logger.info("애플리케이션 실행 준비 완료.")
         sys.exit(app.exec())
     except Exception as e:
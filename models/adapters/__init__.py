@@ -6,13 +6,18 @@ ML 모델 어댑터 팩토리
 
 # 절대 경로 임포트 대신 상대 경로 임포트 사용
 from .tf_adapter import TensorFlowAdapter
+from .numpy_adapter import NumpyAdapter
+from .compact_adapter import CompactAdapter
 
-def get_adapter(framework="tensorflow"):
+def get_adapter(framework="tensorflow", **options):
     """
     지정된 프레임워크에 대한 어댑터를 반환합니다.
     
     Args:
         framework (str): ML 프레임워크 이름 (기본값: "tensorflow")
+            "numpy"는 TensorFlow 없이 h5 가중치를 NumPy로 실행합니다.
+            "compact"는 models/compact_export.py로 내보낸 .npz 압축 모델을 NumPy로 실행합니다.
+        **options: 어댑터 생성자에 전달할 옵션 (예: tensorflow의 latency_mode=True)
         
     Returns:
         MLModelAdapter: 요청된 프레임워크에 대한 어댑터 인스턴스
@@ -23,7 +28,11 @@ def get_adapter(framework="tensorflow"):
     framework = framework.lower()
     
     if framework == "tensorflow":
-        return TensorFlowAdapter()
+        return TensorFlowAdapter(**options)
+    elif framework == "numpy":
+        return NumpyAdapter(**options)
+    elif framework == "compact":
+        return CompactAdapter(**options)
     # 향후 다른 프레임워크 지원 추가
     # elif framework == "pytorch":
     #     return PyTorchAdapter()
@@ -5,8 +5,11 @@ ML 모델 어댑터 인터페이스
 새로운 ML 프레임워크 지원을 추가하려면 이 인터페이스를 구현하는 새 어댑터를 생성하세요.
 """
 
+import contextlib
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 class MLModelAdapter(ABC):
     """
     ML 모델 어댑터 인터페이스
@@ -14,6 +17,25 @@ class MLModelAdapter(ABC):
     다양한 ML 프레임워크(TensorFlow, PyTorch, ONNX 등)에 대한 
     일관된 인터페이스를 제공하는 추상 기본 클래스입니다.
     """
+
+    # 검증 경로 계측 (core.metrics.PipelineMetrics). TriangleValidatorCore가 설정하며,
+    # None이면 어댑터는 단계별 시간을 측정하지 않습니다.
+    metrics = None
+    # 로드 단계 기록 콜백 phase_hook(name) -> 컨텍스트 매니저 (core.profiling.phase).
+    # 모델 계층은 core를 임포트하지 않으므로 호출 측(core.model_registry)이 설정하며, None이면 기록하지 않습니다.
+    phase_hook = None
+
+    def _phase(self, name):
+        hook = self.phase_hook
+        return hook(name) if hook is not None else contextlib.nullcontext()
+
+    def import_framework(self):
+        """
+        모델 로드에 필요한 프레임워크 모듈을 임포트합니다.
+
+        임포트 비용을 모델 파일 로드와 따로 측정할 수 있도록 load_model 전에 호출됩니다.
+        기본 구현은 아무것도 하지 않으며, load_model도 필요한 모듈을 직접 임포트해야 합니다.
+        """
     
     @abstractmethod
     def load_model(self, model_path):
@@ -42,6 +64,56 @@ class MLModelAdapter(ABC):
         """
         pass
     
+    def predict_batch(self, model, input_data, scaler=None):
+        """
+        N×3 입력 전체에 대한 예측을 수행합니다.
+        
+        기본 구현은 predict를 행 단위로 반복 호출합니다.
+        프레임워크 어댑터는 한 번의 호출로 배치 전체를 처리하도록 재정의해야 합니다.
+        
+        Args:
+            model (object): load_model로 로드된 모델 객체
+            input_data (numpy.ndarray): (N, 3) 형태의 입력 데이터
+            scaler (object, optional): 학습된 스케일러 객체
+            
+        Returns:
+            numpy.ndarray: (N,) 형태의 예측 결과 (0~1 사이 값)
+        """
+        return np.array([self.predict(model, row, scaler=scaler) for row in input_data], dtype=np.float64)
+
+    def load_scaler(self, scaler_path):
+        """
+        스케일러 파일을 로드합니다.
+
+        기본 구현은 joblib으로 저장한 scikit-learn 스케일러를 읽습니다.
+        스케일러를 모델 파일에 함께 저장하는 어댑터는 재정의할 수 있습니다.
+
+        Args:
+            scaler_path (str): 스케일러 파일 경로
+
+        Returns:
+            object: transform 메서드를 가진 스케일러 객체
+        """
+        with self._phase("joblib_import"):
+            import joblib # 임포트 비용이 크므로 처음 로드할 때 임포트
+        with self._phase("joblib_load"):
+            return joblib.load(scaler_path)
+
+    def clone_model(self, model):
+        """
+        동시 호출용 모델 복제본을 만듭니다 (core.replica_pool.ReplicaPool에서 사용).
+
+        기본 구현은 같은 모델 객체를 반환합니다. 예측이 모델 상태를 바꾸지 않아
+        여러 스레드에서 동시에 호출해도 안전한 어댑터는 재정의할 필요가 없습니다.
+
+        Args:
+            model (object): load_model로 로드된 모델 객체
+
+        Returns:
+            object: predict/predict_batch에 넘길 수 있는 모델 객체
+        """
+        return model
+    
     @abstractmethod
     def get_framework_name(self):
         """
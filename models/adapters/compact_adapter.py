@@ -0,0 +1,210 @@
+"""
+압축 모델 추론 어댑터
+
+models/compact_export.py로 내보낸 .npz 압축 모델(int8 또는 float16 가중치, 스케일러가 첫 레이어에
+접힌 상태)을 TensorFlow, scikit-learn, joblib 없이 NumPy로 실행합니다.
+
+NumPy는 int8/float16 행렬곱을 BLAS로 가속하지 않으므로, 가중치는 파일에 저정밀도로 저장하고
+로드할 때 한 번만 float32로 복원(dequantize)해 float32 BLAS 행렬곱으로 실행합니다.
+스케일러 파라미터도 같은 파일에 들어 있으므로 scaler_path에 모델과 같은 .npz 경로를 넘기면
+scaler.pkl이 필요 없습니다.
+"""
+
+import logging
+import os
+
+import numpy as np
+
+from models.adapters.numpy_adapter import ACTIVATIONS, NumpyAdapter
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+WEIGHT_DTYPES = ("int8", "float16", "float32")
+
+
+class AffineScaler:
+    """
+    특성별 아핀 변환 스케일러 (transform(x) = x * scale + offset)
+
+    압축 모델 파일에 저장된 원본 스케일러 파라미터로 만들며, scikit-learn 스케일러와 같은
+    transform 메서드를 제공하므로 LUT/cascade 등 스케일러를 받는 다른 코드에서도 사용할 수 있습니다.
+    """
+
+    def __init__(self, scale, offset):
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.float64)
+
+    @classmethod
+    def from_scaler(cls, scaler, n_features=3):
+        """transform 메서드를 가진 특성별 아핀 스케일러에서 파라미터를 추출합니다."""
+        offset = np.asarray(scaler.transform(np.zeros((1, n_features))), dtype=np.float64)[0]
+        basis = np.asarray(scaler.transform(np.eye(n_features)), dtype=np.float64) - offset
+        scale = np.diag(basis)
+        if not np.allclose(basis, np.diag(scale)):
+            raise ValueError("특성별 아핀 변환이 아닌 스케일러는 압축 모델에 넣을 수 없습니다.")
+        return cls(scale, offset)
+
+    def transform(self, x):
+        return np.asarray(x, dtype=np.float64) * self.scale + self.offset
+
+
+class CompactMLP:
+    """
+    스케일러가 접힌 float32 Dense 레이어 스택
+
+    layers는 (kernel, bias, activation 이름) 튜플의 리스트이며, 입력은 스케일하지 않은 원본 세 변입니다.
+    """
+
+    def __init__(self, layers, weight_dtype="float32", source_path=None, metadata=None):
+        self.layers = layers
+        self.weight_dtype = weight_dtype
+        self.source_path = source_path
+        self.metadata = dict(metadata or {})
+
+    def forward(self, raw_inputs):
+        x = np.asarray(raw_inputs, dtype=np.float32)
+        for kernel, bias, activation in self.layers:
+            x = ACTIVATIONS[activation](x @ kernel + bias)
+        return x[:, 0]
+
+    def parameter_count(self):
+        """0이 아닌 가중치 수와 전체 가중치 수"""
+        total = sum(kernel.size + bias.size for kernel, bias, _ in self.layers)
+        nonzero = sum(int(np.count_nonzero(kernel)) + int(np.count_nonzero(bias)) for kernel, bias, _ in self.layers)
+        return nonzero, total
+
+
+def quantize_kernel(kernel, weight_dtype):
+    """
+    가중치를 저장용 저정밀도 배열로 변환합니다.
+
+    int8은 출력 유닛(열)별 대칭 양자화로, kernel ≈ quantized * scale 입니다.
+
+    Returns:
+        tuple: (저장할 배열, 열별 scale (int8이 아니면 None))
+    """
+    if weight_dtype == "int8":
+        max_abs = np.abs(kernel).max(axis=0)
+        scale = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+        quantized = np.clip(np.rint(kernel / scale), -127, 127).astype(np.int8)
+        return quantized, scale
+    if weight_dtype in ("float16", "float32"):
+        return kernel.astype(weight_dtype), None
+    raise ValueError(f"지원하지 않는 가중치 형식입니다: {weight_dtype} (가능한 값: {WEIGHT_DTYPES})")
+
+
+def dequantize_kernel(stored, scale):
+    """quantize_kernel의 역변환 (float32)"""
+    kernel = stored.astype(np.float32)
+    if scale is not None:
+        kernel *= scale
+    return kernel
+
+
+def save_compact(path, layers, scaler, weight_dtype, metadata=None):
+    """
+    스케일러가 접힌 레이어를 압축 .npz 파일로 저장합니다.
+
+    Args:
+        path (str): 저장 경로 (.npz)
+        layers (list): 스케일러가 접힌 float (kernel, bias, activation) 리스트
+        scaler (AffineScaler): 원본 스케일러 파라미터 (load_scaler용)
+        weight_dtype (str): "int8", "float16", "float32"
+        metadata (dict, optional): 함께 저장할 문자열/숫자 정보 (원본 지문, 가지치기 비율 등)
+    """
+    arrays = {
+        "format_version": np.array(FORMAT_VERSION),
+        "weight_dtype": np.array(weight_dtype),
+        "activations": np.array([str(activation) for _, _, activation in layers]),
+        "scaler_scale": scaler.scale,
+        "scaler_offset": scaler.offset,
+    }
+    for index, (kernel, bias, _) in enumerate(layers):
+        stored, scale = quantize_kernel(np.asarray(kernel, dtype=np.float32), weight_dtype)
+        arrays[f"kernel_{index}"] = stored
+        arrays[f"bias_{index}"] = np.asarray(bias, dtype=np.float32)
+        if scale is not None:
+            arrays[f"kernel_scale_{index}"] = scale
+    for key, value in (metadata or {}).items():
+        arrays[f"meta_{key}"] = np.array(value)
+    np.savez_compressed(path, **arrays)
+
+
+class CompactAdapter(NumpyAdapter):
+    """
+    압축 모델(.npz)을 실행하는 어댑터
+
+    스케일러는 첫 레이어에 이미 접혀 있으므로 predict/predict_batch의 scaler 인자는 사용하지 않습니다.
+    """
+
+    def import_framework(self):
+        pass # .npz는 NumPy만으로 읽으므로 h5py가 필요 없음
+
+    def load_model(self, model_path):
+        """
+        압축 모델 파일을 읽어 float32 레이어로 복원합니다.
+
+        Args:
+            model_path (str): export_compact로 만든 .npz 파일 경로
+
+        Returns:
+            CompactMLP: NumPy로 실행 가능한 모델 객체
+
+        Raises:
+            FileNotFoundError: 모델 파일이 존재하지 않을 경우
+            ValueError: 형식 버전이나 활성화 함수를 지원하지 않는 경우
+        """
+        if not os.path.exists(model_path):
+            logger.error(f"모델 파일을 찾을 수 없습니다: {model_path}")
+            raise FileNotFoundError(f"모델 파일 '{model_path}'이 존재하지 않습니다.")
+
+        with np.load(model_path, allow_pickle=False) as data:
+            version = int(data["format_version"])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 압축 모델 형식 버전입니다: {version}")
+            weight_dtype = str(data["weight_dtype"])
+            layers = []
+            for index, activation in enumerate(data["activations"].tolist()):
+                activation = None if activation == "None" else activation
+                if activation not in ACTIVATIONS:
+                    raise ValueError(f"지원하지 않는 활성화 함수입니다: {activation}")
+                scale_key = f"kernel_scale_{index}"
+                scale = data[scale_key] if scale_key in data.files else None
+                layers.append((dequantize_kernel(data[f"kernel_{index}"], scale), data[f"bias_{index}"], activation))
+            metadata = {key[len("meta_"):]: data[key].item() for key in data.files if key.startswith("meta_")}
+
+        logger.info(f"압축 모델 로드 성공: {model_path} ({weight_dtype}, Dense {len(layers)}개)")
+        return CompactMLP(layers, weight_dtype, source_path=model_path, metadata=metadata)
+
+    def load_scaler(self, scaler_path):
+        """
+        .npz 압축 모델 파일이면 저장된 스케일러 파라미터를, 아니면 joblib 스케일러를 읽습니다.
+        """
+        if scaler_path.endswith(".npz"):
+            with np.load(scaler_path, allow_pickle=False) as data:
+                return AffineScaler(data["scaler_scale"], data["scaler_offset"])
+        return super().load_scaler(scaler_path)
+
+    def predict_batch(self, model, input_data, scaler=None):
+        """
+        배치 전체를 예측합니다. 스케일러는 모델에 접혀 있으므로 scaler는 사용하지 않습니다.
+
+        Args:
+            model (CompactMLP): load_model로 로드된 모델
+            input_data (numpy.ndarray): (N, 3) 형태의 원본 입력
+
+        Returns:
+            numpy.ndarray: (N,) 형태의 예측 결과 (0~1 사이 값)
+        """
+        processed_input_data = np.asarray(input_data, dtype=np.float64).reshape(-1, 3)
+        return model.forward(processed_input_data).astype(np.float64)
+
+    def get_framework_name(self):
+        """
+        프레임워크 이름 반환
+
+        Returns:
+            str: "Compact"
+        """
+        return "Compact"
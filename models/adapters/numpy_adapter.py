@@ -0,0 +1,290 @@
+"""
+NumPy 추론 어댑터
+
+이 모듈은 Keras로 학습된 Dense 기반 모델(.h5)을 TensorFlow 없이 실행하는 어댑터를 제공합니다.
+h5py로 가중치와 활성화 함수만 읽어 순전파를 NumPy 행렬곱으로 수행하므로
+TensorFlow 임포트와 load_model에 드는 시작 시간과 메모리가 필요 없습니다.
+"""
+
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from models.adapters.base_adapter import MLModelAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def _relu(x):
+    return np.maximum(x, 0, out=x)
+
+
+def _sigmoid(x):
+    # 0.5 * (1 + tanh(x / 2))는 exp 오버플로 없이 sigmoid와 같은 값을 계산합니다.
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+def _linear(x):
+    return x
+
+
+ACTIVATIONS = {
+    "relu": _relu,
+    "sigmoid": _sigmoid,
+    "tanh": np.tanh,
+    "linear": _linear,
+    None: _linear,
+}
+
+# 추론 시 항등 함수로 동작하므로 건너뛰는 레이어
+PASSTHROUGH_LAYERS = {"InputLayer", "Dropout", "Flatten"}
+
+
+class NumpyMLP:
+    """
+    h5 파일에서 읽은 Dense 레이어 스택
+
+    layers는 (kernel, bias, activation 이름) 튜플의 리스트입니다.
+    스케일러는 첫 번째 Dense 레이어에 접어 넣어(fold) 예측 시 별도 변환 없이 사용합니다.
+    """
+
+    def __init__(self, layers, source_path=None):
+        self.layers = layers
+        self.source_path = source_path
+        # (scaler, 접힌 레이어) 묶음. 여러 스레드에서 읽으므로 튜플 하나로 교체
+        self._folded = (None, None)
+
+    def folded_layers(self, scaler):
+        """
+        스케일러 변환을 첫 번째 레이어 가중치에 접어 넣은 레이어 목록을 반환합니다.
+
+        StandardScaler, MinMaxScaler처럼 특성(feature)별 아핀 변환인 스케일러라면
+        transform(x) = x * s + t 로 쓸 수 있으므로 W' = diag(s) W, b' = b + t W 가 됩니다.
+        같은 스케일러 객체에 대해서는 한 번만 계산합니다.
+
+        Args:
+            scaler (object): transform 메서드를 가진 학습된 스케일러
+
+        Returns:
+            list: 스케일러가 접힌 (kernel, bias, activation) 리스트
+        """
+        folded_scaler, folded_layers = self._folded
+        if folded_scaler is scaler and folded_layers is not None:
+            return folded_layers
+
+        n_features = self.layers[0][0].shape[0]
+        offset = np.asarray(scaler.transform(np.zeros((1, n_features))), dtype=np.float64)[0]
+        basis = np.asarray(scaler.transform(np.eye(n_features)), dtype=np.float64) - offset
+        scale = np.diag(basis)
+        if not np.allclose(basis, np.diag(scale)):
+            raise ValueError("특성별 아핀 변환이 아닌 스케일러는 가중치에 접을 수 없습니다.")
+
+        kernel, bias, activation = self.layers[0]
+        kernel64 = kernel.astype(np.float64)
+        folded_kernel = (scale[:, None] * kernel64).astype(np.float32)
+        folded_bias = (bias.astype(np.float64) + offset @ kernel64).astype(np.float32)
+
+        folded_layers = [(folded_kernel, folded_bias, activation)] + list(self.layers[1:])
+        self._folded = (scaler, folded_layers)
+        return folded_layers
+
+    def forward(self, raw_inputs, scaler):
+        """
+        스케일되지 않은 원본 입력에 대해 순전파를 수행합니다.
+
+        Args:
+            raw_inputs (numpy.ndarray): (N, n_features) 형태의 원본 입력
+            scaler (object): 학습된 스케일러
+
+        Returns:
+            numpy.ndarray: (N,) 형태의 출력 (마지막 레이어의 첫 번째 유닛)
+        """
+        x = np.asarray(raw_inputs, dtype=np.float32)
+        for kernel, bias, activation in self.folded_layers(scaler):
+            x = ACTIVATIONS[activation](x @ kernel + bias)
+        return x[:, 0]
+
+
+def _find_dataset(group, name):
+    """Keras 버전에 따라 다른 위치에 저장된 가중치 데이터셋을 찾습니다."""
+    found = []
+
+    def visitor(path, obj):
+        # Keras 3: ".../dense/kernel", Keras 2: ".../dense/kernel:0"
+        leaf = path.rsplit("/", 1)[-1]
+        if hasattr(obj, "shape") and leaf.split(":")[0] == name:
+            found.append(obj)
+
+    group.visititems(visitor)
+    if len(found) != 1:
+        raise ValueError(f"가중치 '{name}'를 찾을 수 없습니다: {group.name}")
+    return np.asarray(found[0], dtype=np.float32)
+
+
+class NumpyAdapter(MLModelAdapter):
+    """
+    TensorFlow 없이 NumPy로 추론하는 어댑터 구현
+
+    Sequential 구조의 Dense/Dropout/Flatten 모델만 지원합니다.
+    """
+
+    def import_framework(self):
+        import h5py
+
+    def load_model(self, model_path):
+        """
+        h5 파일에서 Dense 레이어 가중치와 활성화 함수를 읽습니다.
+
+        Args:
+            model_path (str): Keras로 저장한 .h5 모델 파일 경로
+
+        Returns:
+            NumpyMLP: NumPy로 실행 가능한 모델 객체
+
+        Raises:
+            FileNotFoundError: 모델 파일이 존재하지 않을 경우
+            ValueError: 지원하지 않는 레이어나 활성화 함수가 포함된 경우
+        """
+        import h5py
+
+        if not os.path.exists(model_path):
+            logger.error(f"모델 파일을 찾을 수 없습니다: {model_path}")
+            raise FileNotFoundError(f"모델 파일 '{model_path}'이 존재하지 않습니다.")
+
+        with h5py.File(model_path, "r") as f:
+            model_config = f.attrs["model_config"]
+            if isinstance(model_config, bytes):
+                model_config = model_config.decode("utf-8")
+            config = json.loads(model_config)
+            if config.get("class_name") != "Sequential":
+                raise ValueError(f"Sequential 모델만 지원합니다: {config.get('class_name')}")
+
+            weights_root = f["model_weights"]
+            layers = []
+            for layer in config["config"]["layers"]:
+                class_name = layer["class_name"]
+                layer_config = layer["config"]
+                if class_name in PASSTHROUGH_LAYERS:
+                    continue
+                if class_name != "Dense":
+                    raise ValueError(f"지원하지 않는 레이어입니다: {class_name}")
+
+                activation = layer_config.get("activation")
+                if activation not in ACTIVATIONS:
+                    raise ValueError(f"지원하지 않는 활성화 함수입니다: {activation}")
+
+                layer_group = weights_root[layer_config["name"]]
+                kernel = _find_dataset(layer_group, "kernel")
+                if layer_config.get("use_bias", True):
+                    bias = _find_dataset(layer_group, "bias")
+                else:
+                    bias = np.zeros(kernel.shape[1], dtype=np.float32)
+                layers.append((kernel, bias, activation))
+
+        if not layers:
+            raise ValueError(f"Dense 레이어가 없는 모델입니다: {model_path}")
+
+        logger.info(f"NumPy 모델 로드 성공: {model_path} (Dense {len(layers)}개)")
+        return NumpyMLP(layers, source_path=model_path)
+
+    def predict(self, model, input_data, scaler=None):
+        """
+        NumPy 순전파로 단일 입력에 대한 예측을 수행합니다.
+
+        Args:
+            model (NumpyMLP): load_model로 로드된 모델
+            input_data (list or numpy.ndarray): 세 변의 길이
+            scaler (object): 학습된 스케일러 객체
+
+        Returns:
+            float: 예측 결과 (0~1 사이 값)
+        """
+        metrics = self.metrics
+        if metrics is None:
+            return float(self.predict_batch(model, input_data, scaler=scaler)[0])
+        # 스케일러는 첫 레이어에 접혀 있으므로 scaler_transform 단계 없이 순전파 시간만 기록
+        started = time.perf_counter()
+        result = float(self.predict_batch(model, input_data, scaler=scaler)[0])
+        metrics.observe("model_forward", time.perf_counter() - started)
+        return result
+
+    def predict_batch(self, model, input_data, scaler=None):
+        """
+        NumPy 순전파로 배치 전체를 예측합니다.
+
+        Args:
+            model (NumpyMLP): load_model로 로드된 모델
+            input_data (numpy.ndarray): (N, 3) 형태의 입력 데이터
+            scaler (object): 학습된 스케일러 객체
+
+        Returns:
+            numpy.ndarray: (N,) 형태의 예측 결과 (0~1 사이 값)
+        """
+        if scaler is None:
+            logger.error("예측을 위한 스케일러(scaler) 객체가 제공되지 않았습니다.")
+            raise ValueError("스케일러 객체가 필요합니다.")
+
+        processed_input_data = np.asarray(input_data, dtype=np.float64).reshape(-1, 3)
+        return model.forward(processed_input_data, scaler).astype(np.float64)
+
+    def measure_deviation(self, model, scaler, reference_inputs=None, reference_model_path=None):
+        """
+        TensorFlow 어댑터 출력과의 최대 편차를 측정합니다.
+
+        Args:
+            model (NumpyMLP): load_model로 로드된 모델
+            scaler (object): 학습된 스케일러 객체
+            reference_inputs (numpy.ndarray, optional): (N, 3) 기준 입력.
+                기본값은 1~99 범위의 고정 시드 무작위 삼각형 10,000개입니다.
+            reference_model_path (str, optional): 비교할 Keras 모델 경로. 기본값은 model.source_path
+
+        Returns:
+            dict: max_abs_deviation, mean_abs_deviation, decision_mismatches, samples
+        """
+        from models.adapters.tf_adapter import TensorFlowAdapter
+
+        if reference_inputs is None:
+            rng = np.random.default_rng(0)
+            reference_inputs = rng.uniform(1.0, 99.0, size=(10_000, 3))
+        reference_inputs = np.asarray(reference_inputs, dtype=np.float64).reshape(-1, 3)
+
+        tf_adapter = TensorFlowAdapter()
+        tf_model = tf_adapter.load_model(reference_model_path or model.source_path)
+        expected = tf_adapter.predict_batch(tf_model, reference_inputs, scaler=scaler)
+        actual = self.predict_batch(model, reference_inputs, scaler=scaler)
+
+        deviation = np.abs(actual - expected)
+        report = {
+            "max_abs_deviation": float(deviation.max()) if deviation.size else 0.0,
+            "mean_abs_deviation": float(deviation.mean()) if deviation.size else 0.0,
+            "decision_mismatches": int(np.count_nonzero((actual > 0.5) != (expected > 0.5))),
+            "samples": int(reference_inputs.shape[0]),
+        }
+        logger.info(f"NumPy 어댑터 편차 (TensorFlow 대비): {report}")
+        return report
+
+    def get_framework_name(self):
+        """
+        프레임워크 이름 반환
+
+        Returns:
+            str: "NumPy"
+        """
+        return "NumPy"
+
+
+# Test
+if __name__ == '__main__':
+    import joblib
+
+    logging.basicConfig(level=logging.INFO)
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    test_model_path = os.path.join(project_root, 'notebooks', 'model.h5')
+    test_scaler_path = os.path.join(project_root, 'notebooks', 'scaler.pkl')
+
+    adapter = NumpyAdapter()
+    numpy_model = adapter.load_model(test_model_path)
+    print(adapter.measure_deviation(numpy_model, joblib.load(test_scaler_path)))
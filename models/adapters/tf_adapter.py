@@ -9,9 +9,40 @@ import numpy as np
 from models.adapters.base_adapter import MLModelAdapter
 import os
 import logging
+import threading
+import time
+import weakref
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# 모델 객체별로 트레이싱한 serving 함수. 모델 레지스트리가 로드한 모델을 여러 어댑터 인스턴스가
+# 함께 사용하므로 어댑터가 아닌 모델 객체에 연결하며, 모델이 해제되면 함께 사라집니다.
+_SERVING_FNS = weakref.WeakKeyDictionary()
+
+def configure_threads(intra_op_threads=None, inter_op_threads=None):
+    """
+    TensorFlow 연산 스레드 수를 설정합니다.
+
+    TensorFlow 런타임이 초기화되기 전(첫 모델 로드 전)에 호출해야 적용됩니다.
+    여러 프로세스나 모델 복제본을 함께 실행할 때 CPU 과다 구독을 막는 데 사용합니다.
+
+    Args:
+        intra_op_threads (int, optional): 연산 하나를 병렬 처리하는 스레드 수
+        inter_op_threads (int, optional): 독립 연산을 동시에 실행하는 스레드 수
+    """
+    import tensorflow as tf
+
+    try:
+        if intra_op_threads:
+            tf.config.threading.set_intra_op_parallelism_threads(int(intra_op_threads))
+        if inter_op_threads:
+            tf.config.threading.set_inter_op_parallelism_threads(int(inter_op_threads))
+        logger.info(f"TensorFlow 스레드 설정: intra_op={intra_op_threads}, inter_op={inter_op_threads}")
+    except RuntimeError as e:
+        # 런타임이 이미 초기화된 경우에는 변경할 수 없음
+        logger.warning(f"TensorFlow 스레드 설정 실패 (이미 초기화됨): {e}")
+
 class TensorFlowAdapter(MLModelAdapter):
     """
     TensorFlow 모델을 위한 어댑터 구현
@@ -19,7 +50,34 @@ class TensorFlowAdapter(MLModelAdapter):
     TensorFlow 의존성을 이 클래스 내부로 제한하여
     애플리케이션의 다른 부분이 TensorFlow에 직접 의존하지 않도록 합니다.
     """
-    
+
+    # predict_batch에서 모델을 한 번에 호출하는 최대 행 수
+    BATCH_SIZE = 8192
+    # latency_stats 계산에 사용하는 최근 호출 수
+    LATENCY_WINDOW = 1024
+
+    def __init__(self, latency_mode=False, intra_op_threads=None, inter_op_threads=None):
+        """
+        Args:
+            latency_mode (bool, optional): True이면 load_model 시 고정 시그니처로
+                트레이싱한 tf.function을 만들고 워밍업한 뒤, predict에서
+                Keras 모델 호출 대신 이 함수를 직접 호출합니다. 기본값은 False
+            intra_op_threads (int, optional): TensorFlow 연산 하나를 병렬 처리하는 스레드 수
+            inter_op_threads (int, optional): 독립 연산을 동시에 실행하는 스레드 수.
+                둘 다 프로세스 전역 설정이며 첫 모델 로드 전에만 적용됩니다.
+                여러 스레드가 동시에 예측한다면 (동시 호출 수 × intra_op_threads)가
+                CPU 코어 수를 넘지 않도록 설정합니다.
+        """
+        self.latency_mode = latency_mode
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        # predict는 여러 스레드에서 동시에 호출될 수 있어 기록을 복사하는 동안 추가되지 않도록 보호
+        self._latencies_lock = threading.Lock()
+
+    def import_framework(self):
+        import tensorflow # 첫 호출에서만 실제 임포트 비용이 발생
+
     def load_model(self, model_path):
         """
         TensorFlow 모델을 로드합니다.
@@ -35,19 +93,98 @@ class TensorFlowAdapter(MLModelAdapter):
             Exception: 기타 모델 로드 실패 시 발생
         """
         import tensorflow as tf
+        if self.intra_op_threads or self.inter_op_threads:
+            configure_threads(self.intra_op_threads, self.inter_op_threads)
         
         if not os.path.exists(model_path):
             logger.error(f"모델 파일을 찾을 수 없습니다: {model_path}")
             raise FileNotFoundError(f"모델 파일 '{model_path}'이 존재하지 않습니다.")
         
         try:
-            model = tf.keras.models.load_model(model_path)
+            with self._phase("keras_load_model"):
+                model = tf.keras.models.load_model(model_path)
             logger.info(f"모델 파일 '{model_path}'을 성공적으로 로드했습니다.")
+            if self.latency_mode:
+                with self._phase("serving_fn_trace"):
+                    self._prepare_serving_fn(model)
             return model
         except Exception as e:
             logger.error(f"TensorFlow 모델 로드 중 오류 발생 ({model_path}): {e}", exc_info=True)
             raise Exception(f"TensorFlow 모델 로드 실패 ({model_path}): {str(e)}")
-    
+
+    def _prepare_serving_fn(self, model):
+        """
+        단일 요청용 tf.function을 트레이싱하고 워밍업합니다.
+
+        model.predict는 호출마다 데이터 어댑터와 스텝 루프를 새로 구성하지만,
+        입력 시그니처를 고정한 tf.function은 첫 호출에서 한 번만 그래프를 만들고
+        이후에는 그래프를 바로 실행합니다.
+        """
+        import tensorflow as tf
+
+        n_features = model.inputs[0].shape[-1]
+
+        # 함수가 모델을 강하게 참조하면 _SERVING_FNS에서 영영 해제되지 않으므로 약한 참조 사용
+        # (트레이싱 이후에는 그래프가 변수만 참조)
+        model_ref = weakref.ref(model)
+
+        @tf.function(input_signature=[tf.TensorSpec(shape=[None, n_features], dtype=tf.float32)])
+        def serving_fn(x):
+            return model_ref()(x, training=False)
+
+        # 워밍업: 트레이싱과 첫 실행 비용을 로드 시점에 미리 지불
+        serving_fn(tf.zeros((1, n_features), dtype=tf.float32))
+        _SERVING_FNS[model] = serving_fn
+        logger.info("지연 시간 최적화 모드: tf.function 트레이싱 및 워밍업 완료")
+
+    def clone_model(self, model):
+        """
+        같은 가중치를 가진 별도의 Keras 모델을 만듭니다 (모델 복제본 풀용).
+
+        latency_mode이면 복제본에도 serving 함수를 트레이싱해 둡니다.
+        """
+        import tensorflow as tf
+
+        clone = tf.keras.models.clone_model(model)
+        clone.set_weights(model.get_weights())
+        if self.latency_mode:
+            self._prepare_serving_fn(clone)
+        return clone
+
+    def _forward(self, model, scaled_data):
+        """
+        스케일된 입력으로 순전파를 수행합니다.
+
+        model.predict는 호출마다 데이터 어댑터와 예측 루프를 구성하므로 작은 입력에서는
+        실제 연산보다 준비 비용이 훨씬 크고, 여러 스레드에서 같은 모델로 동시에 호출하면
+        모델에 캐시된 예측 함수를 함께 건드립니다. 모델(또는 serving 함수)을 직접 호출하면
+        두 문제가 모두 없습니다.
+        """
+        serving_fn = _SERVING_FNS.get(model) if self.latency_mode else None
+        inputs = np.asarray(scaled_data, dtype=np.float32)
+        if serving_fn is not None:
+            return serving_fn(inputs).numpy()
+        return model(inputs, training=False).numpy()
+
+    def latency_stats(self):
+        """
+        최근 predict 호출의 지연 시간 통계를 반환합니다.
+
+        Returns:
+            dict: count, p50_ms, p99_ms, max_ms (호출 기록이 없으면 값은 None)
+        """
+        with self._latencies_lock:
+            samples = np.array(self._latencies, dtype=np.float64)
+        if samples.size == 0:
+            return {"count": 0, "p50_ms": None, "p99_ms": None, "max_ms": None}
+        p50, p99 = np.percentile(samples, [50, 99])
+        return {
+            "count": int(samples.size),
+            "p50_ms": float(p50) * 1000.0,
+            "p99_ms": float(p99) * 1000.0,
+            "max_ms": float(samples.max()) * 1000.0,
+        }
+
     def predict(self, model, input_data, scaler=None):
         """
         TensorFlow 모델을 사용하여 예측을 수행합니다.
@@ -64,6 +201,7 @@ class TensorFlowAdapter(MLModelAdapter):
             logger.error("예측을 위한 스케일러(scaler) 객체가 제공되지 않았습니다.")
             raise ValueError("스케일러 객체가 필요합니다.")
 
+        started = time.perf_counter()
         try:
             # 입력 데이터 전처리 (numpy array로 변환)
             if isinstance(input_data, list):
@@ -78,18 +216,66 @@ class TensorFlowAdapter(MLModelAdapter):
                 processed_input_data = processed_input_data.reshape(1, -1)
             
             # 제공된 스케일러로 변환
+            metrics = self.metrics
+            if metrics is not None:
+                stage_started = time.perf_counter()
             scaled_data = scaler.transform(processed_input_data)
-            logger.debug(f"스케일링된 데이터: {scaled_data.tolist()}")
+            if metrics is not None:
+                forward_started = time.perf_counter()
+                metrics.observe("scaler_transform", forward_started - stage_started)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("스케일링된 데이터: %s", scaled_data.tolist())
 
             # 예측 수행
-            prediction = model.predict(scaled_data)
+            prediction = self._forward(model, scaled_data)
             result = float(prediction[0][0])
-            logger.debug(f"모델 예측 결과 (raw): {prediction.tolist()}, 최종 반환 값: {result}")
+            if metrics is not None:
+                metrics.observe("model_forward", time.perf_counter() - forward_started)
+            if debug_enabled:
+                logger.debug("모델 예측 결과 (raw): %s, 최종 반환 값: %s", prediction.tolist(), result)
+            elapsed = time.perf_counter() - started
+            with self._latencies_lock:
+                self._latencies.append(elapsed)
             return result
         except Exception as e:
             logger.error(f"TensorFlow 예측 실패: {e}", exc_info=True)
             raise Exception(f"TensorFlow 예측 실패: {str(e)}")
-    
+
+    def predict_batch(self, model, input_data, scaler=None):
+        """
+        TensorFlow 모델로 배치 전체를 한 번에 예측합니다.
+
+        scaler.transform은 한 번, 모델은 BATCH_SIZE 행마다 한 번 호출하므로
+        행 단위 predict 반복보다 Keras 호출 오버헤드가 크게 줄어듭니다.
+
+        Args:
+            model (tf.keras.Model): 로드된 TensorFlow 모델
+            input_data (numpy.ndarray): (N, 3) 형태의 입력 데이터
+            scaler (sklearn.preprocessing 스케일러): 학습된 스케일러 객체
+
+        Returns:
+            numpy.ndarray: (N,) 형태의 예측 결과 (0~1 사이 값)
+        """
+        if scaler is None:
+            logger.error("예측을 위한 스케일러(scaler) 객체가 제공되지 않았습니다.")
+            raise ValueError("스케일러 객체가 필요합니다.")
+
+        processed_input_data = np.asarray(input_data, dtype=np.float64).reshape(-1, 3)
+        if processed_input_data.shape[0] == 0:
+            return np.empty(0, dtype=np.float64)
+
+        try:
+            scaled_data = scaler.transform(processed_input_data)
+            predictions = np.empty(scaled_data.shape[0], dtype=np.float64)
+            for start in range(0, scaled_data.shape[0], self.BATCH_SIZE):
+                end = start + self.BATCH_SIZE
+                predictions[start:end] = self._forward(model, scaled_data[start:end])[:, 0]
+            return predictions
+        except Exception as e:
+            logger.error(f"TensorFlow 배치 예측 실패: {e}", exc_info=True)
+            raise Exception(f"TensorFlow 배치 예측 실패: {str(e)}")
+
     def get_framework_name(self):
         """
         프레임워크 이름 반환
@@ -0,0 +1,268 @@
+"""
+압축 모델 내보내기
+
+TensorFlowAdapter로 로드한 Keras 모델을 배포용 압축 모델(.npz)로 변환합니다.
+
+1. Dense 레이어 가중치를 꺼내 스케일러를 첫 레이어에 접어 넣음 (fold)
+2. (선택) 레이어별로 절댓값이 작은 가중치를 0으로 만듦 (magnitude pruning)
+3. (선택, remove_dead) 보정(calibration) 입력 전체에서 출력이 항상 0인 유닛과 나가는 가중치가
+   모두 0인 유닛을 제거. 행렬 크기 자체가 줄어들므로 실제 추론 시간이 줄어듭니다.
+4. 가중치를 int8 (열별 대칭 양자화) 또는 float16으로 저장
+
+3단계는 보정 입력 범위(스케일러 학습 범위) 안에서는 출력을 바꾸지 않지만, 범위 밖 입력에서는
+원본과 크게 달라질 수 있으므로 기본값은 제거하지 않음입니다. 변환 후 크기, 지연 시간, 정확도를
+원본과 비교한 보고서를 반환하며, 범위 밖 입력(OUT_OF_RANGE_SCALES배 한 홀드아웃)의 일치율도 함께 기록합니다.
+"""
+
+import logging
+import os
+import time
+
+import numpy as np
+
+from core.prediction_cache import file_fingerprint
+from core.triangle_validator_core import DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH, triangle_mask
+from models.adapters.compact_adapter import AffineScaler, CompactAdapter, WEIGHT_DTYPES, save_compact
+from models.adapters.numpy_adapter import ACTIVATIONS, PASSTHROUGH_LAYERS, NumpyMLP
+from models.adapters.tf_adapter import TensorFlowAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CALIBRATION_SAMPLES = 200_000
+DEFAULT_HOLDOUT_SAMPLES = 100_000
+# 스케일러에 학습 범위 정보가 없을 때 사용하는 입력 범위
+DEFAULT_LOW = 1.0
+DEFAULT_HIGH = 99.0
+LATENCY_BATCH_SIZE = 65536
+LATENCY_SINGLE_CALLS = 200
+# 보정 범위 밖 동작을 보고서에 드러내기 위해 홀드아웃 입력에 곱하는 배율
+OUT_OF_RANGE_SCALES = (10.0, 0.1)
+
+
+def keras_dense_layers(keras_model):
+    """
+    Keras Sequential 모델에서 Dense 레이어의 (kernel, bias, activation) 리스트를 꺼냅니다.
+
+    Raises:
+        ValueError: Dense/Dropout/Flatten 이외의 레이어나 지원하지 않는 활성화 함수가 있는 경우
+    """
+    layers = []
+    for layer in keras_model.layers:
+        class_name = type(layer).__name__
+        if class_name in PASSTHROUGH_LAYERS:
+            continue
+        if class_name != "Dense":
+            raise ValueError(f"지원하지 않는 레이어입니다: {class_name}")
+        config = layer.get_config()
+        activation = config.get("activation")
+        if activation not in ACTIVATIONS:
+            raise ValueError(f"지원하지 않는 활성화 함수입니다: {activation}")
+        weights = layer.get_weights()
+        kernel = np.asarray(weights[0], dtype=np.float32)
+        bias = np.asarray(weights[1], dtype=np.float32) if config.get("use_bias", True) else np.zeros(kernel.shape[1], np.float32)
+        layers.append((kernel, bias, activation))
+    if not layers:
+        raise ValueError("Dense 레이어가 없는 모델입니다.")
+    return layers
+
+
+def prune_magnitude(layers, fraction):
+    """
+    레이어마다 절댓값이 작은 순서로 kernel 가중치의 fraction 비율을 0으로 만듭니다 (bias는 유지).
+
+    Returns:
+        list: 가지치기된 (kernel, bias, activation) 리스트
+    """
+    if not 0.0 <= fraction < 1.0:
+        raise ValueError(f"prune 비율은 0 이상 1 미만이어야 합니다: {fraction}")
+    if fraction == 0.0:
+        return list(layers)
+    pruned = []
+    for kernel, bias, activation in layers:
+        count = int(kernel.size * fraction)
+        kernel = kernel.copy()
+        if count > 0:
+            smallest = np.argpartition(np.abs(kernel).ravel(), count - 1)[:count]
+            kernel.ravel()[smallest] = 0.0
+        pruned.append((kernel, bias, activation))
+    return pruned
+
+
+def remove_dead_units(layers, calibration_inputs):
+    """
+    은닉 유닛 중 보정 입력 전체에서 출력이 0이거나 나가는 가중치가 모두 0인 유닛을 제거합니다.
+
+    Args:
+        layers (list): 스케일러가 접힌 (kernel, bias, activation) 리스트 (원본 입력을 받음)
+        calibration_inputs (numpy.ndarray): (N, 3) 원본 입력
+
+    Returns:
+        tuple: (유닛이 제거된 레이어 리스트, 은닉 레이어별 제거한 유닛 수)
+    """
+    layers = [list(layer) for layer in layers]
+    removed = []
+    x = np.asarray(calibration_inputs, dtype=np.float32)
+    for index in range(len(layers) - 1):
+        kernel, bias, activation = layers[index]
+        output = ACTIVATIONS[activation](x @ kernel + bias)
+        next_kernel = layers[index + 1][0]
+        keep = (output != 0).any(axis=0) & (next_kernel != 0).any(axis=1)
+        removed.append(int(np.count_nonzero(~keep)))
+        layers[index][0] = kernel[:, keep]
+        layers[index][1] = bias[keep]
+        layers[index + 1][0] = next_kernel[keep]
+        x = output[:, keep]
+    return [tuple(layer) for layer in layers], removed
+
+
+def _input_range(scaler):
+    """스케일러 학습 범위 (MinMaxScaler의 data_min_/data_max_). 없으면 기본 범위."""
+    low = getattr(scaler, "data_min_", None)
+    high = getattr(scaler, "data_max_", None)
+    if low is None or high is None:
+        return DEFAULT_LOW, DEFAULT_HIGH
+    return float(np.min(low)), float(np.max(high))
+
+
+def _sample_inputs(rng, samples, low, high):
+    """[low, high] 균등 입력에 범위의 꼭짓점 8개를 더한 (N + 8, 3) 배열"""
+    corners = np.array([[low if (corner >> bit) & 1 == 0 else high for bit in range(3)] for corner in range(8)])
+    return np.vstack([rng.uniform(low, high, size=(samples, 3)), corners])
+
+
+def measure_latency(predict_batch, inputs):
+    """
+    단일 입력 지연 시간(중앙값)과 배치 처리량(최고값)을 측정합니다.
+
+    Returns:
+        dict: single_ms, batch_rows_per_second
+    """
+    single = inputs[:1]
+    predict_batch(single) # 첫 호출 비용(그래프 추적 등) 제외
+    durations = []
+    for _ in range(LATENCY_SINGLE_CALLS):
+        started = time.perf_counter()
+        predict_batch(single)
+        durations.append(time.perf_counter() - started)
+    batch = inputs[:LATENCY_BATCH_SIZE]
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        predict_batch(batch)
+        best = min(best, time.perf_counter() - started)
+    return {
+        "single_ms": float(np.median(durations)) * 1000,
+        "batch_rows_per_second": len(batch) / best if best > 0 else 0.0,
+    }
+
+
+def _compare_outputs(original_output, compact_output):
+    """원본과 압축 모델 출력의 판정 일치율, 최대 편차, 판정이 바뀐 입력 수"""
+    if len(original_output) == 0:
+        return {"agreement": None, "max_abs_deviation": 0.0, "flipped": 0}
+    flipped = int(np.count_nonzero((original_output > 0.5) != (compact_output > 0.5)))
+    return {
+        "agreement": 1.0 - flipped / len(original_output),
+        "max_abs_deviation": float(np.max(np.abs(original_output - compact_output))),
+        "flipped": flipped,
+    }
+
+
+def export_compact(output_path, model_path=None, scaler_path=None, weight_dtype="int8", prune=0.0,
+                   remove_dead=False, calibration_samples=DEFAULT_CALIBRATION_SAMPLES,
+                   holdout_samples=DEFAULT_HOLDOUT_SAMPLES, seed=0, measure=True):
+    """
+    Keras 모델을 압축 모델로 내보내고 원본 대비 보고서를 반환합니다.
+
+    Args:
+        output_path (str): 저장할 .npz 경로 (확장자가 없으면 붙임)
+        model_path (str, optional): 원본 .h5 경로 (기본값: notebooks/model.h5)
+        scaler_path (str, optional): 원본 scaler.pkl 경로 (기본값: notebooks/scaler.pkl)
+        weight_dtype (str): "int8", "float16", "float32"
+        prune (float): 레이어별로 0으로 만들 가중치 비율 (0이면 가지치기하지 않음)
+        remove_dead (bool): 보정 입력에서 출력이 항상 0인 유닛을 제거할지 여부.
+            보정 범위 밖 입력의 출력이 바뀔 수 있으므로 기본값은 False
+        calibration_samples (int): 유닛 제거에 사용하는 입력 수
+        holdout_samples (int): 정확도/일치율 측정용 입력 수 (보정 입력과 별도 시드)
+        seed (int): 난수 시드
+        measure (bool): False이면 지연 시간을 측정하지 않음
+
+    Returns:
+        dict: 경로, 크기, 파라미터 수, 제거한 유닛 수, 지연 시간, 정확도, 원본과의 일치율,
+            범위 밖 입력(out_of_range)에서의 일치율/최대 편차/판정이 바뀐 수
+    """
+    if weight_dtype not in WEIGHT_DTYPES:
+        raise ValueError(f"지원하지 않는 가중치 형식입니다: {weight_dtype} (가능한 값: {WEIGHT_DTYPES})")
+    model_path = model_path or DEFAULT_MODEL_PATH
+    scaler_path = scaler_path or DEFAULT_SCALER_PATH
+    if not output_path.endswith(".npz"):
+        output_path += ".npz"
+
+    tf_adapter = TensorFlowAdapter()
+    keras_model = tf_adapter.load_model(model_path)
+    scaler = tf_adapter.load_scaler(scaler_path)
+    low, high = _input_range(scaler)
+    rng = np.random.default_rng(seed)
+
+    layers = NumpyMLP(keras_dense_layers(keras_model)).folded_layers(scaler)
+    original_parameters = sum(kernel.size + bias.size for kernel, bias, _ in layers)
+    layers = prune_magnitude(layers, prune)
+    removed_units = []
+    if remove_dead:
+        layers, removed_units = remove_dead_units(layers, _sample_inputs(rng, calibration_samples, low, high))
+
+    save_compact(output_path, layers, AffineScaler.from_scaler(scaler), weight_dtype, metadata={
+        "source_fingerprint": file_fingerprint(model_path, scaler_path),
+        "prune": prune,
+        "input_low": low,
+        "input_high": high,
+    })
+    logger.info(f"압축 모델 저장: {output_path} ({weight_dtype}, prune={prune}, 제거한 유닛={removed_units})")
+
+    compact_adapter = CompactAdapter()
+    compact_model = compact_adapter.load_model(output_path)
+
+    def original_predict(sides):
+        return tf_adapter.predict_batch(keras_model, sides, scaler=scaler)
+
+    def compact_predict(sides):
+        return compact_adapter.predict_batch(compact_model, sides)
+
+    holdout = np.random.default_rng(seed + 1).uniform(low, high, size=(holdout_samples, 3))
+    truth = triangle_mask(holdout)
+    original_output = original_predict(holdout)
+    compact_output = compact_predict(holdout)
+    original_accuracy = float(np.mean((original_output > 0.5) == truth))
+    compact_accuracy = float(np.mean((compact_output > 0.5) == truth))
+
+    nonzero, total = compact_model.parameter_count()
+    report = {
+        "output_path": output_path,
+        "weight_dtype": weight_dtype,
+        "prune": prune,
+        "removed_units": removed_units,
+        "parameters": {"original": int(original_parameters), "compact": int(total), "compact_nonzero": int(nonzero)},
+        "size_bytes": {
+            "original": os.path.getsize(model_path) + os.path.getsize(scaler_path),
+            "compact": os.path.getsize(output_path),
+        },
+        "accuracy": {
+            "original": original_accuracy,
+            "compact": compact_accuracy,
+            "delta": compact_accuracy - original_accuracy,
+        },
+        "agreement": float(np.mean((original_output > 0.5) == (compact_output > 0.5))),
+        "max_abs_deviation": float(np.max(np.abs(original_output - compact_output))) if holdout_samples else 0.0,
+        "holdout_samples": int(holdout_samples),
+        "out_of_range": {},
+    }
+    for scale in OUT_OF_RANGE_SCALES:
+        # 보정 입력과 같은 범위의 홀드아웃만으로는 유닛 제거의 영향이 보이지 않으므로 범위 밖도 비교
+        scaled = holdout * scale
+        report["out_of_range"][f"x{scale:g}"] = _compare_outputs(original_predict(scaled), compact_predict(scaled))
+    if measure:
+        report["latency"] = {
+            "original": measure_latency(original_predict, holdout),
+            "compact": measure_latency(compact_predict, holdout),
+        }
+    return report
@@ -0,0 +1,94 @@
+"""
+로컬 추론 서버 실행
+
+TriangleValidatorCore를 HTTP/JSON 서비스로 노출합니다. 동시에 들어온 단일 요청은
+마이크로 배치로 묶여 모델을 한 번만 호출합니다.
+
+사용 예:
+    python serve.py --port 8080 --max-batch-size 256 --max-wait-ms 2
+    python serve.py --unix /tmp/triangle.sock
+    curl -X POST localhost:8080/validate -d '{"sides": [3, 4, 5]}'
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from core.model_registry import default_registry
+from core.triangle_validator_core import AI_POLICIES, TriangleValidatorCore
+from server import InferenceServer
+
+logger = logging.getLogger(__name__) # serve 모듈용 로거
+
+
+def setup_logging(level="INFO"):
+    """기본 로깅 설정을 수행합니다."""
+    logging.basicConfig(
+        level=getattr(logging, level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 검증 추론 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩할 주소")
+    parser.add_argument("--port", type=int, default=8080, help="바인딩할 포트")
+    parser.add_argument("--unix", help="TCP 대신 사용할 Unix 소켓 경로")
+    parser.add_argument("--max-batch-size", type=int, default=256, help="배치당 최대 요청 수")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="배치를 모으는 최대 대기 시간 (ms)")
+    parser.add_argument("--max-queue-size", type=int, default=10000, help="대기 큐 최대 길이 (초과 시 503)")
+    parser.add_argument("--framework", default="tensorflow", help="ML 프레임워크 (tensorflow, numpy)")
+    parser.add_argument("--model", help="모델 파일 경로 (기본값: notebooks/model.h5)")
+    parser.add_argument("--scaler", help="스케일러 파일 경로 (기본값: notebooks/scaler.pkl)")
+    parser.add_argument("--reload-interval", type=float, default=2.0,
+                        help="모델/스케일러 파일 변경 확인 간격 (초, 0이면 핫 리로드 끔)")
+    parser.add_argument("--replicas", type=int, default=1,
+                        help="모델 복제본 수 (동시에 실행되는 모델 호출 수의 상한)")
+    parser.add_argument("--intra-op-threads", type=int,
+                        help="TensorFlow 연산 하나를 병렬 처리하는 스레드 수 (복제본 수 × 이 값 <= 코어 수 권장)")
+    parser.add_argument("--inter-op-threads", type=int, help="TensorFlow 독립 연산 동시 실행 스레드 수")
+    parser.add_argument("--ai-policy", choices=AI_POLICIES, default="always",
+                        help="AI 예측 실행 방식 (shadow: 수학 판정만 바로 응답하고 AI는 백그라운드에서 평가)")
+    parser.add_argument("--ai-sample-rate", type=float, default=1.0, help="sampled/shadow 정책의 표본 비율 (0~1)")
+    parser.add_argument("--instrument", action="store_true",
+                        help="검증 경로 단계별 계측을 켜고 /metrics에 함께 노출")
+    parser.add_argument("--log-level", default="INFO", help="로그 레벨")
+    return parser
+
+
+async def serve(args):
+    adapter_options = {}
+    if args.framework.lower() == "tensorflow":
+        adapter_options = {name: value for name, value in (("intra_op_threads", args.intra_op_threads),
+                                                           ("inter_op_threads", args.inter_op_threads)) if value}
+    core = TriangleValidatorCore(model_path=args.model, scaler_path=args.scaler, framework=args.framework,
+                                 adapter_options=adapter_options, metrics=args.instrument or None,
+                                 replicas=args.replicas, ai_policy=args.ai_policy,
+                                 ai_sample_rate=args.ai_sample_rate)
+    if args.reload_interval > 0:
+        default_registry().start_watching(args.reload_interval)
+    server = InferenceServer(core, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms,
+                             max_queue_size=args.max_queue_size)
+    await server.start(host=args.host, port=args.port, unix_path=args.unix)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
+        core.close() # 남은 섀도 평가를 마치고 스레드 종료
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    setup_logging(args.log_level)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        logger.info("추론 서버 종료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
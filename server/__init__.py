@@ -0,0 +1,5 @@
+# server 패키지
+from .micro_batcher import BatcherStoppedError, MicroBatcher, QueueFullError
+from .http_server import InferenceServer
+
+__all__ = ['BatcherStoppedError', 'MicroBatcher', 'QueueFullError', 'InferenceServer']
@@ -0,0 +1,207 @@
+"""
+로컬 추론 서버
+
+표준 라이브러리 asyncio만으로 구현한 최소 HTTP/1.1 JSON 서버입니다.
+TCP 포트 또는 Unix 소켓에서 요청을 받아 MicroBatcher로 전달합니다.
+
+엔드포인트:
+    POST /validate        {"sides": [a, b, c]} 또는 {"a": a, "b": b, "c": c}
+    POST /validate_batch  {"sides": [[a, b, c], ...]}
+    GET  /metrics         Prometheus 텍스트 형식 메트릭
+    GET  /health          {"status": "ok"}
+"""
+
+import asyncio
+import json
+import logging
+import math
+
+import numpy as np
+
+from core.metrics import render_prometheus
+from core.triangle_validator_core import as_sides_array
+from server.micro_batcher import BatcherStoppedError, MicroBatcher, QueueFullError, batch_row
+
+logger = logging.getLogger(__name__)
+
+# 요청 본문 최대 크기 (byte)
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _parse_sides(payload):
+    if isinstance(payload, dict) and "sides" in payload:
+        sides = payload["sides"]
+    elif isinstance(payload, dict):
+        sides = [payload.get("a"), payload.get("b"), payload.get("c")]
+    else:
+        sides = payload
+    try:
+        a, b, c = (float(v) for v in sides)
+    except (TypeError, ValueError):
+        raise HttpError(400, "sides는 숫자 세 개여야 합니다.")
+    # json.loads는 NaN/Infinity를 받아들이지만 응답 JSON에는 쓸 수 없으므로 입력에서 거절
+    if not all(math.isfinite(v) for v in (a, b, c)):
+        raise HttpError(400, "sides는 유한한 숫자여야 합니다.")
+    return a, b, c
+
+
+def _parse_batch_sides(payload):
+    sides = payload.get("sides") if isinstance(payload, dict) else payload
+    try:
+        sides = as_sides_array(sides)
+    except (TypeError, ValueError):
+        raise HttpError(400, "sides는 [a, b, c] 목록이어야 합니다.")
+    if not np.isfinite(sides).all():
+        raise HttpError(400, "sides는 유한한 숫자여야 합니다.")
+    return sides
+
+
+class InferenceServer:
+    """TriangleValidatorCore를 감싸는 마이크로 배칭 HTTP 서버"""
+
+    def __init__(self, core, max_batch_size=256, max_wait_ms=2.0, max_queue_size=10000):
+        self.core = core
+        self.batcher = MicroBatcher(core, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms,
+                                    max_queue_size=max_queue_size)
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=8080, unix_path=None):
+        """서버를 시작하고 실제로 바인딩된 주소를 반환합니다."""
+        await self.batcher.start()
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_path)
+            address = unix_path
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+            address = self._server.sockets[0].getsockname()[:2]
+        logger.info(f"추론 서버 시작: {address}")
+        return address
+
+    async def stop(self):
+        # 대기 중인 요청을 먼저 실패시켜야 연결 처리가 끝나므로 wait_closed는 배처 중지 후 호출
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+        await self.batcher.stop()
+        if server is not None:
+            await server.wait_closed()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    def render_metrics(self):
+        metrics = self.batcher.metrics()
+        core_metrics = getattr(self.batcher.core, "metrics", None) # 코어 계측을 켠 경우 함께 노출
+        if core_metrics is not None:
+            metrics += core_metrics.metrics()
+        return render_prometheus(metrics)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, content_type, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except HttpError as e:
+            self._write_response(writer, e.status, "application/json",
+                                 json.dumps({"error": str(e)}).encode("utf-8"), False)
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "잘못된 요청 줄입니다.")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            raise HttpError(400, "Content-Length가 올바른 정수가 아닙니다.")
+        if length < 0:
+            raise HttpError(400, "Content-Length는 0 이상이어야 합니다.")
+        if length > MAX_BODY_SIZE:
+            raise HttpError(413, "요청 본문이 너무 큽니다.")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), path.split("?", 1)[0], headers, body
+
+    async def _dispatch(self, method, path, body):
+        try:
+            if path == "/validate":
+                self._require(method, "POST")
+                a, b, c = _parse_sides(self._load_json(body))
+                result = await self.batcher.submit(a, b, c)
+                return 200, "application/json", json.dumps(result).encode("utf-8")
+            if path == "/validate_batch":
+                self._require(method, "POST")
+                sides = _parse_batch_sides(self._load_json(body))
+                results = await self.batcher.run_batch(sides)
+                rows = [batch_row(results, i) for i in range(len(results))]
+                return 200, "application/json", json.dumps({"results": rows}).encode("utf-8")
+            if path == "/metrics":
+                self._require(method, "GET")
+                return 200, "text/plain; version=0.0.4", self.render_metrics().encode("utf-8")
+            if path == "/health":
+                self._require(method, "GET")
+                return 200, "application/json", b'{"status": "ok"}'
+            raise HttpError(404, f"알 수 없는 경로: {path}")
+        except HttpError as e:
+            return e.status, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+        except (QueueFullError, BatcherStoppedError) as e:
+            return 503, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+        except (ValueError, TypeError) as e:
+            return 400, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+        except Exception as e:
+            logger.error(f"요청 처리 실패 ({method} {path}): {e}", exc_info=True)
+            return 500, "application/json", json.dumps({"error": str(e)}).encode("utf-8")
+
+    @staticmethod
+    def _require(method, expected):
+        if method != expected:
+            raise HttpError(405, f"{expected} 요청만 지원합니다.")
+
+    @staticmethod
+    def _load_json(body):
+        try:
+            return json.loads(body or b"null")
+        except json.JSONDecodeError:
+            raise HttpError(400, "본문이 올바른 JSON이 아닙니다.")
+
+    @staticmethod
+    def _write_response(writer, status, content_type, payload, keep_alive):
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
@@ -0,0 +1,157 @@
+"""
+동적 마이크로 배칭
+
+동시에 들어온 단일 삼각형 요청을 큐에 모았다가, 최대 배치 크기에 도달하거나
+최대 대기 시간이 지나면 TriangleValidatorCore.validate_batch 한 번으로 처리합니다.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.metrics import DEFAULT_SIZE_BUCKETS, Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """대기 큐가 가득 차 요청을 받을 수 없을 때 발생합니다."""
+
+
+class BatcherStoppedError(Exception):
+    """배처가 중지되어 요청을 처리할 수 없을 때 발생합니다."""
+
+
+def batch_row(results, index):
+    """validate_batch 결과(BatchResult)에서 한 행을 JSON으로 보낼 dict로 꺼냅니다."""
+    return results.row(index).to_dict()
+
+
+class MicroBatcher:
+    """
+    asyncio 기반 마이크로 배처
+
+    모델 호출은 단일 스레드 실행기에서 수행하므로 이벤트 루프를 막지 않으며,
+    배치가 실행되는 동안 도착한 요청은 다음 배치로 모입니다.
+    """
+
+    def __init__(self, core, max_batch_size=256, max_wait_ms=2.0, max_queue_size=10000):
+        self.core = core
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_queue_size = max_queue_size
+        self._queue = None
+        self._worker = None
+        self._batch = [] # 모으는 중이거나 실행 중인 배치 (중지 시 결과를 받지 못한 요청을 실패 처리)
+        self._stopped = False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batch")
+
+        self.batch_size = Histogram("triangle_batch_size", "Number of requests per flushed batch",
+                                    buckets=DEFAULT_SIZE_BUCKETS)
+        self.queue_wait = Histogram("triangle_queue_wait_seconds", "Time a request waited in the queue")
+        self.batch_latency = Histogram("triangle_batch_latency_seconds", "validate_batch execution time")
+        self.queue_depth = Gauge("triangle_queue_depth", "Requests currently waiting in the queue")
+        self.queue_depth_at_flush = Histogram("triangle_queue_depth_at_flush", "Queue depth observed at each flush",
+                                              buckets=DEFAULT_SIZE_BUCKETS)
+        self.requests = Counter("triangle_requests_total", "Single-triangle requests accepted")
+        self.rejected = Counter("triangle_requests_rejected_total", "Requests rejected because the queue was full")
+
+    def metrics(self):
+        return [self.requests, self.rejected, self.queue_depth, self.batch_size,
+                self.queue_depth_at_flush, self.queue_wait, self.batch_latency]
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """배치 작업을 중지하고, 아직 결과를 받지 못한 요청은 BatcherStoppedError로 실패시킵니다."""
+        self._stopped = True
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        pending = [future for _, future, _ in self._batch]
+        self._batch = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait()[1])
+        for future in pending:
+            if not future.done():
+                future.set_exception(BatcherStoppedError("서버가 중지되어 요청을 처리하지 못했습니다."))
+        if self._queue is not None:
+            self.queue_depth.set(0)
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, a, b, c):
+        """요청 하나를 큐에 넣고 배치 처리 결과를 기다립니다."""
+        if self._stopped:
+            raise BatcherStoppedError("서버가 중지되었습니다.")
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(((float(a), float(b), float(c)), future, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.rejected.inc()
+            raise QueueFullError(f"대기 큐가 가득 찼습니다 ({self.max_queue_size})")
+        self.requests.inc()
+        self.queue_depth.set(self._queue.qsize())
+        return await future
+
+    async def run_batch(self, sides):
+        """이미 배치로 묶인 요청을 큐를 거치지 않고 모델 실행기에서 처리합니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.core.validate_batch, sides)
+
+    async def _collect(self):
+        """첫 요청이 온 뒤 max_wait 동안 또는 max_batch_size까지 요청을 모읍니다."""
+        batch = self._batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            # 이미 도착한 요청은 기다리지 않고 바로 가져옴
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if len(batch) >= self.max_batch_size:
+                break
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            self.queue_depth_at_flush.observe(self._queue.qsize() + len(batch))
+            self.queue_depth.set(self._queue.qsize())
+
+            flushed_at = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                self.queue_wait.observe(flushed_at - enqueued_at)
+            self.batch_size.observe(len(batch))
+
+            sides = [item[0] for item in batch]
+            try:
+                # 배치의 각 행은 독립된 요청이므로 "sampled" 정책의 표본도 행마다 고름
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    self._executor, functools.partial(self.core.validate_batch, sides, sample_rows=True))
+            except Exception as e:
+                logger.error(f"마이크로 배치 처리 실패 ({len(batch)}건): {e}", exc_info=True)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._batch = []
+                continue
+            self.batch_latency.observe(time.perf_counter() - flushed_at)
+
+            for index, (_, future, _) in enumerate(batch):
+                if not future.done(): # 클라이언트 연결이 끊겨 취소된 요청은 건너뜀
+                    future.set_result(batch_row(results, index))
+            self._batch = []
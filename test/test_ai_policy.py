@@ -0,0 +1,128 @@
+"""
+AI 평가 정책 테스트
+
+always / never / sampled / shadow 정책에서 validate, validate_batch가 AI 예측을 언제 실행하는지,
+섀도 평가가 요청 경로 밖에서 불일치 통계를 모으는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.shadow import ShadowEvaluator
+from core.triangle_validator_core import TriangleValidatorCore
+
+pytest.importorskip("h5py")
+
+SIDES = np.random.default_rng(4).uniform(1, 99, size=(500, 3))
+
+
+def make_core(**options):
+    return TriangleValidatorCore(framework="numpy", **options)
+
+
+def test_never_skips_ai():
+    core = make_core(ai_policy="never", metrics=True)
+    result = core.validate(3, 4, 5)
+    assert result["math_result"] is True
+    assert result["ai_prediction_value"] is None and result["is_consistent"] is None
+    batch = core.validate_batch(SIDES)
+    assert not batch.has_ai and batch["ai_prediction_value"] is None
+    assert core.metrics_snapshot()["ai_predictions"] == 0
+    # 직접 호출은 정책과 관계없이 실행
+    assert core.validate_by_ai(3, 4, 5) is not None
+
+
+def test_sampled_rate_controls_ai_calls():
+    core = make_core(ai_policy="sampled", ai_sample_rate=0.25, ai_sample_seed=1)
+    with_ai = sum(core.validate(*row)["ai_prediction_value"] is not None for row in SIDES)
+    assert 80 < with_ai < 170
+
+    assert make_core(ai_policy="sampled", ai_sample_rate=0.0).validate(3, 4, 5)["ai_prediction_value"] is None
+    assert make_core(ai_policy="sampled", ai_sample_rate=1.0).validate_batch(SIDES).has_ai
+
+
+def test_sampled_rows_are_sampled_individually():
+    reference = make_core().validate_batch(SIDES)
+    core = make_core(ai_policy="sampled", ai_sample_rate=0.25, ai_sample_seed=1, metrics=True)
+    batch = core.validate_batch(SIDES, sample_rows=True)
+
+    # 배치 전체가 아니라 행마다 표본을 고름
+    sampled = ~np.isnan(batch.data["ai_prediction_value"])
+    assert 80 < sampled.sum() < 170
+    np.testing.assert_allclose(batch.data["ai_prediction_value"][sampled],
+                               reference["ai_prediction_value"][sampled])
+    rows = [batch.row(i) for i in range(len(batch))]
+    assert all((row.ai_prediction_value is None) == (not selected) for row, selected in zip(rows, sampled))
+    assert all(row.is_consistent is None for row, selected in zip(rows, sampled) if not selected)
+    assert len(batch.inconsistent()) == int(np.count_nonzero(~batch.data["is_consistent"][sampled]))
+    assert core.metrics_snapshot()["ai_predictions"] == int(sampled.sum())
+
+
+def test_shadow_returns_math_only_and_records_disagreements():
+    reference = make_core()
+    core = make_core(ai_policy="shadow", metrics=True, shadow_options={"max_delay": 0.01})
+    try:
+        for row in SIDES[:100]:
+            result = core.validate(*row)
+            assert result["ai_prediction_value"] is None
+        core.validate_batch(SIDES[100:])
+        assert core.wait_for_shadow(timeout=10)
+
+        stats = core.shadow_stats()
+        assert stats["submitted"] == stats["evaluated"] == len(SIDES)
+        assert stats["dropped"] == stats["pending"] == 0
+        expected = reference.validate_batch(SIDES)
+        expected_disagreements = len(SIDES) - int(np.count_nonzero(expected["is_consistent"]))
+        assert stats["disagreements"] == expected_disagreements
+        assert len(stats["recent_disagreements"]) == min(expected_disagreements, 20)
+
+        snapshot = core.metrics_snapshot()
+        assert snapshot["validations"] == len(SIDES)
+        assert snapshot["ai_predictions"] == len(SIDES)
+        assert snapshot["disagreements"] == expected_disagreements
+    finally:
+        core.close()
+    assert core.shadow_stats() is None
+
+
+def test_shadow_sampling_in_batches():
+    core = make_core(ai_policy="shadow", ai_sample_rate=0.1, ai_sample_seed=3)
+    try:
+        core.validate_batch(SIDES)
+        assert core.wait_for_shadow(timeout=10)
+        assert 20 < core.shadow_stats()["evaluated"] < 90
+    finally:
+        core.close()
+
+
+def test_shadow_drops_when_backlog_is_full():
+    release = threading.Event()
+
+    def slow_predict(sides):
+        release.wait(5)
+        return np.ones(len(sides))
+
+    shadow = ShadowEvaluator(slow_predict, max_pending=10, max_delay=0.0)
+    try:
+        assert shadow.submit(np.ones((10, 3)), np.ones(10, dtype=bool))
+        assert not shadow.submit((3.0, 4.0, 5.0), True)
+        release.set()
+        assert shadow.wait_idle(timeout=5)
+        stats = shadow.stats()
+        assert stats["dropped"] == 1 and stats["evaluated"] == 10 and stats["consistent_rate"] == 1.0
+    finally:
+        shadow.close()
+
+
+def test_invalid_policy_options():
+    with pytest.raises(ValueError):
+        TriangleValidatorCore(framework="numpy", ai_policy="sometimes", load_on_init=False)
+    with pytest.raises(ValueError):
+        TriangleValidatorCore(framework="numpy", ai_policy="sampled", ai_sample_rate=1.5, load_on_init=False)
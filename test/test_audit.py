@@ -0,0 +1,97 @@
+"""
+모델 감사 하네스 테스트
+
+분포별 통계(정확도, 혼동 행렬, 보정, 최악 예시)가 validate_batch 결과와 맞게
+누적되는지와 CLI의 통과/실패 종료 코드를 확인합니다.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import audit as audit_cli
+from core import audit
+from core.results import BatchResult
+from core.triangle_validator_core import triangle_mask
+
+
+def oracle(sides):
+    """수학 판정을 그대로 예측값으로 돌려주는 완벽한 모델"""
+    mask = triangle_mask(sides)
+    return BatchResult.from_columns(sides, mask, mask.astype(np.float64))
+
+
+def always_valid(sides):
+    """모든 입력을 삼각형으로 예측하는 모델"""
+    return BatchResult.from_columns(sides, triangle_mask(sides), np.full(len(sides), 0.9))
+
+
+@pytest.mark.parametrize("name", list(audit.DISTRIBUTIONS))
+def test_distributions_generate_positive_sides(name):
+    sides = audit.DISTRIBUTIONS[name](np.random.default_rng(0), 1000)
+    assert sides.shape == (1000, 3)
+    assert (sides > 0).all()
+    # 경계 근처 분포도 두 클래스가 모두 나와야 의미 있는 감사가 됨
+    labels = triangle_mask(sides)
+    assert labels.any() and not labels.all()
+
+
+def test_perfect_model_scores_one():
+    report = audit.run_audit(oracle, samples=5000, chunk_size=1024)
+    for summary in report.values():
+        assert summary["accuracy"] == 1.0
+        assert summary["consistent_rate"] == 1.0
+        assert summary["expected_calibration_error"] == 0.0
+        assert summary["confusion"]["false_positive"] == summary["confusion"]["false_negative"] == 0
+    assert audit.failed_distributions(report, 0.99) == []
+
+
+def test_confusion_and_worst_cases():
+    report = audit.run_audit(always_valid, distributions=["integer_grid"], samples=3000, chunk_size=1000,
+                             worst_cases=5)
+    summary = report["integer_grid"]
+    confusion = summary["confusion"]
+    assert confusion["true_negative"] == confusion["false_negative"] == 0
+    assert confusion["true_positive"] + confusion["false_positive"] == 3000
+    assert summary["accuracy"] == pytest.approx(confusion["true_positive"] / 3000)
+    assert len(summary["worst_cases"]) == 5
+    assert all(not case["math_result"] for case in summary["worst_cases"])
+    assert summary["calibration"][0]["bin"] == [0.9, 1.0]
+
+
+def test_missing_ai_fails_gate():
+    report = audit.run_audit(lambda sides: BatchResult.from_columns(sides, triangle_mask(sides)),
+                             distributions=["uniform"], samples=100)
+    assert report["uniform"]["missing_ai"] == 100
+    assert report["uniform"]["accuracy"] is None
+    assert audit.failed_distributions(report, 0.5) == ["uniform"]
+
+
+def test_same_seed_is_reproducible():
+    first = audit.run_audit(always_valid, distributions=["uniform", "near_degenerate"], samples=2000, seed=3)
+    again = audit.run_audit(always_valid, distributions=["near_degenerate"], samples=2000, seed=3)
+    assert first["near_degenerate"]["confusion"] == again["near_degenerate"]["confusion"]
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError):
+        audit.run_audit(oracle, distributions=["missing"])
+
+
+def test_cli_gate(tmp_path, capsys):
+    pytest.importorskip("h5py")
+    report_path = tmp_path / "audit.json"
+    exit_code = audit_cli.main(["--framework", "numpy", "--distributions", "integer_grid", "--samples", "2000",
+                                "--min-accuracy", "0.5", "--report", str(report_path)])
+    assert exit_code == 0
+    assert "[integer_grid]" in capsys.readouterr().out
+    assert json.loads(report_path.read_text())["integer_grid"]["samples"] == 2000
+
+    assert audit_cli.main(["--framework", "numpy", "--distributions", "integer_grid", "--samples", "2000",
+                           "--min-accuracy", "1.01"]) == 2
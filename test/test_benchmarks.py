@@ -0,0 +1,59 @@
+"""
+벤치마크 기준선 비교 테스트
+
+회귀 판정이 지표 방향(클수록/작을수록 좋음)과 잡음 하한을 올바르게 반영하는지 확인합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks.run_benchmarks import baseline_key, compare, flatten
+
+
+def make_results(p50_ms, rows_per_sec, math_ms=0.003):
+    return {"metrics": {
+        "latency": {"validate": {"p50_ms": p50_ms}, "validate_by_math": {"p50_ms": math_ms}},
+        "throughput": {"batch_256": {"rows_per_sec": rows_per_sec}},
+        "cold_start": {"model_loaded": True},
+    }}
+
+
+def test_flatten_skips_non_numeric_values():
+    flat = flatten(make_results(1.0, 100.0)["metrics"])
+    assert flat == {
+        "latency.validate.p50_ms": 1.0,
+        "latency.validate_by_math.p50_ms": 0.003,
+        "throughput.batch_256.rows_per_sec": 100.0,
+    }
+
+
+def test_compare_detects_regressions_in_both_directions():
+    baseline = make_results(1.0, 100.0)
+    assert compare(make_results(1.1, 90.0), baseline, 0.25) == []
+
+    regressions = compare(make_results(2.0, 50.0), baseline, 0.25)
+    assert [name for name, *_ in regressions] == [
+        "latency.validate.p50_ms", "throughput.batch_256.rows_per_sec"
+    ]
+
+
+def test_compare_ignores_changes_below_noise_floor():
+    # 3µs -> 9µs는 상대적으로 200%지만 절대 변화량이 잡음 하한보다 작음
+    assert compare(make_results(1.0, 100.0, math_ms=0.009), make_results(1.0, 100.0), 0.25) == []
+
+
+def test_compare_does_not_gate_on_tail_latency():
+    baseline = make_results(1.0, 100.0)
+    results = make_results(1.0, 100.0)
+    baseline["metrics"]["latency"]["validate"]["p99_ms"] = 0.05
+    results["metrics"]["latency"]["validate"]["p99_ms"] = 0.5 # p99는 표본 몇 개로 크게 흔들림
+    assert compare(results, baseline, 0.25) == []
+
+
+def test_baseline_key_includes_enabled_options():
+    assert baseline_key("numpy") == "numpy"
+    assert baseline_key("tensorflow", {"latency_mode": True}) == "tensorflow-latency_mode"
+    assert baseline_key("tensorflow", {"latency_mode": False}) == "tensorflow"
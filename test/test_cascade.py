@@ -0,0 +1,95 @@
+"""
+신뢰도 기반 2단계 예측(cascade) 테스트
+
+증류된 1단계가 확실한 입력에만 응답하고 불확실 구간/범위 밖 입력은 실제 모델로 넘기는지,
+cascade 모드 코어가 실제 모델과 같은 판정을 내리는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.cascade import CascadeFirstStage, features
+from core.triangle_validator_core import TriangleValidatorCore, triangle_mask
+
+
+def smooth_oracle(sides):
+    # 삼각 부등식 여유에 대한 로지스틱 함수: 1단계 특성으로 정확히 표현됨
+    return 1.0 / (1.0 + np.exp(-60.0 * features(sides)[:, 0]))
+
+
+def test_fit_recovers_smooth_model():
+    stage = CascadeFirstStage.fit(smooth_oracle, samples=20000, holdout=5000)
+    assert stage.report["first_stage_agreement"] > 0.999
+    assert 0.0 < stage.report["coverage"] < 1.0
+    # 측정에 사용한 조회는 운영 통계에 포함되지 않음
+    assert stage.stats()["first_stage"] == stage.stats()["full_model"] == 0
+
+    sides = np.random.default_rng(5).uniform(1, 99, size=(1000, 3))
+    np.testing.assert_allclose(stage.scores(sides), smooth_oracle(sides), atol=0.02)
+
+
+def test_band_and_range_escalate_to_full_model():
+    stage = CascadeFirstStage.fit(smooth_oracle, samples=20000, holdout=1000, band=0.4)
+    assert stage.lookup(3.0, 4.0, 5.0) is not None # 경계에서 먼 삼각형
+    assert stage.lookup(1.0, 2.0, 90.0) is not None # 경계에서 먼 비삼각형
+    assert stage.lookup(30.0, 30.0, 60.0) is None # a + b = c: 불확실 구간
+    assert stage.lookup(300.0, 400.0, 500.0) is None # 증류 범위 밖
+
+    sides = np.array([[3.0, 4.0, 5.0], [30.0, 30.0, 60.0], [300.0, 400.0, 500.0]])
+    values, covered = stage.lookup_batch(sides)
+    assert covered.tolist() == [True, False, False]
+    assert np.isnan(values[~covered]).all()
+    assert stage.stats() == {"first_stage": 3, "full_model": 4, "first_stage_rate": 3 / 7}
+
+
+def test_single_and_batch_lookup_agree():
+    stage = CascadeFirstStage.fit(smooth_oracle, samples=20000, holdout=1000)
+    sides = np.random.default_rng(9).uniform(1, 99, size=(500, 3))
+    values, covered = stage.lookup_batch(sides)
+    for row, value, is_covered in zip(sides, values, covered):
+        single = stage.lookup(*row)
+        assert (single is not None) == is_covered
+        if is_covered:
+            assert single == pytest.approx(value)
+
+
+def test_invalid_band_is_rejected():
+    with pytest.raises(ValueError):
+        CascadeFirstStage(np.zeros(4), band=0.5)
+
+
+def test_cascade_mode_matches_model_decisions(tmp_path):
+    pytest.importorskip("h5py")
+    path = str(tmp_path / "cascade.npz")
+    model_core = TriangleValidatorCore(framework="numpy")
+    cascade_core = TriangleValidatorCore(framework="numpy", prediction_mode="cascade",
+                                         cascade_options={"samples": 20000, "holdout": 5000, "path": path})
+    report = cascade_core.cascade_report()
+    assert report["fit"]["overall_agreement"] > 0.99
+    assert cascade_core.lut_report() is None
+    assert model_core.cascade_report() is None
+
+    sides = np.random.default_rng(2).uniform(1, 99, size=(2000, 3))
+    expected = model_core.validate_batch(sides)["is_valid_by_ai"]
+    actual = cascade_core.validate_batch(sides)["is_valid_by_ai"]
+    assert np.mean(expected == actual) > 0.99
+    # 경계에서 먼 입력은 1단계가 응답하고 나머지만 실제 모델로 계산
+    stages = cascade_core.cascade_report()["stages"]
+    assert stages["first_stage"] + stages["full_model"] == 2000
+    assert stages["first_stage_rate"] > 0.5
+
+    result = cascade_core.validate(3, 4, 5)
+    assert result["is_valid_by_ai"] is True and result["math_result"] == bool(triangle_mask(np.array([[3, 4, 5]]))[0])
+
+    # 저장된 1단계는 같은 모델이면 다시 학습하지 않고 읽음 (band는 바꿀 수 있음)
+    assert os.path.exists(path)
+    reloaded = TriangleValidatorCore(framework="numpy", prediction_mode="cascade",
+                                     cascade_options={"samples": 20000, "holdout": 5000, "path": path, "band": 0.3})
+    assert "fit_seconds" not in reloaded.cascade_report()["fit"]
+    assert reloaded.cascade_report()["fit"]["band"] == 0.3
@@ -0,0 +1,62 @@
+"""
+헤드리스 대량 검증 CLI 테스트
+
+CSV, JSONL, .npy 입력을 청크 단위로 읽어 같은 결과를 기록하는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cli
+from core.bulk_io import iter_chunks
+
+pytest.importorskip("h5py")
+
+SIDES = np.array([[3, 4, 5], [1, 2, 10], [5, 5, 5], [0, 4, 5], [7, 8, 20]], dtype=np.float64)
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    csv_path = tmp_path / "sides.csv"
+    csv_path.write_text("a,b,c\n" + "\n".join(",".join(str(v) for v in row) for row in SIDES) + "\n")
+    jsonl_path = tmp_path / "sides.jsonl"
+    jsonl_path.write_text("\n".join(json.dumps(row) for row in SIDES.tolist()) + "\n")
+    npy_path = tmp_path / "sides.npy"
+    np.save(npy_path, SIDES.astype(np.float32))
+    return {"csv": str(csv_path), "jsonl": str(jsonl_path), "npy": str(npy_path)}
+
+
+@pytest.mark.parametrize("input_format", ["csv", "jsonl", "npy"])
+def test_iter_chunks_respects_chunk_size(inputs, input_format):
+    chunks = list(iter_chunks(inputs[input_format], chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    np.testing.assert_allclose(np.concatenate(chunks), SIDES)
+
+
+@pytest.mark.parametrize("input_format", ["csv", "jsonl", "npy"])
+def test_cli_writes_csv_results(inputs, input_format, tmp_path, capsys):
+    output_path = tmp_path / f"out_{input_format}.csv"
+    exit_code = cli.main([inputs[input_format], "-o", str(output_path),
+                          "--framework", "numpy", "--chunk-size", "2"])
+    assert exit_code == 0
+
+    lines = output_path.read_text().splitlines()
+    assert lines[0].startswith("a,b,c,math_result")
+    assert len(lines) == len(SIDES) + 1
+    math_results = [int(line.split(",")[3]) for line in lines[1:]]
+    assert math_results == [1, 0, 1, 0, 0]
+    assert "rows/sec=" in capsys.readouterr().err
+
+
+def test_cli_streams_jsonl_to_stdout(inputs, capsys):
+    assert cli.main([inputs["csv"], "--framework", "numpy", "--output-format", "jsonl"]) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["sides"] for row in rows] == SIDES.tolist()
+    assert rows[0]["is_valid_by_ai"] is True
@@ -0,0 +1,94 @@
+"""
+압축 모델 내보내기/어댑터 테스트
+
+int8 양자화 왕복 오차, 유닛 제거가 보정 범위 안의 출력을 바꾸지 않는지,
+내보낸 .npz를 framework="compact"로 코어에서 실행했을 때 원본과 판정이 일치하는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.adapters.compact_adapter import dequantize_kernel, quantize_kernel
+
+SIDES = np.random.default_rng(6).uniform(1, 99, size=(2000, 3))
+
+
+def test_int8_quantization_round_trip():
+    kernel = np.random.default_rng(0).normal(size=(16, 8)).astype(np.float32)
+    kernel[:, 3] = 0.0
+    stored, scale = quantize_kernel(kernel, "int8")
+    assert stored.dtype == np.int8 and scale.shape == (8,)
+    restored = dequantize_kernel(stored, scale)
+    assert np.all(np.abs(restored - kernel) <= scale / 2 + 1e-7)
+    assert np.all(restored[:, 3] == 0.0)
+
+    stored, scale = quantize_kernel(kernel, "float16")
+    assert stored.dtype == np.float16 and scale is None
+    with pytest.raises(ValueError):
+        quantize_kernel(kernel, "int4")
+
+
+def test_remove_dead_units_keeps_outputs():
+    from models.compact_export import remove_dead_units
+    from models.adapters.compact_adapter import CompactMLP
+
+    rng = np.random.default_rng(1)
+    layers = [
+        (rng.normal(size=(3, 6)).astype(np.float32), rng.normal(size=6).astype(np.float32), "relu"),
+        (rng.normal(size=(6, 1)).astype(np.float32), np.zeros(1, np.float32), "sigmoid"),
+    ]
+    layers[0][1][2] = -1e4 # 항상 0을 출력하는 유닛
+    layers[1][0][4] = 0.0 # 나가는 가중치가 모두 0인 유닛
+    compact, removed = remove_dead_units(layers, SIDES)
+    assert removed == [2]
+    assert compact[0][0].shape == (3, 4) and compact[1][0].shape == (4, 1)
+    np.testing.assert_allclose(CompactMLP(compact).forward(SIDES), CompactMLP(layers).forward(SIDES), rtol=1e-5)
+
+
+@pytest.mark.parametrize("weight_dtype", ["int8", "float16"])
+def test_exported_model_runs_in_core(tmp_path, weight_dtype):
+    pytest.importorskip("tensorflow")
+    from core.triangle_validator_core import TriangleValidatorCore
+    from models.compact_export import export_compact
+
+    path = str(tmp_path / f"model_{weight_dtype}.npz")
+    report = export_compact(path, weight_dtype=weight_dtype, holdout_samples=20000, measure=False)
+    assert report["size_bytes"]["compact"] < report["size_bytes"]["original"] / 5
+    assert report["agreement"] > 0.99
+    assert abs(report["accuracy"]["delta"]) < 0.01
+    # 유닛 제거는 명시적으로 켜야 하며, 보고서에는 범위 밖 입력의 일치율도 포함됨
+    assert report["removed_units"] == []
+    assert set(report["out_of_range"]) == {"x10", "x0.1"}
+
+    compact = TriangleValidatorCore(framework="compact", model_path=path, scaler_path=path)
+    reference = TriangleValidatorCore(framework="numpy")
+    compact_batch = compact.validate_batch(SIDES)
+    reference_batch = reference.validate_batch(SIDES)
+    agreement = np.mean((compact_batch["ai_prediction_value"] > 0.5) == (reference_batch["ai_prediction_value"] > 0.5))
+    assert agreement > 0.99
+    assert compact.validate(3, 4, 5)["math_result"] is True
+
+
+def test_report_formatting_handles_zero_baselines():
+    import export_compact
+
+    report = {
+        "size_bytes": {"original": 0, "compact": 10},
+        "parameters": {"original": 0, "compact": 0, "compact_nonzero": 0},
+        "accuracy": {"original": 1.0, "compact": 1.0, "delta": 0.0},
+        "latency": {"original": {"single_ms": 0.0, "batch_rows_per_second": 0.0},
+                    "compact": {"single_ms": 0.0, "batch_rows_per_second": 0.0}},
+        "agreement": 1.0, "max_abs_deviation": 0.0, "holdout_samples": 1, "removed_units": [],
+        "out_of_range": {"x10": {"agreement": 0.5, "max_abs_deviation": 0.9, "flipped": 1}},
+    }
+    text = export_compact.format_report(report)
+    assert "n/a" in text and "x10" in text
+
+    with pytest.raises(SystemExit):
+        export_compact.main(["-o", "unused.npz", "--holdout", "0"])
@@ -0,0 +1,84 @@
+"""
+동시 호출 테스트
+
+여러 스레드와 asyncio에서 동시에 검증해도 순차 실행과 같은 결과를 돌려주고,
+모델 복제본 풀이 동시 모델 호출 수를 제한하는지 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.replica_pool import ReplicaPool
+from core.triangle_validator_core import TriangleValidatorCore
+
+pytest.importorskip("h5py")
+pytest.importorskip("joblib")
+
+SAMPLES = np.random.default_rng(0).uniform(1, 99, size=(64, 3))
+
+
+@pytest.fixture(scope="module")
+def core():
+    core = TriangleValidatorCore(framework="numpy", replicas=3, cache_size=32)
+    yield core
+    core.close()
+
+
+def test_threads_match_sequential(core):
+    expected = [core.validate(*row)["ai_prediction_value"] for row in SAMPLES]
+
+    def work(offset):
+        rows = np.roll(SAMPLES, offset, axis=0)
+        return [core.validate(*row)["ai_prediction_value"] for row in rows], offset
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for values, offset in executor.map(work, range(8)):
+            assert values == pytest.approx(np.roll(expected, offset), abs=1e-6)
+
+    replicas = core._current_version()[3]
+    assert replicas.size == 3 and replicas.available() == 3 # 모든 복제본이 반납됨
+
+
+def test_async_validate(core):
+    async def run():
+        singles = await asyncio.gather(*(core.avalidate(*row) for row in SAMPLES[:8]))
+        batch = await core.avalidate_batch(SAMPLES[:8])
+        return singles, batch
+
+    singles, batch = asyncio.run(run())
+    assert [s["ai_prediction_value"] for s in singles] == pytest.approx(batch["ai_prediction_value"], abs=1e-6)
+
+
+def test_replica_pool_limits_concurrency():
+    pool = ReplicaPool(["only"])
+    active = []
+    peak = []
+
+    def use():
+        with pool.acquire() as replica:
+            active.append(replica)
+            peak.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+
+    threads = [threading.Thread(target=use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 1
+
+    with pool.acquire():
+        with pytest.raises(TimeoutError):
+            with pool.acquire(timeout=0.01):
+                pass
@@ -0,0 +1,76 @@
+"""
+TriangleValidatorCore 배치 검증 테스트
+
+validate_batch가 validate()를 행마다 호출한 결과와 같은 값을 돌려주는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.triangle_validator_core import TriangleValidatorCore
+
+SAMPLE_SIDES = [
+    (3, 4, 5),
+    (1, 2, 10),
+    (5, 5, 5),
+    (1, 1, 2),      # 퇴화 삼각형 (a + b == c)
+    (0, 4, 5),      # 0 이하 변
+    (-1, 4, 5),
+    (99, 50, 60),
+]
+
+
+@pytest.fixture(scope="module")
+def core():
+    return TriangleValidatorCore()
+
+
+def test_batch_math_matches_scalar(core):
+    expected = [core.validate_by_math(*s) for s in SAMPLE_SIDES]
+    result = core.validate_batch_by_math(np.array(SAMPLE_SIDES, dtype=float))
+    assert result.tolist() == expected
+
+
+def test_batch_accepts_iterables(core):
+    from_generator = core.validate_batch_by_math(s for s in SAMPLE_SIDES)
+    from_list = core.validate_batch_by_math(SAMPLE_SIDES)
+    assert from_generator.tolist() == from_list.tolist()
+    assert core.validate_batch_by_math([]).shape == (0,)
+
+
+def test_batch_rejects_wrong_shape(core):
+    with pytest.raises(ValueError):
+        core.validate_batch(np.zeros((4, 2)))
+
+
+def test_batch_matches_validate(core):
+    if core.model is None or core.scaler is None:
+        pytest.skip("AI 모델 또는 스케일러를 로드할 수 없습니다.")
+
+    batch = core.validate_batch(SAMPLE_SIDES)
+    assert batch["sides"].shape == (len(SAMPLE_SIDES), 3)
+    for i, sides in enumerate(SAMPLE_SIDES):
+        single = core.validate(*sides)
+        assert bool(batch["math_result"][i]) == single["math_result"]
+        assert batch["ai_prediction_value"][i] == pytest.approx(single["ai_prediction_value"], abs=1e-5)
+        assert bool(batch["is_valid_by_ai"][i]) == single["is_valid_by_ai"]
+        assert bool(batch["is_consistent"][i]) == single["is_consistent"]
+
+
+def test_deferred_model_loading():
+    pytest.importorskip("h5py")
+    core = TriangleValidatorCore(framework="numpy", load_on_init=False)
+    assert not core.is_ready
+    assert core.validate_by_math(3, 4, 5)
+    assert core.validate_by_ai(3, 4, 5) is None
+
+    assert core.load_models()
+    assert core.is_ready
+    assert core.load_models() # 두 번째 호출은 다시 로드하지 않음
+    assert core.validate_by_ai(3, 4, 5) is not None
@@ -0,0 +1,166 @@
+"""
+결정 지도 테스트
+
+성긴 단계부터 계산해 전체 픽셀을 채우고, 취소 후 다시 계산하면 이어서 진행하며,
+같은 단면은 캐시에서 재사용되는지 확인합니다.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.decision_map import DecisionMap, DecisionMapCache
+from core.results import BatchResult
+
+
+class FakeValidator:
+    """b > 60인 영역에서만 수학 판정과 반대로 예측하는 validator"""
+
+    def __init__(self):
+        self.rows = 0
+        self.is_ready = True
+        self.model_generation = 1
+
+    def validate_batch_by_math(self, sides):
+        a, b, c = np.asarray(sides).T
+        return (a + b > c) & (a + c > b) & (b + c > a)
+
+    def validate_batch_by_ai(self, sides):
+        sides = np.asarray(sides)
+        self.rows += len(sides)
+        wrong = sides[:, 1] > 60
+        return np.where(self.validate_batch_by_math(sides) != wrong, 0.9, 0.1)
+
+    def validate_batch(self, sides):
+        sides = np.asarray(sides)
+        return BatchResult.from_columns(sides, self.validate_batch_by_math(sides), self.validate_batch_by_ai(sides))
+
+
+def test_compute_fills_map_coarse_to_fine():
+    validator = FakeValidator()
+    decision_map = DecisionMap(50, size=64)
+    progress = []
+    assert decision_map.compute(validator.validate_batch, chunk_size=500,
+                                on_chunk=lambda stride, done, total: progress.append(stride))
+
+    assert decision_map.complete and decision_map.known.all()
+    assert validator.rows == 64 * 64 # 이미 계산한 픽셀은 다시 계산하지 않음
+    assert progress[0] == 16 and progress[-1] == 1
+    expected_wrong = decision_map.axis > 60
+    np.testing.assert_array_equal(decision_map.disagreement().any(axis=1), expected_wrong)
+
+    image = decision_map.render_rgba()
+    assert image.shape == (64, 64, 4)
+    assert (image[0, 0, :3] == [255, 221, 0]).all() # 위쪽(큰 b)은 불일치 영역
+
+
+def test_cancelled_map_resumes():
+    validator = FakeValidator()
+    decision_map = DecisionMap(50, size=32)
+    calls = []
+    assert not decision_map.compute(validator.validate_batch, chunk_size=64,
+                                    is_cancelled=lambda: len(calls) >= 3,
+                                    on_chunk=lambda *args: calls.append(args))
+    assert not decision_map.complete
+    assert decision_map.render_rgba().shape == (32, 32, 4) # 중간 결과도 그릴 수 있음
+
+    assert decision_map.compute(validator.validate_batch, chunk_size=64)
+    assert validator.rows == 32 * 32
+
+
+def test_cache_reuses_maps_per_generation():
+    cache = DecisionMapCache(max_maps=2)
+    first = cache.get(1, 50)
+    assert cache.get(1, 50.0) is first
+    assert cache.get(2, 50) is not first # 모델 교체 후에는 새 지도
+    cache.get(1, 40)
+    assert cache.get(1, 50) is not first # 가장 오래된 지도는 제거됨
+
+
+def test_viewmodel_streams_progress():
+    pytest.importorskip("PySide6")
+    from PySide6 import QtCore
+    from viewmodels.decision_map_viewmodel import DecisionMapViewModel
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    viewmodel = DecisionMapViewModel(FakeValidator())
+    sources = []
+    viewmodel.imageChanged.connect(lambda: sources.append(viewmodel.imageSource))
+
+    viewmodel.show(30.0)
+    deadline = time.monotonic() + 10
+    while (viewmodel.isBusy or viewmodel.progress < 1.0) and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    assert viewmodel.progress == 1.0
+    assert len(sources) > 1 and len(set(sources)) == len(sources) # 중간 결과마다 새 주소
+    assert viewmodel.image_provider.requestImage("", None, None).width() == 256
+    assert viewmodel.disagreementRate > 0
+
+
+def test_viewmodel_shares_pool_with_validation():
+    pytest.importorskip("PySide6")
+    from PySide6 import QtCore
+    from viewmodels.decision_map_viewmodel import DecisionMapViewModel
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    validator = FakeValidator()
+    active, overlaps = [0], []
+    validate_batch_by_ai = validator.validate_batch_by_ai
+
+    def exclusive_validate_batch_by_ai(sides):
+        active[0] += 1
+        overlaps.append(active[0] > 1)
+        try:
+            time.sleep(0.01)
+            return validate_batch_by_ai(sides)
+        finally:
+            active[0] -= 1
+
+    validator.validate_batch_by_ai = exclusive_validate_batch_by_ai
+    pool = QtCore.QThreadPool()
+    pool.setMaxThreadCount(1)
+    viewmodel = DecisionMapViewModel(validator, thread_pool=pool)
+    viewmodel.show(30.0)
+    deadline = time.monotonic() + 10
+    while viewmodel.progress == 0.0 and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+    # 지도 계산 중에 들어온 검증 요청은 지도가 끝나기 전에 같은 스레드에서 실행됨
+    map_done_when_validated = []
+    decision_map = viewmodel.cache.get(validator.model_generation, 30.0)
+    pool.start(lambda: map_done_when_validated.append(decision_map.complete))
+    while viewmodel.isBusy and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert viewmodel.wait_for_idle(10000)
+
+    assert map_done_when_validated == [False]
+    assert decision_map.complete and viewmodel.progress == 1.0
+    assert not any(overlaps)
+
+
+@pytest.mark.parametrize("ai_policy, ai_sample_rate", [("never", 1.0), ("sampled", 0.0), ("shadow", 1.0)])
+def test_map_ignores_ai_policy(ai_policy, ai_sample_rate):
+    pytest.importorskip("PySide6")
+    pytest.importorskip("h5py")
+    from core.triangle_validator_core import TriangleValidatorCore
+    from viewmodels.decision_map_viewmodel import map_validate_batch
+
+    core = TriangleValidatorCore(framework="numpy", ai_policy=ai_policy, ai_sample_rate=ai_sample_rate)
+    try:
+        decision_map = DecisionMap(50, size=32)
+        assert decision_map.compute(map_validate_batch(core))
+        # 정책과 관계없이 모든 픽셀에 AI 값이 있고, 지도 점은 shadow 큐로 가지 않음
+        assert decision_map.has_ai and not np.isnan(decision_map.values).any()
+        assert core.shadow_stats() is None
+    finally:
+        core.close()
@@ -0,0 +1,191 @@
+"""
+분산 배치 평가 테스트
+
+로컬 워커 프로세스로 나누어 검증한 결과가 입력 순서대로 단일 프로세스 결과와 같은지,
+연결이 끊기거나 오류를 보내는 워커의 청크가 재시도되는지 확인합니다.
+"""
+
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.distributed import (PROTOCOL_VERSION, Coordinator, Worker, format_address, parse_address,
+                              recv_message, send_message, start_local_workers, _connect)
+from core.triangle_validator_core import TriangleValidatorCore
+
+pytest.importorskip("h5py")
+
+SIDES = np.random.default_rng(7).uniform(-5, 99, size=(5003, 3))
+
+
+def chunked(sides, size):
+    return (sides[start:start + size] for start in range(0, len(sides), size))
+
+
+def run_collect(coordinator, sides, chunk_size, **options):
+    results = []
+    stats = coordinator.run(chunked(sides, chunk_size), results.append, timeout=60, **options)
+    return results, stats
+
+
+class FakeWorker(threading.Thread):
+    """프로토콜만 따르는 테스트용 워커. mode="die"이면 첫 청크를 받고 연결을 끊고, "error"이면 항상 오류를 보냄"""
+
+    def __init__(self, address, mode, token=None):
+        super().__init__(daemon=True)
+        self.address = address
+        self.mode = mode
+        self.token = token
+        self.received_task = threading.Event()
+        self.reply = None
+
+    def run(self):
+        sock = _connect(self.address, 10)
+        try:
+            send_message(sock, {"type": "hello", "protocol": PROTOCOL_VERSION, "name": self.mode, "token": self.token})
+            self.reply, _ = recv_message(sock)
+            if self.reply["type"] != "welcome":
+                return
+            while True:
+                header, _ = recv_message(sock, max_payload=1 << 20)
+                if header["type"] == "shutdown":
+                    return
+                self.received_task.set()
+                if self.mode == "die":
+                    return
+                send_message(sock, {"type": "error", "chunk": header["chunk"], "message": "boom"})
+        except ConnectionError:
+            pass
+        finally:
+            sock.close()
+
+
+def test_address_parsing():
+    assert parse_address("10.0.0.5:7070") == ("10.0.0.5", 7070)
+    assert parse_address("unix:/tmp/triangle.sock") == "/tmp/triangle.sock"
+    assert parse_address("[::1]:9000") == ("::1", 9000)
+    assert format_address(("::1", 9000)) == "[::1]:9000"
+    assert format_address("/tmp/triangle.sock") == "unix:/tmp/triangle.sock"
+
+
+def test_local_workers_match_single_process():
+    expected = TriangleValidatorCore(framework="numpy").validate_batch(SIDES)
+    with Coordinator("127.0.0.1:0") as coordinator:
+        processes = start_local_workers(coordinator.address, 3, framework="numpy")
+        assert coordinator.wait_for_workers(3, timeout=60)
+        progress = []
+        results, stats = run_collect(coordinator, SIDES, 400, on_progress=progress.append)
+        # 같은 워커로 두 번째 작업도 처리
+        empty, empty_stats = run_collect(coordinator, SIDES[:0], 400)
+    for process in processes:
+        process.join(timeout=10)
+        assert process.exitcode == 0
+
+    assert [len(result) for result in results] == [400] * 12 + [203]
+    merged = np.concatenate([result.data for result in results])
+    np.testing.assert_array_equal(merged["sides"], SIDES)
+    np.testing.assert_array_equal(merged["math_result"], expected["math_result"])
+    np.testing.assert_allclose(merged["ai_prediction_value"], expected["ai_prediction_value"])
+    assert stats["rows"] == len(SIDES) and stats["chunks"] == 13 and stats["retries"] == 0
+    assert sum(worker["chunks"] for worker in stats["workers"].values()) == 13
+    assert progress[-1]["rows"] == len(SIDES)
+    assert empty == [] and empty_stats["rows"] == 0
+
+
+def test_chunks_from_dead_worker_are_retried(tmp_path):
+    address = str(tmp_path / "coordinator.sock")
+    with Coordinator(f"unix:{address}") as coordinator:
+        dead = FakeWorker(address, "die")
+        dead.start()
+        assert coordinator.wait_for_workers(1, timeout=10)
+
+        outcome = {}
+        runner = threading.Thread(target=lambda: outcome.update(zip(("results", "stats"),
+                                                                    run_collect(coordinator, SIDES, 1000))))
+        runner.start()
+        assert dead.received_task.wait(10)
+        # 죽은 워커의 청크는 나중에 접속한 워커가 처리
+        worker = threading.Thread(target=Worker(f"unix:{address}", name="real", framework="numpy").run, daemon=True)
+        worker.start()
+        runner.join(60)
+    worker.join(10)
+
+    stats = outcome["stats"]
+    assert stats["retries"] >= 1 and stats["workers"]["real"]["chunks"] == 6
+    assert stats["workers"]["die"]["failures"] >= 1
+    merged = np.concatenate([result.data for result in outcome["results"]])
+    np.testing.assert_array_equal(merged["sides"], SIDES)
+
+
+def test_chunk_failing_on_every_attempt_aborts_job():
+    with Coordinator("127.0.0.1:0", max_attempts=2) as coordinator:
+        FakeWorker(coordinator.address, "error").start()
+        assert coordinator.wait_for_workers(1, timeout=10)
+        with pytest.raises(RuntimeError, match="2번 실패"):
+            coordinator.run(chunked(SIDES, 1000), lambda result: None, timeout=30)
+
+
+def test_wrong_token_is_rejected():
+    with Coordinator("127.0.0.1:0", token="secret") as coordinator:
+        intruder = FakeWorker(coordinator.address, "die", token="guess")
+        intruder.start()
+        intruder.join(10)
+        assert intruder.reply["type"] == "rejected"
+        assert coordinator.connected_workers() == 0
+
+
+@pytest.mark.parametrize("header", [
+    {"type": "hello", "protocol": PROTOCOL_VERSION, "payload_bytes": 1 << 40}, # 인증 전 거대한 payload
+    {"type": "hello", "protocol": PROTOCOL_VERSION, "payload_bytes": -1},
+    ["hello"],
+])
+def test_malformed_handshake_is_dropped_without_reading_payload(header):
+    with Coordinator("127.0.0.1:0") as coordinator:
+        sock = _connect(coordinator.address, 10)
+        try:
+            data = json.dumps(header).encode("utf-8")
+            sock.sendall(struct.pack("!I", len(data)) + data)
+            # 코디네이터가 payload를 기다리지 않고 연결을 닫음
+            assert sock.recv(1) == b""
+        finally:
+            sock.close()
+        assert coordinator.connected_workers() == 0
+
+
+def test_unix_address_never_deletes_regular_files(tmp_path):
+    path = tmp_path / "results.csv"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        Coordinator(f"unix:{path}")
+    assert path.read_text() == "keep me"
+
+    # 이전 실행이 남긴 소켓 파일은 다시 사용
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(tmp_path / "stale.sock"))
+    stale.close()
+    with Coordinator(f"unix:{tmp_path / 'stale.sock'}") as coordinator:
+        assert coordinator.address == str(tmp_path / "stale.sock")
+    assert not (tmp_path / "stale.sock").exists()
+
+
+def test_cli_output_matches_single_process_cli(tmp_path):
+    import cli
+    import distribute
+
+    input_path = tmp_path / "sides.npy"
+    np.save(input_path, SIDES[:2000])
+    single_path, distributed_path = tmp_path / "single.csv", tmp_path / "distributed.csv"
+    assert cli.main([str(input_path), "-o", str(single_path), "--framework", "numpy"]) == 0
+    assert distribute.main(["coordinator", str(input_path), "-o", str(distributed_path), "--listen", "127.0.0.1:0",
+                            "--local-workers", "2", "--framework", "numpy", "--chunk-size", "300",
+                            "--progress-interval", "0"]) == 0
+    assert distributed_path.read_text() == single_path.read_text()
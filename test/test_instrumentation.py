@@ -0,0 +1,69 @@
+"""
+검증 경로 계측 테스트
+
+계측을 켜면 단계별 히스토그램과 AI/수학 불일치 카운터가 기록되고
+Prometheus 텍스트로 노출되는지, 끄면 아무것도 기록하지 않는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.metrics import PipelineMetrics
+from core.triangle_validator_core import TriangleValidatorCore
+
+pytest.importorskip("h5py")
+
+
+def test_metrics_disabled_by_default():
+    core = TriangleValidatorCore(framework="numpy")
+    assert core.metrics is None
+    assert core.adapter.metrics is None
+    assert core.metrics_snapshot() is None
+
+
+def test_validate_records_stage_timings_and_disagreements():
+    core = TriangleValidatorCore(framework="numpy", metrics=True)
+    core.validate(3, 4, 5)
+    core.validate(1, 2, 10)
+
+    snapshot = core.metrics_snapshot()
+    assert snapshot["validations"] == 2
+    assert snapshot["ai_predictions"] == 2
+    for stage in ("input_conversion", "model_forward", "math_check", "result_assembly"):
+        assert snapshot["stages"][stage]["count"] == 2
+        assert snapshot["stages"][stage]["total_seconds"] > 0
+    # NumPy 어댑터는 스케일러를 가중치에 접어 넣으므로 별도 변환 단계가 없음
+    assert snapshot["stages"]["scaler_transform"]["count"] == 0
+
+
+def test_disagreement_counter_matches_batch_consistency():
+    metrics = PipelineMetrics()
+    core = TriangleValidatorCore(framework="numpy", metrics=metrics)
+    sides = [[3, 4, 5], [1, 2, 10], [1, 1, 1.99], [50, 50, 99], [10, 20, 29.9]]
+    results = core.validate_batch(sides)
+    expected = len(sides) - int(results["is_consistent"].sum())
+
+    snapshot = metrics.snapshot()
+    assert snapshot["validations"] == len(sides)
+    assert snapshot["disagreements"] == expected
+    # 배치 경로는 단계별 히스토그램에 섞지 않음
+    assert all(stage["count"] == 0 for stage in snapshot["stages"].values())
+
+
+def test_prometheus_export_and_reset():
+    metrics = PipelineMetrics()
+    metrics.observe("model_forward", 0.001)
+    metrics.record_results(3, 3, 1)
+
+    text = metrics.render()
+    assert "triangle_ai_math_disagreements_total 1" in text
+    assert 'triangle_stage_model_forward_seconds_bucket{le="0.001"} 1' in text
+
+    metrics.reset()
+    assert metrics.snapshot()["validations"] == 0
+    assert metrics.snapshot()["stages"]["model_forward"]["count"] == 0
@@ -0,0 +1,104 @@
+"""
+AI 예측 룩업 테이블 테스트
+
+보간 정확도, 범위 밖/결정 경계 대체, 그리고 LUT 모드 코어가 실제 모델과
+같은 판정을 내리는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.lookup_table import PredictionLUT
+from core.triangle_validator_core import TriangleValidatorCore
+
+
+def linear(sides):
+    # 삼선형 보간으로 정확히 재현되는 함수 (값 범위 약 0.01 ~ 0.99, 합이 147일 때 0.5)
+    return 0.01 + sides.sum(axis=1) / 300.0
+
+
+def test_interpolation_is_exact_for_linear_function():
+    above_threshold = lambda sides: 0.55 + sides.sum(axis=1) / 1000.0
+    lut = PredictionLUT.build(above_threshold, points=11, margin=0.0)
+    sides = np.array([[1.0, 1.0, 1.0], [12.3, 45.6, 78.9], [99.0, 99.0, 99.0]])
+    for row, expected in zip(sides, above_threshold(sides)):
+        assert lut.lookup(*row) == pytest.approx(expected)
+    values, covered = lut.lookup_batch(sides)
+    assert covered.all()
+    assert values == pytest.approx(above_threshold(sides))
+    assert not lut.boundary_cells.any()
+
+
+def test_boundary_cells_fall_back():
+    lut = PredictionLUT.build(linear, points=11, margin=0.0)
+    assert lut.boundary_cells.any()
+    assert lut.lookup(50, 50, 47) is None # 0.5가 지나가는 칸
+    assert lut.lookup(10, 10, 10) == pytest.approx(linear(np.array([[10, 10, 10]]))[0])
+
+
+def test_out_of_range_and_threshold_fall_back():
+    lut = PredictionLUT.build(linear, points=11, margin=0.05)
+    assert lut.lookup(0.5, 10, 10) is None
+    assert lut.lookup(10, 10, 120) is None
+    values, covered = lut.lookup_batch([[0.5, 10, 10], [50, 50, 47], [10, 10, 10]])
+    assert covered.tolist() == [False, False, True]
+    assert np.isnan(values[:2]).all()
+
+
+def test_non_finite_rows_fall_back():
+    lut = PredictionLUT.build(linear, points=11, margin=0.05)
+    assert lut.lookup(np.nan, 10, 10) is None
+    values, covered = lut.lookup_batch([[np.nan, 10, 10], [10, np.inf, 10], [10, 10, -np.inf], [10, 10, 10]])
+    assert covered.tolist() == [False, False, False, True]
+    assert values[3] == pytest.approx(linear(np.array([[10, 10, 10]]))[0])
+
+
+def test_save_and_load_checks_fingerprint(tmp_path):
+    path = str(tmp_path / "lut.npz")
+    PredictionLUT.build(linear, points=5, fingerprint="v1").save(path)
+    assert PredictionLUT.load(path, "v1").lookup(10, 20, 30) == pytest.approx(linear(np.array([[10, 20, 30]]))[0])
+    assert PredictionLUT.load(path, "v2") is None
+    assert PredictionLUT.load(str(tmp_path / "missing.npz")) is None
+
+
+def test_lut_mode_matches_model_decisions(tmp_path):
+    pytest.importorskip("h5py")
+    lut_path = str(tmp_path / "triangle_lut.npz")
+    model_core = TriangleValidatorCore(framework="numpy")
+    lut_core = TriangleValidatorCore(framework="numpy", prediction_mode="lut",
+                                     lut_options={"points": 50, "path": lut_path})
+
+    report = lut_core.lut_report()
+    assert report["decision_mismatches"] == 0
+    assert 0.0 < report["coverage"] <= 1.0
+    assert os.path.exists(lut_path)
+
+    rng = np.random.default_rng(3)
+    sides = np.vstack([rng.uniform(1, 99, size=(2000, 3)), [[0.5, 3, 3], [150, 100, 100]]])
+    expected = model_core.validate_batch(sides)["is_valid_by_ai"]
+    assert np.array_equal(lut_core.validate_batch(sides)["is_valid_by_ai"], expected)
+    single = [lut_core.validate_by_ai(*row) > 0.5 for row in sides[:200]]
+    assert single == expected[:200].tolist()
+
+    # NaN 행만 모델로 넘어가고 나머지 행은 그대로 계산됨
+    with_nan = lut_core.validate_batch_by_ai([[3, 4, 5], [np.nan, 4, 5]])
+    expected_nan = model_core.validate_batch_by_ai([[3, 4, 5], [np.nan, 4, 5]])
+    assert with_nan is not None
+    np.testing.assert_array_equal(np.isnan(with_nan), np.isnan(expected_nan))
+    assert with_nan[0] > 0.5
+
+    # 같은 모델이면 저장된 LUT를 다시 사용
+    reloaded = TriangleValidatorCore(framework="numpy", prediction_mode="lut",
+                                     lut_options={"points": 50, "path": lut_path})
+    assert reloaded.lut_report()["coverage"] == pytest.approx(report["coverage"])
+
+
+def test_unknown_prediction_mode_is_rejected():
+    with pytest.raises(ValueError):
+        TriangleValidatorCore(framework="numpy", prediction_mode="table", load_on_init=False)
@@ -0,0 +1,152 @@
+"""
+모델 레지스트리 테스트
+
+같은 내용의 모델은 한 번만 로드되어 공유되고, 파일이 바뀌면 진행 중인 요청을
+끊지 않고 새 버전으로 교체되는지 확인합니다.
+"""
+
+import os
+import shutil
+import sys
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.model_registry import ModelRegistry
+from core.triangle_validator_core import DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH, TriangleValidatorCore
+
+pytest.importorskip("h5py")
+joblib = pytest.importorskip("joblib")
+
+
+@pytest.fixture
+def model_files(tmp_path):
+    model_path = tmp_path / "model.h5"
+    scaler_path = tmp_path / "scaler.pkl"
+    shutil.copy(DEFAULT_MODEL_PATH, model_path)
+    shutil.copy(DEFAULT_SCALER_PATH, scaler_path)
+    return str(model_path), str(scaler_path)
+
+
+def replace_scaler(scaler_path, shift):
+    """스케일러 오프셋을 바꿔 저장하고, 변경이 감지되도록 mtime을 과거 시각으로 옮깁니다."""
+    scaler = joblib.load(scaler_path)
+    scaler.min_ = scaler.min_ + shift
+    joblib.dump(scaler, scaler_path)
+    past = time.time() - 5
+    os.utime(scaler_path, (past, past))
+
+
+def test_identical_models_are_shared(model_files):
+    registry = ModelRegistry()
+    first = TriangleValidatorCore(framework="numpy", registry=registry)
+    second = TriangleValidatorCore(framework="numpy", registry=registry)
+    # 경로가 달라도 내용이 같으면 같은 버전을 사용
+    copied = TriangleValidatorCore(model_path=model_files[0], scaler_path=model_files[1],
+                                   framework="numpy", registry=registry)
+
+    assert first.model is second.model is copied.model
+    assert first.scaler is copied.scaler
+
+
+def test_slow_load_does_not_block_other_models(model_files, tmp_path):
+    other_files = (str(tmp_path / "other.h5"), str(tmp_path / "other.pkl"))
+    shutil.copy(DEFAULT_MODEL_PATH, other_files[0])
+    shutil.copy(DEFAULT_SCALER_PATH, other_files[1])
+    replace_scaler(other_files[1], shift=0.3) # 내용이 다른 모델
+    registry = ModelRegistry()
+    load_files = registry._load_files
+    slow_started, release = threading.Event(), threading.Event()
+    loads = []
+
+    def slow_load_files(handle, fingerprint):
+        loads.append(handle.model_path)
+        if handle.model_path == os.path.realpath(model_files[0]):
+            slow_started.set()
+            release.wait(10)
+        return load_files(handle, fingerprint)
+
+    registry._load_files = slow_load_files
+    # 같은 파일을 동시에 요청한 두 스레드는 한 번만 로드한 버전을 공유
+    slow = [threading.Thread(target=lambda: registry.acquire(*model_files, framework="numpy")) for _ in range(2)]
+    for thread in slow:
+        thread.start()
+    assert slow_started.wait(10)
+
+    # 다른 모델의 acquire는 느린 로드를 기다리지 않음
+    started = time.monotonic()
+    other = registry.acquire(*other_files, framework="numpy")
+    assert time.monotonic() - started < 5 and other.current.is_ready
+    assert not release.is_set()
+
+    release.set()
+    for thread in slow:
+        thread.join(10)
+    handle = registry.acquire(*model_files, framework="numpy")
+    assert handle.current.is_ready
+    assert loads.count(os.path.realpath(model_files[0])) == 1
+
+
+def test_hot_reload_swaps_version(model_files):
+    registry = ModelRegistry(settle_seconds=0)
+    core = TriangleValidatorCore(model_path=model_files[0], scaler_path=model_files[1],
+                                 framework="numpy", registry=registry, cache_size=16)
+    before = core.validate_by_ai(3, 4, 5)
+    old_fingerprint = core.model_fingerprint
+    in_flight = core._current_version()[0] # 교체 전에 시작된 요청이 잡아 둔 버전
+
+    assert registry.check_for_updates() == [] # 변경 없음
+    replace_scaler(model_files[1], shift=0.3)
+    reloaded = registry.check_for_updates()
+
+    assert len(reloaded) == 1
+    assert core.model_generation == 2
+    after = core.validate_by_ai(3, 4, 5)
+    assert after != pytest.approx(before)
+    assert core.model_fingerprint != old_fingerprint # 캐시도 새 버전 기준으로 다시 만들어짐
+    # 이전 버전은 진행 중인 요청에서 계속 사용할 수 있음
+    assert core.adapter.predict(in_flight.model, [3, 4, 5], scaler=in_flight.scaler) == pytest.approx(before)
+
+
+def test_hot_reload_releases_replaced_persistent_cache(model_files, tmp_path):
+    registry = ModelRegistry(settle_seconds=0)
+    core = TriangleValidatorCore(model_path=model_files[0], scaler_path=model_files[1], framework="numpy",
+                                 registry=registry, cache_size=16, cache_path=str(tmp_path / "cache.sqlite"))
+    core.validate_by_ai(3, 4, 5)
+    old_cache = core.cache
+    old_finalizer = old_cache.store._finalizer
+
+    for shift in (0.3, 0.6):
+        replace_scaler(model_files[1], shift=shift)
+        assert len(registry.check_for_updates()) == 1
+        core.validate_by_ai(3, 4, 5)
+
+    # 교체된 캐시의 SQLite 연결은 닫히고, 진행 중인 요청이 잡고 있던 캐시는 메모리로만 동작
+    assert not old_finalizer.alive
+    assert old_cache.get(old_cache.make_key(3, 4, 5)) is not None
+    old_cache.put(old_cache.make_key(1, 2, 3), 0.5)
+    assert core.cache.store._finalizer.alive
+    assert len(core.cache.store) == 1
+    # 교체된 지문의 행은 삭제되어 파일에는 현재 지문의 행만 남음
+    assert core.cache.store.evict_other_fingerprints() == 0
+
+
+def test_failed_reload_keeps_previous_version(model_files):
+    registry = ModelRegistry(settle_seconds=0)
+    core = TriangleValidatorCore(model_path=model_files[0], scaler_path=model_files[1],
+                                 framework="numpy", registry=registry)
+    before = core.validate_by_ai(3, 4, 5)
+
+    with open(model_files[0], "wb") as f:
+        f.write(b"not a model")
+    past = time.time() - 5
+    os.utime(model_files[0], (past, past))
+
+    assert registry.check_for_updates() == []
+    assert registry.check_for_updates() == [] # 같은 파일은 다시 로드를 시도하지 않음
+    assert core.model_generation == 1
+    assert core.validate_by_ai(3, 4, 5) == pytest.approx(before)
@@ -0,0 +1,61 @@
+"""
+NumPy 어댑터 테스트
+
+TensorFlow 없이 h5 가중치로 계산한 결과가 TensorFlow 어댑터와 일치하는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.triangle_validator_core import DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH
+from models.adapters import get_adapter
+
+pytest.importorskip("h5py")
+joblib = pytest.importorskip("joblib")
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    return get_adapter("numpy")
+
+
+@pytest.fixture(scope="module")
+def model(adapter):
+    return adapter.load_model(DEFAULT_MODEL_PATH)
+
+
+@pytest.fixture(scope="module")
+def scaler():
+    return joblib.load(DEFAULT_SCALER_PATH)
+
+
+def test_load_model_reads_dense_layers(adapter, model):
+    assert adapter.get_framework_name() == "NumPy"
+    assert model.layers[0][0].shape[0] == 3
+    assert model.layers[-1][2] == "sigmoid"
+
+
+def test_predict_matches_batch(adapter, model, scaler):
+    single = adapter.predict(model, [3.0, 4.0, 5.0], scaler=scaler)
+    batch = adapter.predict_batch(model, np.array([[3.0, 4.0, 5.0], [1.0, 2.0, 10.0]]), scaler=scaler)
+    assert single == pytest.approx(batch[0])
+    assert batch[0] > 0.5 > batch[1]
+
+
+def test_scaler_is_folded_once(model, scaler):
+    assert model.folded_layers(scaler) is model.folded_layers(scaler)
+
+
+def test_deviation_from_tensorflow(adapter, model, scaler):
+    pytest.importorskip("tensorflow")
+    rng = np.random.default_rng(1)
+    report = adapter.measure_deviation(model, scaler, reference_inputs=rng.uniform(1, 99, size=(2000, 3)))
+    assert report["samples"] == 2000
+    assert report["max_abs_deviation"] < 1e-4
+    assert report["decision_mismatches"] == 0
@@ -0,0 +1,43 @@
+"""
+다중 프로세스 샤드 평가 테스트
+
+워커 프로세스에서 공유 메모리로 계산한 결과가 입력 순서대로,
+단일 프로세스 validate_batch와 같은 값으로 모이는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.parallel import ShardedEvaluator
+from core.triangle_validator_core import TriangleValidatorCore
+
+pytest.importorskip("h5py")
+
+
+def test_sharded_results_match_single_process():
+    sides = np.random.default_rng(0).uniform(-5, 99, size=(5003, 3))
+    expected = TriangleValidatorCore(framework="numpy").validate_batch(sides)
+
+    with ShardedEvaluator(workers=2, framework="numpy", shard_size=1000) as evaluator:
+        results = evaluator.evaluate(sides)
+        # 버퍼 재사용(더 작은 입력)과 확장(더 큰 입력) 경로
+        small = evaluator.evaluate(sides[:10])
+        large = evaluator.evaluate(np.concatenate([sides, sides]))
+
+    np.testing.assert_array_equal(results["math_result"], expected["math_result"])
+    np.testing.assert_allclose(results["ai_prediction_value"], expected["ai_prediction_value"])
+    np.testing.assert_array_equal(results["is_consistent"], expected["is_consistent"])
+    np.testing.assert_array_equal(small["math_result"], expected["math_result"][:10])
+    assert large["math_result"].shape == (2 * len(sides),)
+
+
+def test_empty_input():
+    with ShardedEvaluator(workers=1, framework="numpy") as evaluator:
+        results = evaluator.evaluate(np.empty((0, 3)))
+    assert results["math_result"].shape == (0,)
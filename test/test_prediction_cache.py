@@ -0,0 +1,135 @@
+"""
+AI 예측 캐시 테스트
+
+순열 무관 키(모델 입력을 정렬할 때만), LRU 내보내기, SQLite 영구 캐시 무효화를 확인합니다.
+"""
+
+import gc
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.prediction_cache import PredictionCache, file_fingerprint
+from core.triangle_validator_core import TriangleValidatorCore
+
+
+def test_key_ignores_order_and_tiny_differences():
+    cache = PredictionCache(max_size=4)
+    assert cache.make_key(3, 4, 5) == cache.make_key(5, 3, 4)
+    assert cache.make_key(3, 4, 5) == cache.make_key(3 + 1e-9, 4, 5)
+    assert cache.make_key(3, 4, 5) != cache.make_key(3, 4, 6)
+
+    ordered = PredictionCache(max_size=4, sort_key=False)
+    assert ordered.make_key(3, 4, 5) != ordered.make_key(5, 4, 3)
+    assert ordered.make_key(3, 4, 5) == ordered.make_key(3 + 1e-9, 4, 5)
+
+
+def test_lru_eviction_and_counters():
+    cache = PredictionCache(max_size=2)
+    cache.put(("a",), 0.1)
+    cache.put(("b",), 0.2)
+    assert cache.get(("a",)) == 0.1 # a가 최근 사용됨
+    cache.put(("c",), 0.3) # b가 내보내짐
+    assert cache.get(("b",)) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+
+def test_persistent_store_survives_restart_and_invalidates(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite")
+    first = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    first.put(first.make_key(3, 4, 5), 0.99)
+    first.close()
+
+    restarted = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    assert restarted.get(restarted.make_key(4, 5, 3)) == 0.99
+    assert restarted.stats()["persistent_hits"] == 1
+    restarted.close()
+
+    retrained = PredictionCache(max_size=8, fingerprint="v2", persistent_path=db_path)
+    assert retrained.get(retrained.make_key(3, 4, 5)) is None
+    assert len(retrained.store) == 0
+
+    # 같은 파일을 함께 쓰는 다른 모델(v1)의 행은 열 때 지우지 않음
+    shared = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    assert shared.get(shared.make_key(3, 4, 5)) == 0.99
+    shared.close()
+
+    # 모든 사용자가 v2로 전환된 뒤의 정리 단계
+    assert retrained.store.evict_other_fingerprints() == 1
+    retrained.close()
+    reopened = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    assert reopened.get(reopened.make_key(3, 4, 5)) is None
+    reopened.close()
+
+
+def test_unreferenced_store_closes_connection(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite")
+    cache = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    cache.put(cache.make_key(3, 4, 5), 0.99) # 커밋 전 쓰기
+    finalizer = cache.store._finalizer
+    del cache
+    gc.collect()
+    assert not finalizer.alive
+
+    reopened = PredictionCache(max_size=8, fingerprint="v1", persistent_path=db_path)
+    assert reopened.get(reopened.make_key(3, 4, 5)) == 0.99
+    reopened.close()
+
+
+def test_file_fingerprint_changes_with_content(tmp_path):
+    path = tmp_path / "weights.bin"
+    path.write_bytes(b"one")
+    before = file_fingerprint(str(path))
+    path.write_bytes(b"two")
+    assert file_fingerprint(str(path)) != before
+
+
+@pytest.mark.parametrize("sort_model_input", [False, True])
+def test_core_cache_matches_uncached_for_permutations(sort_model_input):
+    pytest.importorskip("h5py")
+    uncached = TriangleValidatorCore(framework="numpy", sort_model_input=sort_model_input)
+    core = TriangleValidatorCore(framework="numpy", cache_size=16, sort_model_input=sort_model_input)
+    if core.cache is None:
+        pytest.skip("AI 모델 또는 스케일러를 로드할 수 없습니다.")
+
+    # 먼저 계산된 순서와 관계없이 캐시 결과는 캐시 없는 경로와 같아야 함
+    for sides in [(5, 4, 3), (3, 4, 5), (4, 3, 5), (5, 4, 3)]:
+        assert core.validate_by_ai(*sides) == uncached.validate_by_ai(*sides)
+    stats = core.cache_stats()
+    if sort_model_input:
+        assert (stats["hits"], stats["misses"]) == (3, 1)
+    else:
+        assert (stats["hits"], stats["misses"]) == (1, 3)
+
+
+def test_core_without_cache_reports_none():
+    core = TriangleValidatorCore(framework="numpy")
+    assert core.cache_stats() is None
+
+
+def test_cores_with_different_models_share_cache_file(tmp_path):
+    pytest.importorskip("h5py")
+    from core.triangle_validator_core import TriangleValidatorCore
+
+    db_path = str(tmp_path / "cache.sqlite")
+    unsorted = TriangleValidatorCore(framework="numpy", cache_size=8, cache_path=db_path)
+    unsorted.validate_by_ai(3, 4, 5)
+    unsorted.cache.close() # 쓰기 커밋
+    # 다른 지문(정렬 입력)의 코어가 같은 파일을 열어도 기존 행은 남음
+    sorted_core = TriangleValidatorCore(framework="numpy", cache_size=8, cache_path=db_path, sort_model_input=True)
+    sorted_core.validate_by_ai(3, 4, 5)
+    sorted_core.cache.close()
+
+    restarted = TriangleValidatorCore(framework="numpy", cache_size=8, cache_path=db_path)
+    restarted.validate_by_ai(3, 4, 5)
+    assert restarted.cache_stats()["persistent_hits"] == 1
+    restarted.cache.close()
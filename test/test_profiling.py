@@ -0,0 +1,80 @@
+"""
+시작 단계 타임라인 테스트
+
+프로파일링이 꺼져 있으면 아무것도 기록하지 않고, 켜져 있으면 Chrome trace 형식으로
+단계가 저장되는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core import profiling
+from core.triangle_validator_core import TriangleValidatorCore
+
+
+@pytest.fixture
+def timeline(tmp_path):
+    timeline = profiling.enable_profiling(str(tmp_path / "trace.json"))
+    yield timeline
+    profiling.disable_profiling()
+
+
+def test_phase_is_noop_when_disabled():
+    assert profiling.active_timeline() is None
+    with profiling.phase("ignored"):
+        pass
+    profiling.mark("ignored")
+
+
+def test_phases_are_saved_as_chrome_trace(timeline):
+    started = time.perf_counter()
+    timeline.add_complete("python_imports", started - 0.01, started)
+    with profiling.phase("outer"):
+        with profiling.phase("inner", framework="numpy"):
+            pass
+    profiling.mark("first_frame")
+
+    with open(timeline.save()) as f:
+        trace = json.load(f)
+    events = {event["name"]: event for event in trace["traceEvents"]}
+    assert events["python_imports"]["dur"] == pytest.approx(10000, rel=1e-3)
+    assert events["inner"]["args"] == {"framework": "numpy"}
+    # 안쪽 단계는 바깥 단계 구간 안에 포함
+    assert events["outer"]["ts"] <= events["inner"]["ts"]
+    assert events["inner"]["ts"] + events["inner"]["dur"] <= events["outer"]["ts"] + events["outer"]["dur"]
+    assert events["first_frame"]["ph"] == "i"
+    assert events["thread_name"]["ph"] == "M"
+
+
+def test_model_load_phases_are_recorded(timeline):
+    pytest.importorskip("h5py")
+    pytest.importorskip("joblib")
+    from core.model_registry import ModelRegistry
+
+    core = TriangleValidatorCore(framework="numpy", registry=ModelRegistry(), load_on_init=False)
+    core.load_models()
+
+    durations = timeline.durations()
+    assert {"model_load", "framework_import", "load_model", "load_scaler", "joblib_load"} <= set(durations)
+    assert durations["model_load"] >= durations["load_model"]
+
+
+def test_tensorflow_load_phases_are_split(timeline):
+    pytest.importorskip("tensorflow")
+    from core.model_registry import ModelRegistry
+
+    core = TriangleValidatorCore(framework="tensorflow", registry=ModelRegistry(), load_on_init=False,
+                                 adapter_options={"latency_mode": True})
+    core.load_models()
+
+    # 임포트 회귀와 모델 로드 회귀를 구분할 수 있도록 단계가 나뉘어 기록됨
+    durations = timeline.durations()
+    assert {"framework_import", "load_model", "keras_load_model", "serving_fn_trace"} <= set(durations)
+    assert durations["load_model"] >= durations["keras_load_model"] + durations["serving_fn_trace"]
@@ -0,0 +1,70 @@
+"""
+검증 결과 타입 테스트
+
+BatchResult가 기존 dict 결과와 같은 키로 열을 돌려주고, 잘라내기/필터링/저장 후에도
+같은 값을 유지하는지 확인합니다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.results import BatchResult, ValidationResult
+
+SIDES = np.array([[3, 4, 5], [1, 2, 10], [5, 5, 5], [1, 1, 3]], dtype=np.float64)
+MATH = np.array([True, False, True, False])
+AI = np.array([0.9, 0.7, 0.8, 0.1])
+
+
+def test_columns_and_rows_match_inputs():
+    result = BatchResult.from_columns(SIDES, MATH, AI)
+
+    assert len(result) == 4
+    np.testing.assert_array_equal(result["sides"], SIDES)
+    np.testing.assert_array_equal(result["is_valid_by_ai"], AI > 0.5)
+    np.testing.assert_array_equal(result["is_consistent"], [True, False, True, True])
+    assert result[1] == {"sides": [1.0, 2.0, 10.0], "math_result": False, "ai_prediction_value": 0.7,
+                         "is_valid_by_ai": True, "is_consistent": False}
+    with pytest.raises(KeyError):
+        result["unknown"]
+
+
+def test_slice_filter_and_inconsistent():
+    result = BatchResult.from_columns(SIDES, MATH, AI)
+
+    assert len(result[1:3]) == 2
+    assert result[1:3][0].sides == (1.0, 2.0, 10.0)
+    assert len(result.filter(MATH)) == 2
+    inconsistent = result.inconsistent()
+    assert len(inconsistent) == 1
+    assert inconsistent[0].sides == (1.0, 2.0, 10.0)
+
+
+def test_missing_ai_columns_are_none():
+    result = BatchResult.from_columns(SIDES, MATH)
+
+    assert result["ai_prediction_value"] is None
+    assert result["is_consistent"] is None
+    assert result[0] == ValidationResult((3.0, 4.0, 5.0), True)
+    assert len(result.inconsistent()) == 0
+    assert result.columns()["is_valid_by_ai"] is None
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    path = tmp_path / "results.npy"
+    result = BatchResult.from_columns(SIDES, MATH, AI)
+    result[::2].save(path)
+
+    loaded = BatchResult.load(path)
+    assert loaded.has_ai
+    np.testing.assert_array_equal(loaded["sides"], SIDES[::2])
+    np.testing.assert_array_equal(loaded["ai_prediction_value"], AI[::2])
+
+    np.save(tmp_path / "other.npy", SIDES)
+    with pytest.raises(ValueError):
+        BatchResult.load(tmp_path / "other.npy")
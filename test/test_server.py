@@ -0,0 +1,196 @@
+"""
+마이크로 배칭 추론 서버 테스트
+
+동시 요청이 배치로 묶여 처리되고, 메트릭이 Prometheus 형식으로 노출되는지 확인합니다.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.triangle_validator_core import TriangleValidatorCore
+from server import BatcherStoppedError, InferenceServer, MicroBatcher
+
+pytest.importorskip("h5py")
+
+
+@pytest.fixture(scope="module")
+def core():
+    return TriangleValidatorCore(framework="numpy")
+
+
+async def http_request(host, port, method, path, payload=None, content_length=None, raw_body=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    if raw_body is not None:
+        body = raw_body
+    if content_length is None:
+        content_length = len(body)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n"
+        f"Content-Length: {content_length}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    return status, content
+
+
+def test_concurrent_requests_are_batched(core):
+    async def scenario():
+        server = InferenceServer(core, max_batch_size=64, max_wait_ms=20)
+        host, port = await server.start(port=0)
+        try:
+            sides = [[3, 4, 5], [1, 2, 10]] * 20
+            responses = await asyncio.gather(*(
+                http_request(host, port, "POST", "/validate", {"sides": s}) for s in sides
+            ))
+            metrics_status, metrics = await http_request(host, port, "GET", "/metrics")
+        finally:
+            await server.stop()
+        return sides, responses, server, metrics_status, metrics.decode("utf-8")
+
+    sides, responses, server, metrics_status, metrics = asyncio.run(scenario())
+
+    for s, (status, content) in zip(sides, responses):
+        assert status == 200
+        result = json.loads(content)
+        assert result["sides"] == [float(v) for v in s]
+        assert result["math_result"] == (s == [3, 4, 5])
+
+    batches = server.batcher.batch_size.snapshot()
+    assert batches["sum"] == len(sides)
+    assert batches["count"] < len(sides) # 여러 요청이 하나의 배치로 묶임
+
+    assert metrics_status == 200
+    assert "triangle_batch_size_bucket" in metrics
+    assert "triangle_queue_wait_seconds_count" in metrics
+    assert "triangle_queue_depth " in metrics
+
+
+def test_batch_endpoint_and_errors(core):
+    async def scenario():
+        server = InferenceServer(core)
+        host, port = await server.start(port=0)
+        try:
+            return await asyncio.gather(
+                http_request(host, port, "POST", "/validate_batch", {"sides": [[3, 4, 5], [5, 5, 5]]}),
+                http_request(host, port, "POST", "/validate", {"sides": [3, 4]}),
+                http_request(host, port, "GET", "/validate"),
+                http_request(host, port, "GET", "/unknown"),
+                http_request(host, port, "GET", "/health"),
+            )
+        finally:
+            await server.stop()
+
+    batch, bad_sides, wrong_method, unknown, health = asyncio.run(scenario())
+    assert batch[0] == 200
+    assert [row["math_result"] for row in json.loads(batch[1])["results"]] == [True, True]
+    assert bad_sides[0] == 400
+    assert wrong_method[0] == 405
+    assert unknown[0] == 404
+    assert health == (200, b'{"status": "ok"}')
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-1", "1.5"])
+def test_invalid_content_length_is_rejected(core, content_length):
+    async def scenario():
+        server = InferenceServer(core)
+        host, port = await server.start(port=0)
+        try:
+            return await http_request(host, port, "POST", "/validate", {"sides": [3, 4, 5]},
+                                      content_length=content_length)
+        finally:
+            await server.stop()
+
+    status, content = asyncio.run(scenario())
+    assert status == 400
+    assert "Content-Length" in json.loads(content)["error"]
+
+
+class BlockingCore:
+    """첫 배치에서 release가 설정될 때까지 멈추는 코어"""
+
+    def __init__(self):
+        import threading
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def validate_batch(self, sides, sample_rows=False):
+        self.started.set()
+        self.release.wait(10)
+        return TriangleValidatorCore(framework="numpy", load_on_init=False).validate_batch(sides)
+
+
+def test_stop_fails_pending_requests():
+    blocking = BlockingCore()
+
+    async def scenario():
+        batcher = MicroBatcher(blocking, max_batch_size=1, max_wait_ms=0)
+        await batcher.start()
+        running = asyncio.ensure_future(batcher.submit(3, 4, 5))
+        await asyncio.get_running_loop().run_in_executor(None, blocking.started.wait, 10)
+        queued = [asyncio.ensure_future(batcher.submit(1, 1, 1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        blocking.release.set()
+        await batcher.stop()
+        outcomes = await asyncio.gather(running, *queued, return_exceptions=True)
+        with pytest.raises(BatcherStoppedError):
+            await batcher.submit(3, 4, 5)
+        return outcomes
+
+    outcomes = asyncio.run(asyncio.wait_for(scenario(), 30))
+    # 실행 중이던 배치와 대기 중이던 요청 모두 멈추지 않고 끝남
+    assert all(isinstance(outcome, BatcherStoppedError) for outcome in outcomes[1:])
+    assert len(outcomes) == 4
+
+
+def test_sampled_policy_samples_each_batched_request():
+    sampled_core = TriangleValidatorCore(framework="numpy", ai_policy="sampled", ai_sample_rate=0.5, ai_sample_seed=3)
+
+    async def scenario():
+        server = InferenceServer(sampled_core, max_batch_size=64, max_wait_ms=50)
+        host, port = await server.start(port=0)
+        try:
+            return await asyncio.gather(*(
+                http_request(host, port, "POST", "/validate", {"sides": [3, 4, 5]}) for _ in range(40)
+            ))
+        finally:
+            await server.stop()
+
+    responses = asyncio.run(scenario())
+    assert all(status == 200 for status, _ in responses)
+    # 요청이 하나의 배치로 묶여도 표본 여부는 요청마다 정해짐
+    values = [json.loads(content)["ai_prediction_value"] for _, content in responses]
+    assert any(value is None for value in values) and any(value is not None for value in values)
+
+
+def test_non_finite_sides_are_rejected(core):
+    async def send(host, port, path, body):
+        return await http_request(host, port, "POST", path, raw_body=body)
+
+    async def scenario():
+        server = InferenceServer(core)
+        host, port = await server.start(port=0)
+        try:
+            # json.dumps 기본값은 NaN/Infinity를 그대로 쓰므로 문자열로 직접 보냄
+            return await asyncio.gather(
+                send(host, port, "/validate", b'{"sides": [NaN, 4, 5]}'),
+                send(host, port, "/validate", b'{"sides": [3, 4, Infinity]}'),
+                send(host, port, "/validate_batch", b'{"sides": [[3, 4, 5], [NaN, 1, 1]]}'),
+                send(host, port, "/validate_batch", b'{"sides": [[3, 4]]}'),
+            )
+        finally:
+            await server.stop()
+
+    for status, content in asyncio.run(scenario()):
+        assert status == 400
+        json.loads(content) # 오류 응답도 올바른 JSON
@@ -0,0 +1,51 @@
+"""
+TensorFlow 어댑터 지연 시간 최적화 모드 테스트
+
+latency_mode의 tf.function 경로가 기본 경로(Keras 모델 직접 호출)와 같은 값을 돌려주는지 확인합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.triangle_validator_core import DEFAULT_MODEL_PATH, DEFAULT_SCALER_PATH
+from models.adapters import get_adapter
+
+pytest.importorskip("tensorflow")
+joblib = pytest.importorskip("joblib")
+
+
+def test_latency_mode_matches_predict():
+    scaler = joblib.load(DEFAULT_SCALER_PATH)
+    default_adapter = get_adapter("tensorflow")
+    fast_adapter = get_adapter("tensorflow", latency_mode=True)
+    default_model = default_adapter.load_model(DEFAULT_MODEL_PATH)
+    fast_model = fast_adapter.load_model(DEFAULT_MODEL_PATH)
+
+    assert fast_adapter.latency_stats()["count"] == 0
+    for sides in ([3, 4, 5], [1, 2, 10], [5, 5, 9]):
+        expected = default_adapter.predict(default_model, sides, scaler=scaler)
+        actual = fast_adapter.predict(fast_model, sides, scaler=scaler)
+        assert actual == pytest.approx(expected, abs=1e-6)
+
+    stats = fast_adapter.latency_stats()
+    assert stats["count"] == 3
+    assert stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_clone_and_batch_match_single_predictions():
+    import numpy as np
+
+    scaler = joblib.load(DEFAULT_SCALER_PATH)
+    adapter = get_adapter("tensorflow", latency_mode=True)
+    model = adapter.load_model(DEFAULT_MODEL_PATH)
+    clone = adapter.clone_model(model)
+    sides = np.array([[3, 4, 5], [1, 2, 10], [5, 5, 9]], dtype=np.float64)
+
+    assert clone is not model
+    expected = [adapter.predict(model, row, scaler=scaler) for row in sides]
+    assert adapter.predict_batch(clone, sides, scaler=scaler) == pytest.approx(expected, abs=1e-6)
@@ -0,0 +1,55 @@
+"""
+삼각형 꼭짓점 계산 테스트
+
+계산된 꼭짓점 사이의 거리 비율이 입력한 세 변의 비율과 같고, 영역 안에 들어오는지 확인합니다.
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from viewmodels.triangle_geometry import triangle_vertices
+
+
+@pytest.mark.parametrize("sides", [(3, 4, 5), (5, 5, 5), (2, 9, 10), (90, 1.5, 90), (3e-300, 4e-300, 5e-300),
+                                   (3e300, 4e300, 5e300)])
+def test_vertices_preserve_side_ratios_and_fit(sides):
+    a, b, c = sides
+    points = triangle_vertices(a, b, c, 300, 200, padding=10)
+    left, right, apex = points
+
+    scale = math.dist(left, right) / c
+    assert math.dist(right, apex) == pytest.approx(a * scale)
+    assert math.dist(left, apex) == pytest.approx(b * scale)
+    assert apex[1] <= left[1] == right[1] # 위쪽 꼭짓점은 밑변 위 (화면 y축은 아래 방향)
+    for x, y in points:
+        assert 10 - 1e-9 <= x <= 290 + 1e-9
+        assert 10 - 1e-9 <= y <= 190 + 1e-9
+
+
+def test_impossible_triangle_is_flattened():
+    points = triangle_vertices(1, 2, 10, 300, 200)
+    assert len(points) == 3
+    assert len({round(y, 9) for _, y in points}) == 1
+
+
+def test_nothing_to_draw():
+    assert triangle_vertices(0, 0, 0, 300, 200) == []
+    assert triangle_vertices(3, 4, 5, 10, 10, padding=10) == []
+
+
+@pytest.mark.parametrize("sides", [(1e-300, 1e-300, 1), (1e-320, 1, 1e-320), (1, 1, 1e-320)])
+def test_extreme_ratios_stay_finite(sides):
+    points = triangle_vertices(*sides, 300, 200)
+    assert len(points) == 3
+    assert all(math.isfinite(value) for point in points for value in point)
+
+
+@pytest.mark.parametrize("sides", [(math.inf, 4, 5), (3, math.nan, 5), (math.inf, math.inf, math.inf)])
+def test_non_finite_sides_draw_nothing(sides):
+    assert triangle_vertices(*sides, 300, 200) == []
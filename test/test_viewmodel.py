@@ -0,0 +1,180 @@
+"""
+TriangleViewModel 비동기 예측 테스트
+
+검증이 워커 스레드에서 실행되고, 새 요청이 이전 요청의 결과를 대체하는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+QtCore = pytest.importorskip("PySide6.QtCore")
+
+from viewmodels.triangle_viewmodel import TriangleViewModel
+
+
+class SlowValidator:
+    """호출 스레드를 기록하고 일정 시간 지연 후 결과를 돌려주는 테스트용 validator"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+
+    def validate(self, a, b, c):
+        self.calls.append(((a, b, c), threading.get_ident()))
+        time.sleep(self.delay)
+        math_result = (a + b > c) and (a + c > b) and (b + c > a)
+        return {
+            "sides": [a, b, c],
+            "math_result": math_result,
+            "ai_prediction_value": 0.9 if math_result else 0.1,
+            "is_valid_by_ai": math_result,
+            "is_consistent": True,
+        }
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QtCore.QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_predict_runs_off_gui_thread(app):
+    validator = SlowValidator()
+    viewmodel = TriangleViewModel(validator)
+
+    viewmodel.predict("3", "4", "5")
+    assert viewmodel.isBusy
+    assert wait_until(lambda: not viewmodel.isBusy)
+
+    assert validator.calls[0][1] != threading.get_ident()
+    assert viewmodel.sides == [3.0, 4.0, 5.0]
+    assert viewmodel.prediction == pytest.approx(0.9)
+    assert viewmodel.is_possible
+
+
+def test_latest_request_wins(app):
+    validator = SlowValidator(delay=0.1)
+    viewmodel = TriangleViewModel(validator)
+
+    viewmodel.predict("3", "4", "5")
+    viewmodel.predict("1", "2", "10")
+    viewmodel.predict("5", "5", "5")
+    assert wait_until(lambda: not viewmodel.isBusy)
+    # 완료된 후 늦게 도착하는 결과가 없는지 잠시 더 이벤트를 처리
+    wait_until(lambda: False, timeout=0.3)
+
+    assert viewmodel.sides == [5.0, 5.0, 5.0]
+    # 시작 전에 대체된 요청은 validator를 호출하지 않음
+    assert len(validator.calls) < 3
+
+
+def test_invalid_input_is_handled_synchronously(app):
+    validator = SlowValidator()
+    viewmodel = TriangleViewModel(validator)
+
+    viewmodel.predict("abc", "4", "5")
+    assert not viewmodel.isBusy
+    assert viewmodel.result == "올바른 숫자를 입력하세요."
+    assert validator.calls == []
+
+
+def test_live_predict_is_debounced(app):
+    validator = SlowValidator(delay=0.0)
+    viewmodel = TriangleViewModel(validator)
+
+    for text in ("3", "30", "3"):
+        viewmodel.predictLive(text, "4", "5")
+    assert wait_until(lambda: len(validator.calls) == 1 and not viewmodel.isBusy)
+    wait_until(lambda: False, timeout=0.3)
+
+    assert len(validator.calls) == 1
+    assert validator.calls[0][0] == (3.0, 4.0, 5.0)
+
+
+class LazyValidator(SlowValidator):
+    """load_models가 호출될 때까지 AI 검증을 사용할 수 없는 테스트용 validator"""
+
+    def __init__(self, load_delay=0.1):
+        super().__init__(delay=0.0)
+        self.load_delay = load_delay
+        self.is_ready = False
+        self.load_thread = None
+
+    def load_models(self):
+        self.load_thread = threading.get_ident()
+        time.sleep(self.load_delay)
+        self.is_ready = True
+        return True
+
+    def validate_by_math(self, a, b, c):
+        return (a + b > c) and (a + c > b) and (b + c > a)
+
+
+def test_math_result_shown_while_model_loads(app):
+    validator = LazyValidator()
+    viewmodel = TriangleViewModel(validator)
+    assert not viewmodel.modelReady
+
+    viewmodel.loadModelInBackground()
+    assert viewmodel.isModelLoading
+    viewmodel.predict("1", "2", "10")
+    # 모델 없이 수학 결과가 즉시 반영됨
+    assert not viewmodel.isBusy
+    assert not viewmodel.is_possible
+    assert "로딩 중" in viewmodel.result
+    assert validator.calls == []
+
+    # 로드가 끝나면 마지막 입력을 AI로 다시 예측
+    assert wait_until(lambda: viewmodel.modelReady and len(validator.calls) == 1 and not viewmodel.isBusy)
+    assert validator.load_thread != threading.get_ident()
+    assert not viewmodel.isModelLoading
+    assert viewmodel.prediction == pytest.approx(0.1)
+
+
+def test_result_triggers_one_notification_per_signal(app):
+    validator = SlowValidator(delay=0.0)
+    viewmodel = TriangleViewModel(validator)
+    wait_until(lambda: False, timeout=0.05) # initialize_canvas 처리
+    canvas_updates = []
+    viewmodel.canvasDataChanged.connect(lambda: canvas_updates.append((viewmodel.sides, viewmodel.scale)))
+
+    viewmodel.predict("6", "8", "12")
+    assert wait_until(lambda: not viewmodel.isBusy)
+
+    # sides, scale이 모두 바뀌어도 다시 그리기는 한 번, 그때 이미 모든 값이 반영됨
+    assert canvas_updates == [([6.0, 8.0, 12.0], pytest.approx(100 / 12))]
+    assert viewmodel.last_update_signal_counts == {
+        "canvasDataChanged": 1, "predictionChanged": 1, "resultChanged": 1, "busyChanged": 1
+    }
+
+    viewmodel.predict("0", "4", "5") # 오류 분기도 시그널마다 한 번
+    assert viewmodel.last_update_signal_counts["canvasDataChanged"] == 1
+    assert viewmodel.last_update_signal_counts["predictionChanged"] == 1
+
+
+def test_triangle_points_follow_sides_and_viewport(app):
+    viewmodel = TriangleViewModel(SlowValidator(delay=0.0))
+    assert viewmodel.trianglePoints == [] # 영역 크기를 받기 전에는 그리지 않음
+
+    viewmodel.setViewport(300.0, 200.0)
+    assert len(viewmodel.trianglePoints) == 3
+    viewmodel.predict("6", "8", "12")
+    assert wait_until(lambda: not viewmodel.isBusy)
+    left, right, apex = viewmodel.trianglePoints
+    assert right.x() - left.x() == pytest.approx(280) # 가장 긴 밑변이 여백을 뺀 너비를 채움
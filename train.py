@@ -0,0 +1,82 @@
+"""
+헤드리스 모델 학습 CLI
+
+합성 데이터로 모델을 학습해 TriangleValidatorCore가 읽는 model.h5 + scaler.pkl을 저장합니다.
+노트북 없이 스케줄러(cron 등)에서 정기적으로 재학습할 때 사용합니다.
+
+사용 예:
+    python train.py -o notebooks
+    python train.py -o /tmp/retrain --samples 200000000 --epochs 3 --batch-size 4096 --report report.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from core import training
+from core.metrics import peak_rss_mb
+
+logger = logging.getLogger(__name__) # train 모듈용 로거
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="삼각형 검증 모델 학습 (헤드리스)")
+    parser.add_argument("-o", "--output-dir", default="notebooks", help="model.h5 / scaler.pkl 저장 디렉터리")
+    parser.add_argument("--samples", type=int, default=training.DEFAULT_SAMPLES, help="에포크당 학습 샘플 수")
+    parser.add_argument("--validation-samples", type=int, default=training.DEFAULT_VALIDATION_SAMPLES,
+                        help="검증 샘플 수 (0이면 검증하지 않음)")
+    parser.add_argument("--epochs", type=int, default=training.DEFAULT_EPOCHS, help="에포크 수")
+    parser.add_argument("--batch-size", type=int, default=training.DEFAULT_BATCH_SIZE, help="학습 배치 크기")
+    parser.add_argument("--chunk-size", type=int, default=training.DEFAULT_CHUNK_SIZE, help="데이터 생성 청크 크기")
+    parser.add_argument("--seed", type=int, default=training.DEFAULT_SEED, help="난수 시드")
+    parser.add_argument("--low", type=float, default=training.DEFAULT_LOW, help="변 길이 최솟값")
+    parser.add_argument("--high", type=float, default=training.DEFAULT_HIGH, help="변 길이 최댓값")
+    parser.add_argument("--edge-fraction", type=float, default=training.DEFAULT_EDGE_FRACTION,
+                        help="삼각 부등식 경계 근처 샘플 비율")
+    parser.add_argument("--learning-rate", type=float, default=0.001, help="Adam 학습률")
+    parser.add_argument("--sort-inputs", action="store_true",
+                        help="정렬된 세 변으로 학습 (sort_model_input=True로 사용할 모델)")
+    parser.add_argument("--deterministic", action="store_true", help="TensorFlow 연산을 결정적으로 실행")
+    parser.add_argument("--report", help="학습 결과(에포크별 시간, 처리량, 정확도)를 저장할 JSON 경로")
+    parser.add_argument("--log-level", default="INFO", help="로그 레벨")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    try:
+        report = training.train(
+            args.output_dir, samples=args.samples, validation_samples=args.validation_samples, epochs=args.epochs,
+            batch_size=args.batch_size, chunk_size=args.chunk_size, seed=args.seed, low=args.low, high=args.high,
+            edge_fraction=args.edge_fraction, sort_inputs=args.sort_inputs, learning_rate=args.learning_rate,
+            deterministic=args.deterministic,
+        )
+    except Exception as e:
+        logger.exception(f"학습 실패: {e}")
+        return 1
+
+    report["peak_rss_mb"] = peak_rss_mb()
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    for entry in report["epochs"]:
+        print(f"epoch={entry['epoch']} time={entry['seconds']:.2f}s samples/sec={entry['samples_per_second']:.0f} "
+              f"loss={entry.get('loss', float('nan')):.4f} val_accuracy={entry.get('val_accuracy', float('nan')):.4f}",
+              file=sys.stderr)
+    peak = f"{report['peak_rss_mb']:.1f} MB" if report["peak_rss_mb"] is not None else "N/A"
+    print(f"saved {report['model_path']} {report['scaler_path']} "
+          f"samples/sec={report['samples_per_second']:.0f} total={report['total_seconds']:.1f}s peak_rss={peak}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+from PySide6.QtCore import QObject, Signal, Slot, Property, QRunnable, QThreadPool
+from PySide6.QtGui import QImage
+from PySide6.QtQuick import QQuickImageProvider
+import logging
+import threading
+
+from core.decision_map import DecisionMapCache
+from core.results import BatchResult
+
+logger = logging.getLogger(__name__) # 모듈용 로거
+
+# QML Image에서 사용할 이미지 프로바이더 이름 (image://decisionmap/...)
+IMAGE_PROVIDER_ID = "decisionmap"
+
+# 한 작업에서 계산할 최대 청크 수. 이후 작업을 다시 큐에 넣어 대기 중인 검증 요청이 먼저 실행되게 함
+CHUNKS_PER_TASK = 4
+# 검증 요청(우선순위 0)보다 늦게 실행되도록 지도 작업은 낮은 우선순위로 큐에 넣음
+TASK_PRIORITY = -1
+
+def rgba_to_qimage(rgba):
+    """(h, w, 4) uint8 배열을 QImage로 변환합니다 (배열 메모리와 분리된 사본)."""
+    height, width = rgba.shape[:2]
+    return QImage(rgba.tobytes(), width, height, width * 4, QImage.Format_RGBA8888).copy()
+
+class DecisionMapImageProvider(QQuickImageProvider):
+    """DecisionMapViewModel이 마지막으로 그린 지도를 QML Image에 제공"""
+
+    def __init__(self):
+        super().__init__(QQuickImageProvider.Image)
+        self._image = QImage()
+        self._lock = threading.Lock() # QML 이미지 로드 스레드에서도 호출될 수 있음
+
+    def set_image(self, image):
+        with self._lock:
+            self._image = image
+
+    def requestImage(self, image_id, size, requested_size):
+        with self._lock:
+            image = self._image
+        if image.isNull():
+            image = QImage(1, 1, QImage.Format_RGBA8888)
+            image.fill(0)
+        return image
+
+def map_validate_batch(validator):
+    """
+    ai_policy와 관계없이 모든 점에 수학 판정과 AI 예측을 계산하는 배치 함수를 만듭니다.
+
+    validate_batch는 ai_policy를 따르므로 "never", "sampled", "shadow"에서는 지도에 AI 값이 비거나
+    shadow 큐에 지도 점이 쌓입니다. 지도는 모든 픽셀에 AI 값이 필요하므로 정책을 거치지 않습니다.
+    """
+    def validate_batch(sides):
+        return BatchResult.from_columns(sides, validator.validate_batch_by_math(sides),
+                                        validator.validate_batch_by_ai(sides))
+    return validate_batch
+
+class _DecisionMapSignals(QObject):
+    """워커 스레드의 중간 결과를 GUI 스레드로 전달하는 시그널 묶음"""
+    progress = Signal(int, QImage, float, float) # request_id, 이미지, 진행률(0~1), 불일치 비율
+    finished = Signal(int, bool) # request_id, 완료 여부 (취소되면 False)
+
+class _DecisionMapTask(QRunnable):
+    """
+    QThreadPool에서 DecisionMap.compute를 실행하는 작업
+
+    검증 작업과 같은 단일 스레드 풀을 쓰므로 CHUNKS_PER_TASK개 청크를 계산한 뒤
+    남은 계산을 새 작업으로 다시 큐에 넣고 스레드를 양보합니다.
+    """
+
+    def __init__(self, request_id, decision_map, validator, signals, is_stale, show_disagreement, thread_pool):
+        super().__init__()
+        self.request_id = request_id
+        self.decision_map = decision_map
+        self.validator = validator
+        self.signals = signals
+        self.is_stale = is_stale
+        self.show_disagreement = show_disagreement
+        self.thread_pool = thread_pool
+
+    def _continuation(self):
+        return _DecisionMapTask(self.request_id, self.decision_map, self.validator, self.signals,
+                                self.is_stale, self.show_disagreement, self.thread_pool)
+
+    def _emit_progress(self, fraction):
+        decision_map = self.decision_map
+        image = rgba_to_qimage(decision_map.render_rgba(self.show_disagreement))
+        self.signals.progress.emit(self.request_id, image, fraction, decision_map.disagreement_rate())
+
+    def run(self):
+        decision_map = self.decision_map
+        cancelled = lambda: self.is_stale(self.request_id)
+        if decision_map.complete:
+            # 캐시된 지도: 계산 없이 바로 그림
+            self._emit_progress(1.0)
+            self.signals.finished.emit(self.request_id, True)
+            return
+        pixels = decision_map.size * decision_map.size
+        chunks_left = [CHUNKS_PER_TASK]
+
+        def on_chunk(stride, done, total):
+            chunks_left[0] -= 1
+            # 청크마다 중간 결과를 그려 보냄 (성긴 단계는 전체 영역을 빠르게 채움)
+            if not cancelled():
+                self._emit_progress(float(decision_map.known.sum()) / pixels)
+
+        try:
+            completed = decision_map.compute(map_validate_batch(self.validator),
+                                             is_cancelled=lambda: cancelled() or chunks_left[0] <= 0,
+                                             on_chunk=on_chunk)
+        except Exception as e:
+            logger.error(f"결정 지도 계산 실패: {e}", exc_info=True)
+            completed = False
+        else:
+            if not completed and not cancelled():
+                # 청크 한도에 도달: 계산한 픽셀은 지도에 남아 있으므로 다음 작업이 이어서 계산
+                self.thread_pool.start(self._continuation(), TASK_PRIORITY)
+                return
+        if completed:
+            logger.info(f"결정 지도 계산 완료: c={decision_map.fixed_side}, 불일치 비율={decision_map.disagreement_rate():.4f}")
+        self.signals.finished.emit(self.request_id, completed)
+
+class DecisionMapViewModel(QObject):
+    """
+    결정 지도 화면용 ViewModel
+
+    c를 고정한 (a, b) 평면에서 AI 예측값을 열지도(heatmap)로, 수학 판정과 다른 픽셀을 노랑으로
+    표시합니다. 계산은 백그라운드 스레드에서 청크 단위로 진행되며, 중간 결과가 나올 때마다
+    imageSource가 바뀌어 QML Image가 다시 읽습니다. 같은 단면으로 돌아오면 캐시된 지도를 사용합니다.
+
+    validator는 동시 호출을 가정하지 않으므로 thread_pool에는 검증 요청과 같은 단일 스레드 풀
+    (TriangleViewModel.validation_thread_pool())을 넘깁니다. 없으면 전용 단일 스레드 풀을 만듭니다.
+    """
+    imageChanged = Signal()
+    progressChanged = Signal()
+    busyChanged = Signal()
+    fixedSideChanged = Signal()
+
+    def __init__(self, validator, image_provider=None, cache=None, thread_pool=None):
+        super().__init__()
+        self.validator = validator
+        self.image_provider = image_provider or DecisionMapImageProvider()
+        self.cache = cache or DecisionMapCache()
+        self._fixed_side = 50.0
+        self._show_disagreement = True
+        self._image_revision = 0
+        self._progress = 0.0
+        self._disagreement_rate = 0.0
+        self._is_busy = False
+        self._latest_request_id = 0
+        if thread_pool is None:
+            thread_pool = QThreadPool(self)
+            thread_pool.setMaxThreadCount(1)
+        self._thread_pool = thread_pool
+        self._signals = _DecisionMapSignals()
+        self._signals.progress.connect(self._on_progress)
+        self._signals.finished.connect(self._on_finished)
+
+    def get_image_source(self):
+        # 주소가 바뀌어야 QML Image가 프로바이더에서 이미지를 다시 요청함
+        return f"image://{IMAGE_PROVIDER_ID}/{self._image_revision}"
+
+    def get_progress(self):
+        return self._progress
+
+    def get_disagreement_rate(self):
+        return self._disagreement_rate
+
+    def get_is_busy(self):
+        return self._is_busy
+
+    def get_fixed_side(self):
+        return self._fixed_side
+
+    def _set_busy(self, is_busy):
+        if self._is_busy != is_busy:
+            self._is_busy = is_busy
+            self.busyChanged.emit()
+
+    imageSource = Property(str, get_image_source, notify=imageChanged)
+    progress = Property(float, get_progress, notify=progressChanged)
+    disagreementRate = Property(float, get_disagreement_rate, notify=progressChanged)
+    isBusy = Property(bool, get_is_busy, notify=busyChanged)
+    fixedSide = Property(float, get_fixed_side, notify=fixedSideChanged)
+
+    @Slot(float)
+    def show(self, fixed_side):
+        """
+        c = fixed_side 단면 지도를 계산(또는 캐시에서 표시)합니다.
+
+        진행 중인 이전 계산은 다음 청크 전에 중단되며, 일부만 계산된 지도는 캐시에 남아
+        같은 단면을 다시 요청하면 이어서 계산합니다.
+        """
+        if self._fixed_side != fixed_side:
+            self._fixed_side = float(fixed_side)
+            self.fixedSideChanged.emit()
+        # 공유 풀을 clear()하면 검증 작업도 지워지므로, 이전 작업은 실행될 때 오래된 요청으로 바로 종료됨
+        self._latest_request_id += 1
+        if not getattr(self.validator, "is_ready", True):
+            logger.info("AI 모델이 아직 준비되지 않아 결정 지도를 계산하지 않습니다.")
+            self._set_busy(False)
+            return
+        generation = getattr(self.validator, "model_generation", 0)
+        decision_map = self.cache.get(generation, self._fixed_side)
+        self._set_busy(True)
+        task = _DecisionMapTask(self._latest_request_id, decision_map, self.validator, self._signals,
+                                self._is_stale_request, self._show_disagreement, self._thread_pool)
+        self._thread_pool.start(task, TASK_PRIORITY)
+
+    @Slot()
+    def cancel(self):
+        """진행 중인 계산을 중단합니다."""
+        self._latest_request_id += 1
+        self._set_busy(False)
+
+    def _is_stale_request(self, request_id):
+        # 워커 스레드에서 호출됨: int 비교만 수행
+        return request_id != self._latest_request_id
+
+    @Slot(int, QImage, float, float)
+    def _on_progress(self, request_id, image, progress, disagreement_rate):
+        if self._is_stale_request(request_id):
+            return
+        self.image_provider.set_image(image)
+        self._image_revision += 1
+        self._progress = progress
+        self._disagreement_rate = disagreement_rate
+        self.progressChanged.emit()
+        self.imageChanged.emit()
+
+    @Slot(int, bool)
+    def _on_finished(self, request_id, completed):
+        if self._is_stale_request(request_id):
+            return
+        self._set_busy(False)
+
+    def wait_for_idle(self, timeout_ms=-1):
+        """백그라운드 계산이 끝날 때까지 기다립니다 (테스트/종료 처리용)."""
+        return self._thread_pool.waitForDone(timeout_ms)
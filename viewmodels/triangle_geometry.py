@@ -0,0 +1,66 @@
+"""
+삼각형 꼭짓점 계산
+
+세 변의 길이로 꼭짓점 좌표를 구하고(코사인 법칙) 화면 영역에 맞게 확대/이동합니다.
+QML은 계산된 좌표를 그대로 Shape/ShapePath로 그리기만 합니다.
+"""
+
+import math
+
+
+def triangle_vertices(a, b, c, width, height, padding=10.0):
+    """
+    세 변 a, b, c로 만든 삼각형을 width×height 영역 가운데에 맞춘 꼭짓점 좌표를 반환합니다.
+
+    변 c를 밑변으로 두고, 변 a는 오른쪽 꼭짓점, 변 b는 왼쪽 꼭짓점에서 위쪽 꼭짓점으로 이어집니다.
+    삼각형이 될 수 없는 길이(삼각 부등식 위반)는 코사인 값을 [-1, 1]로 제한하므로
+    밑변 위에 납작하게 겹친 모양이 됩니다.
+
+    Args:
+        a, b, c (float): 세 변의 길이
+        width, height (float): 그릴 영역 크기 (픽셀)
+        padding (float): 영역 가장자리 여백 (픽셀)
+
+    Returns:
+        list: [(x, y), (x, y), (x, y)] 왼쪽 아래, 오른쪽 아래, 위 순서의 화면 좌표 (y는 아래로 증가).
+            변 길이가 0 이하이거나 유한하지 않거나 영역이 너무 작으면 빈 리스트
+    """
+    if not all(math.isfinite(v) for v in (a, b, c)) or min(a, b, c) <= 0:
+        return []
+    available_width = width - 2 * padding
+    available_height = height - 2 * padding
+    if available_width <= 0 or available_height <= 0:
+        return []
+
+    # 화면 크기에 맞춰 다시 확대하므로 가장 긴 변을 1로 정규화해 매우 작거나 큰 값의 언더플로/오버플로를 막음
+    longest = max(a, b, c)
+    a, b, c = a / longest, b / longest, c / longest
+
+    # 왼쪽 아래 (0, 0), 오른쪽 아래 (c, 0), 위쪽 꼭짓점은 왼쪽에서 b만큼 떨어진 점
+    numerator = b * b + c * c - a * a
+    denominator = 2 * b * c
+    if denominator > 0:
+        cos_left = max(-1.0, min(1.0, numerator / denominator))
+    else:
+        # 두 변이 가장 긴 변에 비해 0으로 반올림될 만큼 짧음: 납작한 모양으로 처리
+        cos_left = 1.0 if numerator >= 0 else -1.0
+    apex_x = b * cos_left
+    apex_y = b * math.sqrt(1.0 - cos_left * cos_left)
+
+    min_x = min(0.0, apex_x)
+    span_x = max(c, apex_x) - min_x
+    span_y = apex_y
+    if span_x <= 0:
+        return []
+    scale = available_width / span_x
+    if span_y > 0:
+        scale = min(scale, available_height / span_y)
+
+    # 영역 가운데 정렬. 화면 y축은 아래 방향이므로 위쪽 꼭짓점은 밑변보다 y가 작음
+    offset_x = padding + (available_width - span_x * scale) / 2 - min_x * scale
+    base_y = padding + (available_height + span_y * scale) / 2
+    return [
+        (offset_x, base_y),
+        (offset_x + c * scale, base_y),
+        (offset_x + apex_x * scale, base_y - apex_y * scale),
+    ]
@@ -1,16 +1,85 @@
-from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer
+from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer, QRunnable, QThreadPool, QPointF
+import contextlib
+import functools
 import logging # 로깅 모듈 임포트
+import time
+from collections import Counter
 # from models.triangle_model import TriangleModel # 더 이상 직접 사용 안 함
+from core.results import ValidationResult
+from viewmodels.triangle_geometry import triangle_vertices
 from core.triangle_validator_core import TriangleValidatorCore #, model_path as core_model_path # model_path 직접 사용 안함
 
 logger = logging.getLogger(__name__) # 모듈용 로거
 
+# 입력 중 실시간 예측을 보내기 전 대기 시간 (ms)
+LIVE_PREDICT_DEBOUNCE_MS = 150
+
+def _batched_update(method):
+    """메서드 전체를 TriangleViewModel.batch_update 블록 안에서 실행하는 데코레이터"""
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        with self.batch_update():
+            return method(self, *args)
+    return wrapper
+
+class _ValidationSignals(QObject):
+    """워커 스레드의 검증 결과를 GUI 스레드로 전달하는 시그널 묶음"""
+    finished = Signal(int, object) # request_id, validation_results
+    failed = Signal(int, str) # request_id, 오류 메시지
+
+class _ValidationTask(QRunnable):
+    """QThreadPool에서 validator.validate()를 실행하는 작업"""
+
+    def __init__(self, request_id, validator, sides, signals, is_stale):
+        super().__init__()
+        self.request_id = request_id
+        self.validator = validator
+        self.sides = sides
+        self.signals = signals
+        self.is_stale = is_stale
+
+    def run(self):
+        # 실행 시작 전에 더 새로운 요청이 들어왔다면 모델 호출 없이 종료
+        if self.is_stale(self.request_id):
+            logger.debug(f"오래된 검증 요청 건너뜀: request_id={self.request_id}")
+            return
+        try:
+            validation_results = self.validator.validate(*self.sides)
+            self.signals.finished.emit(self.request_id, validation_results)
+        except Exception as e:
+            logger.error(f"검증 작업 실패: request_id={self.request_id}: {e}", exc_info=True)
+            self.signals.failed.emit(self.request_id, str(e))
+
+class _ModelLoadSignals(QObject):
+    """백그라운드 모델 로드 완료를 GUI 스레드로 전달하는 시그널"""
+    finished = Signal(bool) # AI 검증 사용 가능 여부
+
+class _ModelLoadTask(QRunnable):
+    """QThreadPool에서 validator.load_models()를 실행하는 작업"""
+
+    def __init__(self, validator, signals):
+        super().__init__()
+        self.validator = validator
+        self.signals = signals
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            ready = self.validator.load_models()
+        except Exception as e:
+            logger.error(f"백그라운드 모델 로드 실패: {e}", exc_info=True)
+            ready = False
+        logger.info(f"백그라운드 모델 로드 종료: ready={ready}, {time.perf_counter() - started:.2f}s")
+        self.signals.finished.emit(ready)
+
 class TriangleViewModel(QObject):
     """QML과 연동하여 삼각형을 시각화하는 ViewModel 클래스"""
     # 시그널 정의
     resultChanged = Signal(str)
     canvasDataChanged = Signal()
     predictionChanged = Signal() # prediction 값 변경 시그널 추가
+    busyChanged = Signal()
+    modelStateChanged = Signal() # modelReady, isModelLoading 변경 시그널
     
     def __init__(self, validator=None):
         super().__init__()
@@ -24,6 +93,39 @@ class TriangleViewModel(QObject):
         self._result = "결과를 보려면 값을 입력하고 Check 버튼을 누르세요." # 초기 메시지 변경
         self._scale = 20.0
         self._is_possible = True # 수학적 가능 여부
+        self._is_busy = False # 검증 작업 진행 중 여부
+        self._viewport = (0.0, 0.0) # 삼각형을 그릴 QML 영역 크기 (setViewport로 전달받음)
+        self._triangle_points = [] # 화면 좌표로 변환된 꼭짓점 (QPointF 3개)
+        # 모델이 아직 로드되지 않은 validator(load_on_init=False)는 loadModelInBackground로 로드
+        # is_ready가 없는 validator는 항상 준비된 것으로 간주
+        self._model_ready = getattr(self.validator, "is_ready", True)
+        self._model_loading = False
+        self._inputs_awaiting_model = None # 모델 로드 전에 들어온 마지막 입력
+        self._model_load_signals = _ModelLoadSignals()
+        self._model_load_signals.finished.connect(self._on_model_loaded)
+        
+        # 검증은 GUI 스레드가 아닌 전용 스레드 풀에서 실행
+        # validator는 동시 호출을 가정하지 않으므로 스레드는 하나만 사용하며,
+        # 결정 지도 계산(DecisionMapViewModel)도 validation_thread_pool()로 같은 풀을 공유함
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._latest_request_id = 0
+        self._validation_signals = _ValidationSignals()
+        self._validation_signals.finished.connect(self._on_validation_finished)
+        self._validation_signals.failed.connect(self._on_validation_failed)
+        
+        # 입력 중 실시간 예측용 디바운스 타이머
+        self._pending_live_inputs = None
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(LIVE_PREDICT_DEBOUNCE_MS)
+        self._live_timer.timeout.connect(self._flush_live_predict)
+
+        # 프로퍼티 변경 알림 묶음 처리 (batch_update 참고)
+        self._update_depth = 0
+        self._pending_notifications = {} # 시그널 이름 -> 인자 (순서 유지, 마지막 인자 사용)
+        self.signal_counts = Counter() # 시그널별 누적 발생 횟수
+        self.last_update_signal_counts = {} # 마지막 논리적 업데이트(예: predict 한 번)에서 발생한 시그널
         
         logger.info("TriangleViewModel 초기화 완료")
         
@@ -34,8 +136,42 @@ class TriangleViewModel(QObject):
         """초기 캔버스 상태를 설정합니다."""
         logger.info("초기 캔버스 상태 설정")
         # 초기 prediction 값도 반영되도록 emit
-        self.predictionChanged.emit()
-        self.canvasDataChanged.emit()
+        with self.batch_update():
+            self._notify("predictionChanged")
+            self._notify("canvasDataChanged")
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        블록 안의 프로퍼티 변경 알림을 모아 블록이 끝날 때 시그널마다 한 번만 발생시킵니다.
+
+        sides, scale, is_possible이 모두 canvasDataChanged를 공유하므로, 결과 하나를 반영할 때
+        QML 바인딩 재평가와 다시 그리기가 한 번만 일어나도록 합니다. 중첩해서 사용할 수 있으며
+        가장 바깥 블록이 끝날 때 발생시킵니다.
+        """
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0:
+                self._flush_notifications()
+
+    def _notify(self, signal_name, *args):
+        """notify 시그널을 발생시킵니다. batch_update 안이면 블록이 끝날 때까지 미룹니다."""
+        if self._update_depth:
+            self._pending_notifications[signal_name] = args
+            return
+        self.signal_counts[signal_name] += 1
+        self.last_update_signal_counts = {signal_name: 1}
+        getattr(self, signal_name).emit(*args)
+
+    def _flush_notifications(self):
+        pending, self._pending_notifications = self._pending_notifications, {}
+        self.last_update_signal_counts = dict.fromkeys(pending, 1)
+        for signal_name, args in pending.items():
+            self.signal_counts[signal_name] += 1
+            getattr(self, signal_name).emit(*args)
     
     # 프로퍼티 정의
     def get_sides(self):
@@ -45,7 +181,24 @@ class TriangleViewModel(QObject):
         if self._sides != sides:
             self._sides = sides
             logger.debug(f"ViewModel sides 변경됨: {sides}")
-            self.canvasDataChanged.emit()
+            self._update_triangle_points()
+            self._notify("canvasDataChanged")
+
+    def get_triangle_points(self):
+        return self._triangle_points
+
+    @Slot(float, float)
+    def setViewport(self, width, height):
+        """삼각형을 그릴 QML 영역 크기를 전달받아 꼭짓점 좌표를 다시 계산합니다."""
+        if self._viewport != (width, height):
+            self._viewport = (width, height)
+            self._update_triangle_points()
+            self._notify("canvasDataChanged")
+
+    def _update_triangle_points(self):
+        a, b, c = self._sides
+        width, height = self._viewport
+        self._triangle_points = [QPointF(x, y) for x, y in triangle_vertices(a, b, c, width, height)]
     
     def get_prediction(self):
         return self._prediction
@@ -55,7 +208,7 @@ class TriangleViewModel(QObject):
         if self._prediction != prediction or prediction is None:
             self._prediction = prediction
             logger.debug(f"ViewModel prediction 변경됨: {prediction}")
-            self.predictionChanged.emit() # prediction 값 변경 시그널 발생
+            self._notify("predictionChanged") # prediction 값 변경 시그널 발생
             # self.canvasDataChanged.emit() # prediction은 canvas 모양에 직접 영향 안 줄 수 있음
     
     def get_result(self):
@@ -65,7 +218,7 @@ class TriangleViewModel(QObject):
         if self._result != result:
             self._result = result
             logger.info(f"ViewModel result 변경됨: {result}")
-            self.resultChanged.emit(result)
+            self._notify("resultChanged", result)
     
     def get_scale(self):
         return self._scale
@@ -74,7 +227,7 @@ class TriangleViewModel(QObject):
         if self._scale != scale:
             self._scale = scale
             logger.debug(f"ViewModel scale 변경됨: {scale}")
-            self.canvasDataChanged.emit()
+            self._notify("canvasDataChanged")
     
     def get_is_possible(self):
         return self._is_possible
@@ -83,80 +236,201 @@ class TriangleViewModel(QObject):
         if self._is_possible != is_possible:
             self._is_possible = is_possible
             logger.debug(f"ViewModel is_possible 변경됨: {is_possible}")
-            self.canvasDataChanged.emit()
+            self._notify("canvasDataChanged")
+    
+    def get_is_busy(self):
+        return self._is_busy
     
+    def set_is_busy(self, is_busy):
+        if self._is_busy != is_busy:
+            self._is_busy = is_busy
+            logger.debug(f"ViewModel is_busy 변경됨: {is_busy}")
+            self._notify("busyChanged")
+    
+    def get_model_ready(self):
+        return self._model_ready
+
+    def get_model_loading(self):
+        return self._model_loading
+
+    def _set_model_state(self, ready, loading):
+        if self._model_ready != ready or self._model_loading != loading:
+            self._model_ready = ready
+            self._model_loading = loading
+            logger.debug(f"ViewModel 모델 상태 변경됨: ready={ready}, loading={loading}")
+            self._notify("modelStateChanged")
+
     # 프로퍼티 등록
     sides = Property(list, get_sides, set_sides, notify=canvasDataChanged)
+    # 왼쪽 아래, 오른쪽 아래, 위 꼭짓점 (QML Shape에서 바로 사용). 그릴 수 없으면 빈 리스트
+    trianglePoints = Property(list, get_triangle_points, notify=canvasDataChanged)
     # prediction 프로퍼티의 notify 시그널 변경
     prediction = Property(float, get_prediction, set_prediction, notify=predictionChanged)
     result = Property(str, get_result, set_result, notify=resultChanged)
     scale = Property(float, get_scale, set_scale, notify=canvasDataChanged)
     is_possible = Property(bool, get_is_possible, set_is_possible, notify=canvasDataChanged)
+    isBusy = Property(bool, get_is_busy, notify=busyChanged)
+    modelReady = Property(bool, get_model_ready, notify=modelStateChanged)
+    isModelLoading = Property(bool, get_model_loading, notify=modelStateChanged)
+
+    @Slot()
+    def loadModelInBackground(self):
+        """
+        모델과 스케일러를 백그라운드 스레드에서 로드합니다.
+
+        이미 로드되었거나 로드 중이면 아무것도 하지 않습니다. 로드가 끝날 때까지
+        predict는 수학 검증 결과만 즉시 보여주고, 로드 후 마지막 입력을 다시 예측합니다.
+        """
+        if self._model_ready or self._model_loading:
+            return
+        self._set_model_state(False, True)
+        # 로드 작업이 검증/결정 지도 작업 뒤에 줄 서지 않도록 전역 풀에서 실행
+        QThreadPool.globalInstance().start(_ModelLoadTask(self.validator, self._model_load_signals))
+
+    @Slot(bool)
+    @_batched_update
+    def _on_model_loaded(self, ready):
+        self._set_model_state(ready, False)
+        if self._inputs_awaiting_model is not None:
+            a_str, b_str, c_str = self._inputs_awaiting_model
+            self._inputs_awaiting_model = None
+            # 성공하면 AI 결과를 채우고, 실패하면 "로딩 중" 문구를 수학 결과만 있는 최종 결과로 교체
+            self.predict(a_str, b_str, c_str)
     
     @Slot(str, str, str)
+    @_batched_update
     def predict(self, a_str, b_str, c_str):
-        """세 변의 길이를 입력받아 삼각형 가능 여부를 예측하고 결과를 업데이트합니다."""
+        """세 변의 길이를 입력받아 백그라운드에서 삼각형 가능 여부를 예측합니다.
+
+        입력 검사는 즉시 수행하고, 모델 검증은 스레드 풀에서 실행한 뒤 결과를
+        시그널로 받아 반영합니다. 새 요청이 들어오면 이전 요청의 결과는 버립니다.
+        """
+        # 새 요청이 들어오면 이전 요청은 모두 오래된(stale) 요청이 됨
+        self._latest_request_id += 1
+        request_id = self._latest_request_id
+        self._live_timer.stop()
+        # 공유 풀을 clear()하면 결정 지도 작업도 지워지므로 이전 작업은 실행될 때 오래된 요청으로 건너뜀
         try:
             logger.info(f"ViewModel predict 호출됨. 입력값: a='{a_str}', b='{b_str}', c='{c_str}'")
             a, b, c = float(a_str), float(b_str), float(c_str)
             
             if a <= 0 or b <= 0 or c <= 0:
                 logger.warning(f"잘못된 변 길이 입력: a={a}, b={b}, c={c}")
+                self.set_is_busy(False)
                 self.set_result("변의 길이는 0보다 커야 합니다.")
                 self.set_prediction(None) # 유효하지 않은 입력 시 예측값 초기화
                 self.set_is_possible(False)
                 self.set_sides([0,0,0]) # 시각화 초기화 또는 에러 상태 표시
-                self.canvasDataChanged.emit()
-                self.predictionChanged.emit() # QML 업데이트
+                self._notify("canvasDataChanged")
+                self._notify("predictionChanged") # QML 업데이트
                 return
 
-            # TriangleValidatorCore를 사용하여 검증
-            validation_results = self.validator.validate(a, b, c)
-            
-            # UI 상태 업데이트
-            self.set_sides(validation_results["sides"]) # validator가 반환한 값 사용
-            self.set_prediction(validation_results["ai_prediction_value"]) # validator가 반환한 값 사용
-            self.set_is_possible(validation_results["math_result"]) # validator가 반환한 값 사용
-            
-            # 유효한 변들이 있을 때만 스케일 계산
-            if max(validation_results["sides"]) > 0:
-                self.set_scale(100 / max(validation_results["sides"])) 
-            else:
-                self.set_scale(1) # 기본 스케일
-            
-            # 결과 텍스트 생성
-            math_result_text = "가능" if validation_results["math_result"] else "불가능"
-            
-            ai_prediction_value = validation_results["ai_prediction_value"]
-            if ai_prediction_value is None:
-                ai_result_text = "N/A"
-                ai_prob_text = "N/A"
-            else:
-                ai_result_text = "가능" if validation_results["is_valid_by_ai"] else "불가능"
-                ai_prob_text = f"{ai_prediction_value:.4f}"
-                
-            result_text = f"수학: {math_result_text}, AI: {ai_result_text} (값: {ai_prob_text})"
-            self.set_result(result_text)
-            
-            logger.info(f"ViewModel 검증 완료: sides={validation_results['sides']}, ai_pred={ai_prediction_value}, math_result={validation_results['math_result']}")
-            
-            # UI 업데이트 요청 (canvasDataChanged는 sides, scale, is_possible 변경 시 이미 발생)
-            # predictionChanged는 set_prediction에서 이미 발생
-            # resultChanged는 set_result에서 이미 발생
-            # QTimer.singleShot(100, self.canvasDataChanged.emit) # 중복 호출일 수 있으므로 필요성 검토
+            if not self._model_ready:
+                # 모델 로드 전(또는 로드 실패 시)에는 수학 검증 결과만 바로 보여줌
+                self.set_is_busy(False)
+                if self._model_loading:
+                    self._inputs_awaiting_model = (a_str, b_str, c_str)
+                self._apply_validation_results(self._math_only_results(a, b, c))
+                return
+
+            # TriangleValidatorCore 검증은 워커 스레드에서 수행
+            self.set_is_busy(True)
+            task = _ValidationTask(request_id, self.validator, (a, b, c),
+                                   self._validation_signals, self._is_stale_request)
+            self._thread_pool.start(task)
             
         except ValueError:
             logger.warning(f"잘못된 숫자 형식 입력: a='{a_str}', b='{b_str}', c='{c_str}'", exc_info=True)
+            self.set_is_busy(False)
             self.set_result("올바른 숫자를 입력하세요.")
             self.set_prediction(None) # 오류 시 예측값 초기화
             self.set_is_possible(False)
-            self.predictionChanged.emit() # QML 업데이트
+            self._notify("predictionChanged") # QML 업데이트
         except Exception as e:
             logger.error(f"ViewModel predict 슬롯 오류: {e}", exc_info=True)
-            self.set_result(f"오류: {e}")
-            self.set_prediction(None) # 오류 시 예측값 초기화
-            self.set_is_possible(False)
-            self.predictionChanged.emit() # QML 업데이트
+            self._show_error(e)
+
+    @Slot(str, str, str)
+    def predictLive(self, a_str, b_str, c_str):
+        """입력 중 호출되며, 마지막 입력 후 LIVE_PREDICT_DEBOUNCE_MS가 지나면 predict를 실행합니다."""
+        self._pending_live_inputs = (a_str, b_str, c_str)
+        self._live_timer.start() # 이미 대기 중이면 타이머를 다시 시작
+
+    def _flush_live_predict(self):
+        if self._pending_live_inputs is None:
+            return
+        a_str, b_str, c_str = self._pending_live_inputs
+        self._pending_live_inputs = None
+        self.predict(a_str, b_str, c_str)
+
+    def validation_thread_pool(self):
+        """validator를 호출하는 단일 스레드 풀 (다른 ViewModel이 validator 작업을 넣을 때 공유)"""
+        return self._thread_pool
+
+    def _is_stale_request(self, request_id):
+        # 워커 스레드에서 호출됨: int 비교만 수행
+        return request_id != self._latest_request_id
+
+    @Slot(int, object)
+    @_batched_update
+    def _on_validation_finished(self, request_id, validation_results):
+        """워커 스레드의 검증 결과를 GUI 스레드에서 반영합니다."""
+        if self._is_stale_request(request_id):
+            logger.debug(f"오래된 검증 결과 무시: request_id={request_id}")
+            return
+        try:
+            self._apply_validation_results(validation_results)
+        except Exception as e:
+            logger.error(f"ViewModel 결과 반영 오류: {e}", exc_info=True)
+            self._show_error(e)
+        finally:
+            self.set_is_busy(False)
+
+    @Slot(int, str)
+    @_batched_update
+    def _on_validation_failed(self, request_id, message):
+        if self._is_stale_request(request_id):
+            return
+        self._show_error(message)
+        self.set_is_busy(False)
+
+    def _math_only_results(self, a, b, c):
+        """AI 예측 없이 수학 검증만 수행한 validate() 형태의 결과"""
+        return ValidationResult((a, b, c), self.validator.validate_by_math(a, b, c))
+
+    def _apply_validation_results(self, validation_results):
+        """검증 결과로 UI 상태를 업데이트합니다."""
+        self.set_sides(list(validation_results["sides"])) # validator가 반환한 값 사용 (QML에는 리스트로 전달)
+        self.set_prediction(validation_results["ai_prediction_value"]) # validator가 반환한 값 사용
+        self.set_is_possible(validation_results["math_result"]) # validator가 반환한 값 사용
+        
+        # 유효한 변들이 있을 때만 스케일 계산
+        if max(validation_results["sides"]) > 0:
+            self.set_scale(100 / max(validation_results["sides"])) 
+        else:
+            self.set_scale(1) # 기본 스케일
+        
+        # 결과 텍스트 생성
+        math_result_text = "가능" if validation_results["math_result"] else "불가능"
+        
+        ai_prediction_value = validation_results["ai_prediction_value"]
+        if ai_prediction_value is None:
+            ai_result_text = "로딩 중" if self._model_loading else "N/A"
+            ai_prob_text = "N/A"
+        else:
+            ai_result_text = "가능" if validation_results["is_valid_by_ai"] else "불가능"
+            ai_prob_text = f"{ai_prediction_value:.4f}"
+            
+        result_text = f"수학: {math_result_text}, AI: {ai_result_text} (값: {ai_prob_text})"
+        self.set_result(result_text)
+        
+        logger.info(f"ViewModel 검증 완료: sides={validation_results['sides']}, ai_pred={ai_prediction_value}, math_result={validation_results['math_result']}")
+
+    def _show_error(self, error):
+        self.set_result(f"오류: {error}")
+        self.set_prediction(None) # 오류 시 예측값 초기화
+        self.set_is_possible(False)
+        self._notify("predictionChanged") # QML 업데이트
 
     # ViewModel 내의 중복 validate 메소드 제거
     # def validate(self, a, b, c):
@@ -0,0 +1,76 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+import QtQuick.Layouts 1.15
+import QtQuick.Window 2.15
+
+// 결정 지도 창: c를 고정한 (a, b) 평면의 AI 예측값과 수학 판정과의 불일치를 표시
+Window {
+    id: mapWindow
+    width: 420
+    height: 560
+    visible: true
+    title: "Decision Map"
+    color: "#FFFFFF"
+
+    // 창을 닫으면 진행 중인 계산도 중단
+    onClosing: decisionMap.cancel()
+    Component.onCompleted: decisionMap.show(decisionMap.fixedSide)
+
+    ColumnLayout {
+        anchors.fill: parent
+        anchors.margins: 16
+        spacing: 10
+
+        Text {
+            text: "c = " + decisionMap.fixedSide.toFixed(1) + "  (x: a, y: b)"
+            font.pixelSize: 16
+            font.bold: true
+        }
+
+        Image {
+            id: mapImage
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            // imageSource가 바뀔 때마다 프로바이더에서 최신 중간 결과를 다시 읽음
+            source: decisionMap.imageSource
+            cache: false
+            smooth: false // 성긴 단계의 블록을 보간하지 않고 그대로 표시
+            fillMode: Image.PreserveAspectFit
+        }
+
+        Text {
+            // 파랑: AI 불가능, 빨강: AI 가능, 노랑: 수학 판정과 다름
+            text: "blue = NG, red = OK, yellow = AI disagrees with math"
+            font.pixelSize: 12
+            color: "#555555"
+        }
+
+        Text {
+            text: (decisionMap.isBusy ? "Computing " : "Done ") + Math.round(decisionMap.progress * 100) + "%"
+                  + " · disagreement " + (decisionMap.disagreementRate * 100).toFixed(2) + "%"
+            font.pixelSize: 14
+        }
+
+        RowLayout {
+            Layout.fillWidth: true
+
+            Slider {
+                id: fixedSideSlider
+                Layout.fillWidth: true
+                from: 1
+                to: 99
+                stepSize: 1
+                value: decisionMap.fixedSide
+                live: false
+                // 놓았을 때만 새 단면 계산
+                onPressedChanged: if (!pressed) decisionMap.show(value)
+            }
+
+            Button {
+                text: "Stop"
+                enabled: decisionMap.isBusy
+                onClicked: decisionMap.cancel()
+            }
+        }
+    }
+}
@@ -2,6 +2,7 @@ import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
 import QtQuick.Window 2.15
+import QtQuick.Shapes 1.15
 
 ApplicationWindow {
     id: appWindow
@@ -47,42 +48,19 @@ ApplicationWindow {
                     width: 30
                     height: 30
                     
-                    Canvas {
-                        id: triangleCanvas
+                    // 고정 도형이므로 JS Canvas 대신 Shape(씬 그래프 지오메트리)로 그림
+                    Shape {
                         anchors.fill: parent
-                        onPaint: {
-                            var ctx = getContext("2d");
-                            
-                            // 삼각형 좌표
-                            var topX = width/2;
-                            var topY = 0;
-                            var leftX = 0;
-                            var leftY = height;
-                            var rightX = width;
-                            var rightY = height;
-                            
-                            // 검은색 테두리 그리기
-                            ctx.lineWidth = 3;
-                            ctx.strokeStyle = "black";
-                            ctx.fillStyle = "red";
-                            
-                            ctx.beginPath();
-                            
-                            // 상단 꼭지점에서 시작
-                            ctx.moveTo(topX, topY);
-                            
-                            // 우측 하단으로 선 그리기
-                            ctx.lineTo(rightX, rightY);
-                            
-                            // 좌측 하단으로 선 그리기
-                            ctx.lineTo(leftX, leftY);
-                            
-                            // 상단 꼭지점으로 선 그리기
-                            ctx.lineTo(topX, topY);
-                            
-                            ctx.closePath();
-                            ctx.fill();
-                            ctx.stroke();
+
+                        ShapePath {
+                            strokeWidth: 3
+                            strokeColor: "black"
+                            fillColor: "red"
+                            joinStyle: ShapePath.RoundJoin
+                            startX: 15; startY: 0
+                            PathLine { x: 30; y: 30 }
+                            PathLine { x: 0; y: 30 }
+                            PathLine { x: 15; y: 0 }
                         }
                     }
                 }
@@ -95,39 +73,67 @@ ApplicationWindow {
             Layout.fillHeight: true
             Layout.minimumHeight: 300
 
-            // 첫 번째 변 (파란색 선)
-            Rectangle {
-                width: 150
-                height: 3
-                color: "#6AABFF"  // 파란색
-                rotation: -55
-                anchors.left: parent.left
-                anchors.leftMargin: 20
-                anchors.top: parent.top
-                anchors.topMargin: 120
-            }
+            // 삼각형 (꼭짓점 좌표는 ViewModel이 세 변과 영역 크기로 계산)
+            Shape {
+                id: triangleShape
+                anchors.fill: parent
+                anchors.topMargin: 80 // 위쪽 입력 필드 아래
+                anchors.bottomMargin: 60 // 아래쪽 입력 필드 위
+                // 리스트 변환은 바인딩마다 일어나므로 한 번만 읽어 둠
+                readonly property var points: triangleVisualizer.trianglePoints
+                readonly property bool drawable: points.length === 3
+                // 삼각형이 될 수 없는 길이는 점선으로 표시
+                readonly property int strokeStyle: triangleVisualizer.is_possible ? ShapePath.SolidLine : ShapePath.DashLine
+                visible: drawable
 
-            // 두 번째 변 (청록색 선)
-            Rectangle {
-                width: 150
-                height: 3
-                color: "#55FFF1"  // 청록색
-                rotation: 50
-                anchors.right: parent.right
-                anchors.rightMargin: 20
-                anchors.top: parent.top
-                anchors.topMargin: 120
-            }
+                onWidthChanged: triangleVisualizer.setViewport(width, height)
+                onHeightChanged: triangleVisualizer.setViewport(width, height)
+                Component.onCompleted: triangleVisualizer.setViewport(width, height)
 
-            // 세 번째 변 (노란색 선)
-            Rectangle {
-                width: 150
-                height: 3
-                color: "#FFCB21"  // 노란색
-                rotation: -5
-                anchors.horizontalCenter: parent.horizontalCenter
-                anchors.top: parent.top
-                anchors.topMargin: 200
+                // 첫 번째 변 a: 오른쪽 아래 -> 위 (파란색)
+                ShapePath {
+                    strokeWidth: 3
+                    strokeColor: "#6AABFF"
+                    strokeStyle: triangleShape.strokeStyle
+                    fillColor: "transparent"
+                    capStyle: ShapePath.RoundCap
+                    startX: triangleShape.drawable ? triangleShape.points[1].x : 0
+                    startY: triangleShape.drawable ? triangleShape.points[1].y : 0
+                    PathLine {
+                        x: triangleShape.drawable ? triangleShape.points[2].x : 0
+                        y: triangleShape.drawable ? triangleShape.points[2].y : 0
+                    }
+                }
+
+                // 두 번째 변 b: 왼쪽 아래 -> 위 (청록색)
+                ShapePath {
+                    strokeWidth: 3
+                    strokeColor: "#55FFF1"
+                    strokeStyle: triangleShape.strokeStyle
+                    fillColor: "transparent"
+                    capStyle: ShapePath.RoundCap
+                    startX: triangleShape.drawable ? triangleShape.points[0].x : 0
+                    startY: triangleShape.drawable ? triangleShape.points[0].y : 0
+                    PathLine {
+                        x: triangleShape.drawable ? triangleShape.points[2].x : 0
+                        y: triangleShape.drawable ? triangleShape.points[2].y : 0
+                    }
+                }
+
+                // 세 번째 변 c: 밑변 (노란색)
+                ShapePath {
+                    strokeWidth: 3
+                    strokeColor: "#FFCB21"
+                    strokeStyle: triangleShape.strokeStyle
+                    fillColor: "transparent"
+                    capStyle: ShapePath.RoundCap
+                    startX: triangleShape.drawable ? triangleShape.points[0].x : 0
+                    startY: triangleShape.drawable ? triangleShape.points[0].y : 0
+                    PathLine {
+                        x: triangleShape.drawable ? triangleShape.points[1].x : 0
+                        y: triangleShape.drawable ? triangleShape.points[1].y : 0
+                    }
+                }
             }
 
             // 첫 번째 입력 필드
@@ -154,6 +160,8 @@ ApplicationWindow {
                     font.bold: true
                     font.weight: Font.ExtraBold
                     inputMethodHints: Qt.ImhDigitsOnly
+                    // 입력 중 실시간 예측 (ViewModel에서 디바운스)
+                    onTextChanged: triangleVisualizer.predictLive(input1.text, input2.text, input3.text)
                 }
             }
 
@@ -181,6 +189,8 @@ ApplicationWindow {
                     font.bold: true
                     font.weight: Font.ExtraBold
                     inputMethodHints: Qt.ImhDigitsOnly
+                    // 입력 중 실시간 예측 (ViewModel에서 디바운스)
+                    onTextChanged: triangleVisualizer.predictLive(input1.text, input2.text, input3.text)
                 }
             }
 
@@ -193,8 +203,8 @@ ApplicationWindow {
                 border.color: "#E0E0E0"
                 border.width: 1
                 anchors.horizontalCenter: parent.horizontalCenter
-                anchors.top: parent.top
-                anchors.topMargin: 220
+                anchors.bottom: parent.bottom // 밑변(c) 아래
+                anchors.bottomMargin: 10
 
                 TextInput {
                     id: input3
@@ -207,6 +217,8 @@ ApplicationWindow {
                     font.bold: true
                     font.weight: Font.ExtraBold
                     inputMethodHints: Qt.ImhDigitsOnly
+                    // 입력 중 실시간 예측 (ViewModel에서 디바운스)
+                    onTextChanged: triangleVisualizer.predictLive(input1.text, input2.text, input3.text)
                 }
             }
         }
@@ -233,11 +245,14 @@ ApplicationWindow {
             Layout.bottomMargin: 5 // 버튼과의 간격
             font.pixelSize: 20
             font.bold: true
+            // 백그라운드 검증 중에는 이전 결과를 흐리게 표시
+            opacity: triangleVisualizer.isBusy ? 0.4 : 1.0
             // triangleVisualizer.prediction 값이 0.0에서 1.0 사이의 float이라고 가정
             // ViewModel에 prediction Property가 있어야 함
             text: {
                 if (typeof triangleVisualizer.prediction === 'undefined' || triangleVisualizer.prediction === null) {
-                    "---"; // 초기값
+                    // 백그라운드 모델 로드 중에는 수학 결과만 반영되므로 로딩 상태 표시
+                    triangleVisualizer.isModelLoading ? "AI 로딩 중..." : "---";
                 } else if (triangleVisualizer.prediction >= 0.5) {
                     "OK";
                 } else {
@@ -282,6 +297,39 @@ ApplicationWindow {
                 }
             }
         }
+
+        // 결정 지도 창 열기
+        Text {
+            Layout.alignment: Qt.AlignHCenter
+            Layout.topMargin: -70
+            text: "Decision map"
+            font.pixelSize: 14
+            font.underline: true
+            color: "#6750A4"
+            visible: typeof decisionMap !== "undefined"
+
+            MouseArea {
+                anchors.fill: parent
+                onClicked: {
+                    if (decisionMapLoader.active) {
+                        decisionMapLoader.item.raise()
+                    } else {
+                        decisionMapLoader.active = true
+                    }
+                }
+            }
+        }
+    }
+
+    Loader {
+        id: decisionMapLoader
+        active: false
+        source: "decision_map_view.qml"
+        // 창을 닫으면 Loader를 비활성화해 다음에 새로 열 수 있도록 함
+        Connections {
+            target: decisionMapLoader.item
+            function onClosing() { decisionMapLoader.active = false }
+        }
     }
 
     // 결과 변경 연결